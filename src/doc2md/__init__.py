@@ -1,5 +1,20 @@
 """doc2md — Agentic document-to-markdown converter."""
 
-from doc2md.core import Doc2Md, convert, convert_batch
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from doc2md.core import Doc2Md, convert, convert_batch
 
 __all__ = ["Doc2Md", "convert", "convert_batch"]
+
+
+def __getattr__(name: str) -> Any:
+    # The converter pulls in the VLM client, PDF and image stacks; load it on
+    # first use so submodules such as the CLI import without it
+    if name in __all__:
+        from doc2md import core
+
+        return getattr(core, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
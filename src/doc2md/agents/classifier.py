@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import functools
 import json
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, Field
 
@@ -22,6 +25,10 @@ _CLASSIFIER_MAX_TOKENS = 256
 _CLASSIFIER_TEMPERATURE = 0.0
 _FALLBACK_PIPELINE = "generic"
 _CONFIDENCE_THRESHOLD = 0.7
+_BATCH_MAX_SIZE = 16
+_BATCH_WINDOW_SECONDS = 0.05
+
+_DECODER = json.JSONDecoder()
 
 
 class ClassificationResult(BaseModel):
@@ -43,7 +50,7 @@ async def classify_document(
     pipeline registry descriptions.
     """
     system_prompt = _build_classification_prompt(pipeline_registry)
-    image_b64 = image_to_base64(page1_image)
+    image_b64 = await asyncio.to_thread(image_to_base64, page1_image)
 
     try:
         response = await vlm_client.send_request(
@@ -63,6 +70,186 @@ async def classify_document(
             reasoning=f"Classification failed: {e}",
         )
 
+    return _finalize_classification(result, blackboard)
+
+
+async def classify_documents(
+    page1_images: list[bytes],
+    pipeline_registry: PipelineRegistry,
+    vlm_client: AsyncVLMClient,
+    blackboards: list[Blackboard | None] | None = None,
+) -> list[ClassificationResult]:
+    """Classify several documents with a single multi-image VLM call.
+
+    Results are returned in input order. If the batched response cannot be
+    matched back to every document, each one is classified individually.
+    """
+    if blackboards is None:
+        blackboards = [None] * len(page1_images)
+    if not page1_images:
+        return []
+    if len(page1_images) == 1:
+        return [
+            await classify_document(
+                page1_images[0], pipeline_registry, vlm_client, blackboard=blackboards[0]
+            )
+        ]
+
+    count = len(page1_images)
+    system_prompt = _build_batch_classification_prompt(pipeline_registry, count)
+    results: list[ClassificationResult] | None = None
+
+    images_b64 = await asyncio.to_thread(lambda: [image_to_base64(img) for img in page1_images])
+
+    try:
+        response = await vlm_client.send_batch_request(
+            model=_CLASSIFIER_MODEL,
+            system_prompt=system_prompt,
+            user_prompt=f"Classify each of these {count} documents. Respond with JSON only.",
+            images_b64=images_b64,
+            max_tokens=_CLASSIFIER_MAX_TOKENS * count,
+            temperature=_CLASSIFIER_TEMPERATURE,
+        )
+        results = _parse_batch_classification(response.content, pipeline_registry, count)
+    except Exception as e:
+        logger.warning("Batch classification failed: %s. Classifying individually.", e)
+
+    if results is None:
+        return list(
+            await asyncio.gather(
+                *[
+                    classify_document(img, pipeline_registry, vlm_client, blackboard=bb)
+                    for img, bb in zip(page1_images, blackboards, strict=True)
+                ]
+            )
+        )
+
+    return [
+        _finalize_classification(result, bb)
+        for result, bb in zip(results, blackboards, strict=True)
+    ]
+
+
+class ClassifierBatcher:
+    """Coalesce concurrent classification requests into batched VLM calls.
+
+    Requests queue up until ``max_batch_size`` are pending or
+    ``window_seconds`` has elapsed since the first one, then the batch is
+    dispatched through :func:`classify_documents` and each caller's future
+    is resolved with its own result.
+    """
+
+    def __init__(
+        self,
+        pipeline_registry: PipelineRegistry,
+        vlm_client: AsyncVLMClient,
+        max_batch_size: int = _BATCH_MAX_SIZE,
+        window_seconds: float = _BATCH_WINDOW_SECONDS,
+    ) -> None:
+        self._registry = pipeline_registry
+        self._vlm = vlm_client
+        self._max_batch_size = max_batch_size
+        self._window_seconds = window_seconds
+        self._queue: asyncio.Queue[
+            tuple[bytes, Blackboard | None, asyncio.Future[ClassificationResult]]
+        ] = asyncio.Queue()
+        self._worker: asyncio.Task[None] | None = None
+        # Requests the worker has taken off the queue but not yet dispatched
+        self._collecting: list[
+            tuple[bytes, Blackboard | None, asyncio.Future[ClassificationResult]]
+        ] = []
+        self._inflight: set[asyncio.Task[None]] = set()
+
+    async def classify(
+        self,
+        page1_image: bytes,
+        blackboard: Blackboard | None = None,
+    ) -> ClassificationResult:
+        """Queue a document for classification and wait for its result."""
+        future: asyncio.Future[ClassificationResult] = asyncio.get_running_loop().create_future()
+        await self._queue.put((page1_image, blackboard, future))
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+        return await future
+
+    async def close(self) -> None:
+        """Stop the background dispatcher, then flush and wait for every pending request.
+
+        Requests still queued or mid-collection are dispatched rather than
+        dropped, so no caller is left waiting on an unresolved future.
+        """
+        if self._worker is not None:
+            self._worker.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._worker
+            self._worker = None
+
+        pending = self._collecting
+        self._collecting = []
+        while not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        for start in range(0, len(pending), self._max_batch_size):
+            self._start_dispatch(pending[start : start + self._max_batch_size])
+
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = self._collecting
+            batch.append(await self._queue.get())
+            deadline = loop.time() + self._window_seconds
+            while len(batch) < self._max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                # asyncio.timeout rather than wait_for: on 3.11, wait_for can
+                # swallow a cancel that races a completed get, and close()
+                # relies on cancelling this loop
+                try:
+                    async with asyncio.timeout(timeout):
+                        batch.append(await self._queue.get())
+                except TimeoutError:
+                    break
+            self._collecting = []
+            self._start_dispatch(batch)
+
+    def _start_dispatch(
+        self,
+        batch: list[tuple[bytes, Blackboard | None, asyncio.Future[ClassificationResult]]],
+    ) -> None:
+        # Dispatch without blocking so the next batch can start filling
+        task = asyncio.create_task(self._dispatch(batch))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    async def _dispatch(
+        self,
+        batch: list[tuple[bytes, Blackboard | None, asyncio.Future[ClassificationResult]]],
+    ) -> None:
+        try:
+            results = await classify_documents(
+                [img for img, _, _ in batch],
+                self._registry,
+                self._vlm,
+                blackboards=[bb for _, bb, _ in batch],
+            )
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, _, future), result in zip(batch, results, strict=True):
+            if not future.done():
+                future.set_result(result)
+
+
+def _finalize_classification(
+    result: ClassificationResult,
+    blackboard: Blackboard | None,
+) -> ClassificationResult:
+    """Apply the low-confidence fallback and record content types."""
     # Fallback on low confidence
     if result.confidence < _CONFIDENCE_THRESHOLD:
         logger.info(
@@ -84,16 +271,51 @@ async def classify_document(
     return result
 
 
-def _build_classification_prompt(pipeline_registry: PipelineRegistry) -> str:
-    """Build the system prompt dynamically from available pipelines."""
-    pipelines_desc = []
-    for info in pipeline_registry.list_pipelines():
-        pipelines_desc.append(f'- "{info.name}": {info.description}')
+@functools.lru_cache(maxsize=8)
+def _format_pipeline_list(pipelines: tuple[tuple[str, str], ...]) -> str:
+    pipelines_desc = [f'- "{name}": {description}' for name, description in pipelines]
 
-    pipeline_list = (
+    return (
         "\n".join(pipelines_desc) if pipelines_desc else '- "generic": General-purpose extraction'
     )
 
+
+def _build_batch_classification_prompt(pipeline_registry: PipelineRegistry, count: int) -> str:
+    """Build the system prompt for classifying several documents at once."""
+    pipeline_list = _format_pipeline_list(pipeline_registry.fingerprint())
+
+    return f"""You are a document classifier. You are given the first page of {count} different documents, one image per document, in order. Classify each document independently into the best matching pipeline type.
+
+Available pipelines:
+{pipeline_list}
+
+Respond with a JSON array only (no markdown fences), containing exactly {count} objects in the same order as the images:
+[
+  {{
+    "pipeline_name": "<name>",
+    "confidence": <0.0 to 1.0>,
+    "reasoning": "<brief explanation>",
+    "content_types_detected": ["<type1>", "<type2>"]
+  }}
+]
+
+Content types include: prose, tables, handwriting, forms, signatures, headers, footers, images, equations.
+Be conservative with confidence — only use > 0.8 when very certain."""
+
+
+def _build_classification_prompt(pipeline_registry: PipelineRegistry) -> str:
+    """Build the system prompt dynamically from available pipelines.
+
+    Memoized on the registry fingerprint, so the prompt is only rebuilt
+    when the set of pipelines changes.
+    """
+    return _build_classification_prompt_cached(pipeline_registry.fingerprint())
+
+
+@functools.lru_cache(maxsize=8)
+def _build_classification_prompt_cached(pipelines: tuple[tuple[str, str], ...]) -> str:
+    pipeline_list = _format_pipeline_list(pipelines)
+
     return f"""You are a document classifier. Given the first page of a document, classify it into the best matching pipeline type.
 
 Available pipelines:
@@ -116,24 +338,63 @@ def _parse_classification(
     pipeline_registry: PipelineRegistry,
 ) -> ClassificationResult:
     """Parse the VLM classification response."""
-    text = raw_text.strip()
-    # Strip markdown fences if present
-    if text.startswith("```"):
-        text = text.split("\n", 1)[-1]
-    if text.endswith("```"):
-        text = text.rsplit("```", 1)[0]
-    text = text.strip()
-
-    try:
-        data = json.loads(text)
-    except json.JSONDecodeError:
-        logger.warning("Could not parse classification JSON: %s", text[:200])
+    data = _decode_json(raw_text, "{")
+    if data is None:
+        logger.warning("Could not parse classification JSON: %s", raw_text.strip()[:200])
         return ClassificationResult(
             pipeline_name=_FALLBACK_PIPELINE,
             confidence=0.0,
             reasoning="Failed to parse classification response",
         )
 
+    return _classification_from_data(data, pipeline_registry)
+
+
+def _parse_batch_classification(
+    raw_text: str,
+    pipeline_registry: PipelineRegistry,
+    count: int,
+) -> list[ClassificationResult] | None:
+    """Parse a batched classification response.
+
+    Returns None unless the response is a JSON array of exactly ``count``
+    objects, so the caller can fall back to per-document classification.
+    """
+    data = _decode_json(raw_text, "[")
+    if data is None:
+        logger.warning("Could not parse batch classification JSON: %s", raw_text.strip()[:200])
+        return None
+
+    if not isinstance(data, list) or len(data) != count:
+        logger.warning("Batch classification did not return %d results", count)
+        return None
+    if not all(isinstance(item, dict) for item in data):
+        logger.warning("Batch classification results are not all JSON objects")
+        return None
+
+    return [_classification_from_data(item, pipeline_registry) for item in data]
+
+
+def _decode_json(raw_text: str, opener: str) -> Any:
+    """Decode the first JSON value starting at ``opener`` in the text.
+
+    Surrounding markdown fences or prose are skipped by the decoder itself
+    rather than stripped up front. Returns None if nothing decodes.
+    """
+    start = raw_text.find(opener)
+    if start < 0:
+        return None
+    try:
+        data, _ = _DECODER.raw_decode(raw_text, start)
+    except ValueError:
+        return None
+    return data
+
+
+def _classification_from_data(
+    data: dict[str, Any],
+    pipeline_registry: PipelineRegistry,
+) -> ClassificationResult:
     pipeline_name = data.get("pipeline_name", _FALLBACK_PIPELINE)
 
     # Validate pipeline exists
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
 from typing import TYPE_CHECKING, Any
 
@@ -26,6 +28,10 @@ class AgentEngine:
 
     def __init__(self, vlm_client: AsyncVLMClient) -> None:
         self._vlm = vlm_client
+        # Encodings and hashes for this engine's conversion, so a page seen
+        # by several agents is processed once. Dropped with the engine.
+        self._encoded_images: dict[bytes, asyncio.Task[str]] = {}
+        self._image_hashes: dict[bytes, str] = {}
 
     async def execute(
         self,
@@ -59,16 +65,25 @@ class AgentEngine:
         # Read subscribed blackboard regions for prompt context
         bb_context = self._read_blackboard(agent_config, blackboard, resolved_step)
 
-        image_b64 = self._resolve_image(agent_config.input, image_bytes)
+        # Encode off the event loop, overlapping with prompt rendering and
+        # cache lookup; the result is only awaited on a cache miss. Clients
+        # that accept raw bytes skip the encode entirely.
+        binary_upload = bool(self._vlm.supports_binary_images)
+        image_task = (
+            None if binary_upload else self._start_image_encode(agent_config.input, image_bytes)
+        )
         system_prompt, user_prompt = build_prompt(
             agent_config,
-            image_b64=image_b64,
             previous_output=previous_output,
             blackboard_context=bb_context,
         )
 
-        # Check cache before VLM call
-        cached_result = self._check_cache(
+        # Hash subscribed regions now: this agent's own writes must not leak
+        # into the key it stores under
+        bb_hash = self._hash_blackboard(agent_config, blackboard, cache_manager)
+
+        # Check cache before VLM call; the same key is reused to store the result
+        cache_key = self._compute_cache_key(
             cache_manager,
             image_bytes,
             pipeline_name,
@@ -76,9 +91,12 @@ class AgentEngine:
             agent_config,
             system_prompt,
             user_prompt,
-            bb_context,
+            bb_hash,
         )
+        cached_result = self._check_cache(cache_manager, cache_key, resolved_step, agent_config)
         if cached_result is not None:
+            # The encode task is shared with later agents on this page, so it
+            # is left to finish rather than cancelled
             logger.info("Cache hit for step '%s' agent '%s'", resolved_step, agent_config.name)
             # Re-apply blackboard writes from cached result
             if blackboard and cached_result.blackboard_writes:
@@ -87,14 +105,18 @@ class AgentEngine:
                 )
             return cached_result
 
+        image_kwargs: dict[str, Any] = {"image_b64": await image_task if image_task else None}
+        if binary_upload and self._needs_image(agent_config.input):
+            image_kwargs["image_bytes"] = image_bytes
+
         logger.info("Calling VLM '%s' for step '%s'", agent_config.model.preferred, resolved_step)
         vlm_response = await self._vlm.send_request(
             model=agent_config.model.preferred,
             system_prompt=system_prompt,
             user_prompt=user_prompt,
-            image_b64=image_b64,
             max_tokens=agent_config.model.max_tokens,
             temperature=agent_config.model.temperature,
+            **image_kwargs,
         )
 
         markdown, metadata = parse_response(vlm_response.content)
@@ -133,21 +155,13 @@ class AgentEngine:
 
         # Store in cache
         self._store_in_cache(
-            cache_manager,
-            result,
-            image_bytes,
-            pipeline_name,
-            resolved_step,
-            agent_config,
-            system_prompt,
-            user_prompt,
-            bb_context,
+            cache_manager, cache_key, result, pipeline_name, resolved_step, agent_config
         )
 
         return result
 
-    @staticmethod
-    def _check_cache(
+    def _compute_cache_key(
+        self,
         cache_manager: CacheManager | None,
         image_bytes: bytes | None,
         pipeline_name: str,
@@ -155,28 +169,41 @@ class AgentEngine:
         agent_config: AgentConfig,
         system_prompt: str,
         user_prompt: str,
-        bb_context: dict[str, Any] | None,
-    ) -> StepResult | None:
-        """Check cache for a previous result. Returns StepResult on hit, None on miss."""
+        bb_hash: str | None,
+    ) -> str | None:
+        """Compute the cache key for this run, or None when caching is off."""
         if not cache_manager or not cache_manager.enabled:
             return None
 
         from doc2md.cache.keys import generate_cache_key, hash_image, hash_prompt
 
-        image_hash = hash_image(image_bytes) if image_bytes else ""
-        prompt_h = hash_prompt(system_prompt, user_prompt)
+        image_hash = ""
+        if image_bytes:
+            image_hash = self._image_hashes.get(image_bytes) or hash_image(image_bytes)
+            self._image_hashes[image_bytes] = image_hash
 
-        key = generate_cache_key(
+        return generate_cache_key(
             image_hash=image_hash,
             pipeline_name=pipeline_name,
             step_name=step_name,
             agent_name=agent_config.name,
             agent_version=agent_config.version,
             model_id=agent_config.model.preferred,
-            prompt_hash=prompt_h,
-            blackboard_snapshot=bb_context,
+            prompt_hash=hash_prompt(system_prompt, user_prompt),
+            blackboard_hash=bb_hash,
         )
 
+    @staticmethod
+    def _check_cache(
+        cache_manager: CacheManager | None,
+        key: str | None,
+        step_name: str,
+        agent_config: AgentConfig,
+    ) -> StepResult | None:
+        """Check cache for a previous result. Returns StepResult on hit, None on miss."""
+        if key is None or not cache_manager:
+            return None
+
         entry = cache_manager.lookup(key)
         if entry is None:
             return None
@@ -195,36 +222,18 @@ class AgentEngine:
     @staticmethod
     def _store_in_cache(
         cache_manager: CacheManager | None,
+        key: str | None,
         result: StepResult,
-        image_bytes: bytes | None,
         pipeline_name: str,
         step_name: str,
         agent_config: AgentConfig,
-        system_prompt: str,
-        user_prompt: str,
-        bb_context: dict[str, Any] | None,
     ) -> None:
         """Store a VLM result in the cache."""
-        if not cache_manager or not cache_manager.enabled:
+        if key is None or not cache_manager:
             return
 
-        from doc2md.cache.keys import generate_cache_key, hash_image, hash_prompt
         from doc2md.cache.stats import CacheEntry
 
-        image_hash = hash_image(image_bytes) if image_bytes else ""
-        prompt_h = hash_prompt(system_prompt, user_prompt)
-
-        key = generate_cache_key(
-            image_hash=image_hash,
-            pipeline_name=pipeline_name,
-            step_name=step_name,
-            agent_name=agent_config.name,
-            agent_version=agent_config.version,
-            model_id=agent_config.model.preferred,
-            prompt_hash=prompt_h,
-            blackboard_snapshot=bb_context,
-        )
-
         entry = CacheEntry(
             key=key,
             pipeline_name=pipeline_name,
@@ -239,16 +248,24 @@ class AgentEngine:
         )
         cache_manager.store(key, entry)
 
+    def _start_image_encode(
+        self, input_mode: InputMode, image_bytes: bytes | None
+    ) -> asyncio.Task[str] | None:
+        """Start base64-encoding the image in a worker thread if the input mode needs it."""
+        if not (self._needs_image(input_mode) and image_bytes):
+            return None
+        task = self._encoded_images.get(image_bytes)
+        if task is None:
+            task = asyncio.create_task(asyncio.to_thread(image_to_base64, image_bytes))
+            self._encoded_images[image_bytes] = task
+        return task
+
     @staticmethod
-    def _resolve_image(input_mode: InputMode, image_bytes: bytes | None) -> str | None:
-        """Return base64 image if the input mode requires an image."""
-        needs_image = input_mode in (
+    def _needs_image(input_mode: InputMode) -> bool:
+        return input_mode in (
             InputMode.IMAGE,
             InputMode.IMAGE_AND_PREVIOUS,
         )
-        if needs_image and image_bytes:
-            return image_to_base64(image_bytes)
-        return None
 
     @staticmethod
     def _read_blackboard(
@@ -261,6 +278,24 @@ class AgentEngine:
             return None
         return blackboard.to_jinja_context(agent_config.blackboard.reads)
 
+    @staticmethod
+    def _hash_blackboard(
+        agent_config: AgentConfig,
+        blackboard: Blackboard | None,
+        cache_manager: CacheManager | None,
+    ) -> str | None:
+        """Hash subscribed blackboard regions for the cache key, if caching is on."""
+        if not cache_manager or not cache_manager.enabled:
+            return None
+        if not blackboard or not agent_config.blackboard.reads:
+            return ""
+
+        from doc2md.cache.keys import hash_blackboard
+
+        return hash_blackboard(
+            functools.partial(blackboard.hash_into, agent_config.blackboard.reads)
+        )
+
     @staticmethod
     def _apply_blackboard_writes(
         blackboard: Blackboard,
@@ -278,8 +313,8 @@ class AgentEngine:
         for region, data in writes.items():
             if region in VALID_REGIONS:
                 if isinstance(data, dict):
-                    for key, value in data.items():
-                        blackboard.write(region, str(key), value, writer=writer)
+                    items = {str(key): value for key, value in data.items()}
+                    blackboard.write_many(region, items, writer=writer)
                 else:
                     blackboard.write(region, region, data, writer=writer)
             else:
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import functools
 import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import NamedTuple
+from typing import Any, NamedTuple
 
 import yaml
 
-from doc2md.config.loader import load_agent_yaml, load_pipeline_yaml
+from doc2md.config.loader import YAML_LOADER, agent_config_from_raw, pipeline_config_from_raw
 from doc2md.config.schema import PipelineConfig
 from doc2md.types import AgentConfig
 
@@ -17,6 +20,14 @@ logger = logging.getLogger(__name__)
 _BUILTIN_AGENTS_DIR = Path(__file__).parent / "builtin" / "agents"
 _BUILTIN_PIPELINES_DIR = Path(__file__).parent / "builtin" / "pipelines"
 
+_MAX_SCAN_WORKERS = 8
+
+# Block-style top-level key at column 0, optionally quoted
+_TOP_LEVEL_KEY_PATTERNS = {
+    kind: re.compile(rb"^[\"']?" + kind.encode() + rb"[\"']?[ \t]*:", re.MULTILINE)
+    for kind in ("agent", "pipeline")
+}
+
 
 class AgentInfo(NamedTuple):
     name: str
@@ -39,6 +50,7 @@ class AgentRegistry:
     def __init__(self, user_dirs: list[Path] | None = None) -> None:
         self._agents: dict[str, AgentConfig] = {}
         self._sources: dict[str, bool] = {}  # name → is_builtin
+        self._listing: tuple[AgentInfo, ...] | None = None
         self._scan(_BUILTIN_AGENTS_DIR, builtin=True)
         for d in user_dirs or []:
             self._scan(d, builtin=False)
@@ -51,16 +63,19 @@ class AgentRegistry:
     def has(self, name: str) -> bool:
         return name in self._agents
 
-    def list_agents(self) -> list[AgentInfo]:
-        return [
-            AgentInfo(
-                name=c.name,
-                version=c.version,
-                description=c.description,
-                builtin=self._sources[c.name],
+    def list_agents(self) -> tuple[AgentInfo, ...]:
+        """Summaries of the registered agents, rebuilt only after registration."""
+        if self._listing is None:
+            self._listing = tuple(
+                AgentInfo(
+                    name=c.name,
+                    version=c.version,
+                    description=c.description,
+                    builtin=self._sources[c.name],
+                )
+                for c in self._agents.values()
             )
-            for c in self._agents.values()
-        ]
+        return self._listing
 
     def all_configs(self) -> dict[str, AgentConfig]:
         return dict(self._agents)
@@ -68,21 +83,23 @@ class AgentRegistry:
     def register(self, config: AgentConfig, builtin: bool = False) -> None:
         self._agents[config.name] = config
         self._sources[config.name] = builtin
+        self._listing = None
 
     def _scan(self, directory: Path, builtin: bool) -> None:
         if not directory.exists():
             return
-        for path in sorted(directory.glob("*.yaml")):
+        for path, raw in _read_all_yaml(sorted(directory.glob("*.yaml")), "agent"):
             try:
-                with open(path) as f:
-                    raw = yaml.safe_load(f)
+                if isinstance(raw, Exception):
+                    raise raw
                 if not isinstance(raw, dict) or "agent" not in raw:
                     continue  # Not an agent YAML, skip silently
-                config = load_agent_yaml(path)
+                config = agent_config_from_raw(raw, path)
                 # User agents override builtins
                 if config.name not in self._agents or not builtin:
                     self._agents[config.name] = config
                     self._sources[config.name] = builtin
+                    self._listing = None
             except Exception as e:
                 logger.warning("Failed to load agent %s: %s", path, e)
 
@@ -93,6 +110,8 @@ class PipelineRegistry:
     def __init__(self, user_dirs: list[Path] | None = None) -> None:
         self._pipelines: dict[str, PipelineConfig] = {}
         self._sources: dict[str, bool] = {}
+        self._fingerprint: tuple[tuple[str, str], ...] | None = None
+        self._listing: tuple[PipelineInfo, ...] | None = None
         self._scan(_BUILTIN_PIPELINES_DIR, builtin=True)
         for d in user_dirs or []:
             self._scan(d, builtin=False)
@@ -105,34 +124,88 @@ class PipelineRegistry:
     def has(self, name: str) -> bool:
         return name in self._pipelines
 
-    def list_pipelines(self) -> list[PipelineInfo]:
-        return [
-            PipelineInfo(
-                name=c.name,
-                version=c.version,
-                description=c.description,
-                builtin=self._sources[c.name],
-                step_count=len(c.steps),
+    def list_pipelines(self) -> tuple[PipelineInfo, ...]:
+        """Summaries of the registered pipelines, rebuilt only after registration."""
+        if self._listing is None:
+            self._listing = tuple(
+                PipelineInfo(
+                    name=c.name,
+                    version=c.version,
+                    description=c.description,
+                    builtin=self._sources[c.name],
+                    step_count=len(c.steps),
+                )
+                for c in self._pipelines.values()
             )
-            for c in self._pipelines.values()
-        ]
+        return self._listing
+
+    def fingerprint(self) -> tuple[tuple[str, str], ...]:
+        """Hashable (name, description) summary of the registered pipelines."""
+        if self._fingerprint is None:
+            self._fingerprint = tuple((c.name, c.description) for c in self._pipelines.values())
+        return self._fingerprint
 
     def register(self, config: PipelineConfig, builtin: bool = False) -> None:
         self._pipelines[config.name] = config
         self._sources[config.name] = builtin
+        self._fingerprint = None
+        self._listing = None
 
     def _scan(self, directory: Path, builtin: bool) -> None:
         if not directory.exists():
             return
-        for path in sorted(directory.glob("*.yaml")):
+        for path, raw in _read_all_yaml(sorted(directory.glob("*.yaml")), "pipeline"):
             try:
-                with open(path) as f:
-                    raw = yaml.safe_load(f)
+                if isinstance(raw, Exception):
+                    raise raw
                 if not isinstance(raw, dict) or "pipeline" not in raw:
                     continue  # Not a pipeline YAML, skip silently
-                config = load_pipeline_yaml(path)
+                config = pipeline_config_from_raw(raw, path)
                 if config.name not in self._pipelines or not builtin:
                     self._pipelines[config.name] = config
                     self._sources[config.name] = builtin
+                    self._fingerprint = None
+                    self._listing = None
             except Exception as e:
                 logger.warning("Failed to load pipeline %s: %s", path, e)
+
+
+def _read_all_yaml(paths: list[Path], kind: str) -> list[tuple[Path, Any]]:
+    """Read YAML files concurrently, preserving input order.
+
+    Each entry is (path, parsed document) or (path, exception) so callers
+    can register results serially and keep override order deterministic.
+    Files without a top-level ``kind`` key come back as None unparsed.
+    """
+    read = functools.partial(_read_yaml_or_error, kind=kind)
+    if len(paths) <= 1:
+        return [(path, read(path)) for path in paths]
+    with ThreadPoolExecutor(max_workers=min(_MAX_SCAN_WORKERS, len(paths))) as pool:
+        return list(zip(paths, pool.map(read, paths), strict=True))
+
+
+def _read_yaml_or_error(path: Path, kind: str) -> Any:
+    try:
+        return _read_yaml(path, kind)
+    except Exception as e:
+        return e
+
+
+def _read_yaml(path: Path, kind: str) -> Any:
+    """Parse a YAML config file of the given kind once per modification time.
+
+    Registries are rebuilt per converter, so the parsed document is
+    memoized on (path, mtime, kind). Callers must treat the returned
+    document as read-only.
+    """
+    return _read_yaml_cached(str(path), path.stat().st_mtime_ns, kind)
+
+
+@functools.lru_cache(maxsize=1024)
+def _read_yaml_cached(path: str, mtime_ns: int, kind: str) -> Any:
+    data = Path(path).read_bytes()
+    # Cheap pre-filter: skip the YAML parse for files that cannot be this
+    # kind of config (e.g. pipelines when scanning for agents)
+    if _TOP_LEVEL_KEY_PATTERNS[kind].search(data) is None:
+        return None
+    return yaml.load(data, Loader=YAML_LOADER)
@@ -2,20 +2,27 @@
 
 from __future__ import annotations
 
-import copy
+import hashlib
+import json
 import logging
+import operator
 from collections.abc import Callable
-from typing import Any
+from typing import Any, Generic, TypeVar, overload
 
-from doc2md.blackboard.events import BlackboardEvent, EventLog, EventType
+from doc2md.blackboard.events import EventLog, EventType
 from doc2md.blackboard.regions import (
     VALID_REGIONS,
     DocumentMetadata,
     PageObservation,
 )
+from doc2md.utils.clone import clone_data
 
 logger = logging.getLogger(__name__)
 
+_HASH_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"), default=str)
+
+_S = TypeVar("_S")
+
 
 class BlackboardView:
     """Read-only frozen view of subscribed blackboard regions."""
@@ -32,19 +39,72 @@ class BlackboardView:
             raise AttributeError(f"BlackboardView has no region '{name}'") from err
 
     def to_dict(self) -> dict[str, Any]:
-        return copy.deepcopy(self._data)
+        return clone_data(self._data)
+
+
+class _RegionStore(Generic[_S]):
+    """Blackboard region attribute that is copy-on-write across copies.
+
+    The store lives in a private attribute. Any access through the public
+    attribute may mutate it, so a store still shared with a copy is replaced
+    by a private copy first and the region's cached serialization is
+    dropped. Internal read-only paths (serialization, hashing, snapshots)
+    use the private attribute and neither copy nor invalidate.
+    """
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._region = name
+        self._attr = "_" + name
+
+    @overload
+    def __get__(self, board: None, owner: type | None = None) -> _RegionStore[_S]: ...
+
+    @overload
+    def __get__(self, board: Blackboard, owner: type | None = None) -> _S: ...
+
+    def __get__(self, board: Blackboard | None, owner: type | None = None) -> Any:
+        if board is None:
+            return self
+        if self._region in board._shared:
+            board._unshare(self._region)
+        board._invalidate(self._region)
+        return getattr(board, self._attr)
+
+    def __set__(self, board: Blackboard, store: _S) -> None:
+        setattr(board, self._attr, store)
+        board._shared.discard(self._region)
+        board._invalidate(self._region)
 
 
 class Blackboard:
     """Typed, region-based shared memory for pipeline execution."""
 
-    def __init__(self) -> None:
+    document_metadata = _RegionStore[DocumentMetadata]()
+    page_observations = _RegionStore[dict[int, PageObservation]]()
+    step_outputs = _RegionStore[dict[str, str]]()
+    agent_notes = _RegionStore[dict[str, dict[str, Any]]]()
+    confidence_signals = _RegionStore[dict[str, dict[str, Any]]]()
+
+    # Backing stores of the regions above
+    _document_metadata: DocumentMetadata
+    _page_observations: dict[int, PageObservation]
+    _step_outputs: dict[str, str]
+    _agent_notes: dict[str, dict[str, Any]]
+    _confidence_signals: dict[str, dict[str, Any]]
+
+    def __init__(self, record_events: bool = True, max_events: int | None = None) -> None:
+        # Serialized form of each region, dropped whenever the region is written
+        self._serialized: dict[str, Any] = {}
+        # SHA-256 digest of each serialized region, dropped alongside it
+        self._digests: dict[str, bytes] = {}
+        # Regions whose stores are still shared with a copy (copy-on-write)
+        self._shared: set[str] = set()
         self.document_metadata = DocumentMetadata()
-        self.page_observations: dict[int, PageObservation] = {}
-        self.step_outputs: dict[str, str] = {}
-        self.agent_notes: dict[str, dict[str, Any]] = {}
-        self.confidence_signals: dict[str, dict[str, Any]] = {}
-        self._event_log = EventLog()
+        self.page_observations = {}
+        self.step_outputs = {}
+        self.agent_notes = {}
+        self.confidence_signals = {}
+        self._event_log = EventLog(max_events=max_events, enabled=record_events)
 
     @property
     def event_log(self) -> EventLog:
@@ -56,34 +116,33 @@ class Blackboard:
         """Read a value from a region. Logs a READ event."""
         self._validate_region(region)
         value = self._get_value(region, key)
-        self._event_log.append(
-            BlackboardEvent(
-                event_type=EventType.READ,
-                region=region,
-                key=key,
-                agent_name=reader,
-            )
-        )
+        self._event_log.append_raw(EventType.READ, region, key, agent_name=reader)
         return value
 
     def write(self, region: str, key: str, value: Any, writer: str = "") -> None:
         """Write a value to a region. Validates and logs a WRITE event."""
         self._validate_region(region)
         self._set_value(region, key, value)
-        self._event_log.append(
-            BlackboardEvent(
-                event_type=EventType.WRITE,
-                region=region,
-                key=key,
-                value=value,
-                agent_name=writer,
-            )
-        )
+        self._invalidate(region)
+        self._event_log.append_raw(EventType.WRITE, region, key, value, writer)
+
+    def write_many(self, region: str, items: dict[str, Any], writer: str = "") -> None:
+        """Write several keys to one region, validating and invalidating once.
+
+        Equivalent to calling :meth:`write` for each item in order.
+        """
+        self._validate_region(region)
+        setter = self._SETTERS[region]
+        for key, value in items.items():
+            setter(self, key, value)
+        self._invalidate(region)
+        self._event_log.extend_raw(EventType.WRITE, region, items.items(), writer)
 
     def query(self, region: str, filter_fn: Callable[[Any], bool]) -> list[Any]:
         """Query a region with a filter function."""
         self._validate_region(region)
-        store = self._get_region_store(region)
+        # Matches are live values the caller may mutate; take ownership first
+        store = getattr(self, region)
         if isinstance(store, dict):
             return [v for v in store.values() if filter_fn(v)]
         # For DocumentMetadata, filter against fields
@@ -91,38 +150,75 @@ class Blackboard:
 
     def subscribe(self, regions: list[str]) -> BlackboardView:
         """Return a read-only view of specific regions for prompt injection."""
-        data: dict[str, Any] = {}
-        for region in regions:
-            base_region = region.split(".")[0]
-            self._validate_region(base_region)
-            data[base_region] = self._serialize_region(base_region)
-        return BlackboardView(data)
+        return BlackboardView(self._serialize_subscriptions(regions))
 
     def snapshot(self) -> dict[str, Any]:
         """Frozen snapshot for cache key computation."""
+        # Every region is copied out, so shared stores are read in place
         return {
-            "document_metadata": self.document_metadata.model_dump(),
-            "page_observations": {k: v.model_dump() for k, v in self.page_observations.items()},
-            "step_outputs": dict(self.step_outputs),
-            "agent_notes": copy.deepcopy(self.agent_notes),
-            "confidence_signals": copy.deepcopy(self.confidence_signals),
+            "document_metadata": self._document_metadata.model_dump(),
+            "page_observations": {k: v.model_dump() for k, v in self._page_observations.items()},
+            "step_outputs": dict(self._step_outputs),
+            "agent_notes": clone_data(self._agent_notes),
+            "confidence_signals": clone_data(self._confidence_signals),
         }
 
     def to_jinja_context(self, subscriptions: list[str]) -> dict[str, Any]:
         """Serialize subscribed regions into a dict for Jinja2 prompt rendering."""
-        view = self.subscribe(subscriptions)
-        return view.to_dict()
+        # Serialized regions are already independent copies; no second clone needed
+        return self._serialize_subscriptions(subscriptions)
+
+    def hash_into(self, subscriptions: list[str], hasher: Any) -> None:
+        """Feed subscribed regions into ``hasher`` in canonical order.
+
+        Each region contributes its name and a cached per-region digest, so
+        only regions written since the last call are re-encoded and hashed.
+        """
+        regions = sorted({region.split(".")[0] for region in subscriptions})
+        for region in regions:
+            self._validate_region(region)
+            hasher.update(region.encode("utf-8"))
+            hasher.update(self._region_digest(region))
+
+    def mark_dirty(self, region: str | None = None) -> None:
+        """Drop cached serializations after mutating region stores directly.
+
+        Writes through :meth:`write` and accesses to a region attribute do
+        this automatically; only code that keeps a reference to a store and
+        mutates it after the board was serialized needs it.
+        """
+        if region is None:
+            self._serialized.clear()
+            self._digests.clear()
+        else:
+            self._invalidate(region)
+
+    def shares_region(self, other: Blackboard, region: str) -> bool:
+        """Whether this board and ``other`` still share one store for ``region``.
+
+        True for a region neither board has accessed for writing since one
+        was copied from the other.
+        """
+        return self._get_region_store(region) is other._get_region_store(region)
 
     def copy(self) -> Blackboard:
-        """Create a deep copy for parallel step execution."""
-        new = Blackboard()
-        new.document_metadata = self.document_metadata.model_copy(deep=True)
-        new.page_observations = {
-            k: v.model_copy(deep=True) for k, v in self.page_observations.items()
-        }
-        new.step_outputs = dict(self.step_outputs)
-        new.agent_notes = copy.deepcopy(self.agent_notes)
-        new.confidence_signals = copy.deepcopy(self.confidence_signals)
+        """Create an independent copy for parallel step execution.
+
+        Region stores are shared copy-on-write: each board takes a private
+        copy of a region the first time it writes to it or hands it out
+        through a region attribute, so forking costs nothing for regions a
+        branch only reads through prompts and cache keys.
+        """
+        new = Blackboard(
+            record_events=self._event_log.enabled, max_events=self._event_log.max_events
+        )
+        for region in VALID_REGIONS:
+            attr = "_" + region
+            setattr(new, attr, getattr(self, attr))
+        new._serialized = dict(self._serialized)
+        new._digests = dict(self._digests)
+        self._shared.update(VALID_REGIONS)
+        new._shared.update(VALID_REGIONS)
         # Event log is NOT copied — each branch gets its own
         return new
 
@@ -132,79 +228,173 @@ class Blackboard:
         if region not in VALID_REGIONS:
             raise ValueError(f"Invalid blackboard region: '{region}'. Valid: {VALID_REGIONS}")
 
+    def _unshare(self, region: str) -> None:
+        # Contents are unchanged, so cached serializations stay valid
+        attr = "_" + region
+        setattr(self, attr, _copy_store(region, getattr(self, attr)))
+        self._shared.discard(region)
+
     def _get_region_store(self, region: str) -> Any:
-        return getattr(self, region)
+        # Read-only access to the store, shared or not. Doubles as validation
+        # for callers that need the store anyway.
+        getter = self._STORES.get(region)
+        if getter is None:
+            raise ValueError(f"Invalid blackboard region: '{region}'. Valid: {VALID_REGIONS}")
+        return getter(self)
 
     def _get_value(self, region: str, key: str) -> Any:
-        store = self._get_region_store(region)
-        if isinstance(store, DocumentMetadata):
-            return getattr(store, key, None)
-        if isinstance(store, dict):
-            # Support dotted keys like "3.quality_score" for page_observations
-            parts = key.split(".", 1)
-            typed_key: Any = parts[0]
-            if region == "page_observations":
-                typed_key = int(typed_key)
-            val = store.get(typed_key)
-            if val is not None and len(parts) > 1:
-                if isinstance(val, PageObservation):
-                    return getattr(val, parts[1], None)
-                if isinstance(val, dict):
-                    return val.get(parts[1])
-            return val
-        return None
+        return self._GETTERS[region](self, key)
 
-    def _set_value(self, region: str, key: str, value: Any) -> None:
-        store = self._get_region_store(region)
+    def _get_document_metadata(self, key: str) -> Any:
+        return getattr(self.document_metadata, key, None)
+
+    def _get_page_observation(self, key: str) -> Any:
+        # Support dotted keys like "3.quality_score"
+        parts = key.split(".", 1)
+        val = self.page_observations.get(int(parts[0]))
+        if val is not None and len(parts) > 1:
+            return _get_subkey(val, parts[1])
+        return val
+
+    def _get_step_output(self, key: str) -> Any:
+        return _get_dotted(self.step_outputs, key)
+
+    def _get_agent_note(self, key: str) -> Any:
+        return _get_dotted(self.agent_notes, key)
+
+    def _get_confidence_signal(self, key: str) -> Any:
+        return _get_dotted(self.confidence_signals, key)
 
-        if region == "document_metadata":
-            if hasattr(store, key):
-                old = getattr(store, key)
-                if old is not None and old != value:
-                    logger.warning(
-                        "Blackboard conflict: document_metadata.%s changing from %r to %r",
-                        key,
-                        old,
-                        value,
-                    )
-            setattr(self.document_metadata, key, value)
-
-        elif region == "page_observations":
-            parts = key.split(".", 1)
-            page_num = int(parts[0])
-            if page_num not in self.page_observations:
-                self.page_observations[page_num] = PageObservation()
-            if len(parts) > 1:
-                setattr(self.page_observations[page_num], parts[1], value)
-            elif isinstance(value, PageObservation):
-                self.page_observations[page_num] = value
-            elif isinstance(value, dict):
-                obs = self.page_observations[page_num]
-                for k, v in value.items():
-                    setattr(obs, k, v)
-
-        elif region == "step_outputs":
-            self.step_outputs[key] = value
-
-        elif region == "agent_notes":
-            parts = key.split(".", 1)
-            agent_name = parts[0]
-            if agent_name not in self.agent_notes:
-                self.agent_notes[agent_name] = {}
-            if len(parts) > 1:
-                self.agent_notes[agent_name][parts[1]] = value
-            elif isinstance(value, dict):
-                self.agent_notes[agent_name].update(value)
-            else:
-                self.agent_notes[agent_name] = value
-
-        elif region == "confidence_signals":
-            self.confidence_signals[key] = value
+    def _set_value(self, region: str, key: str, value: Any) -> None:
+        self._SETTERS[region](self, key, value)
+
+    def _set_document_metadata(self, key: str, value: Any) -> None:
+        store = self.document_metadata
+        if hasattr(store, key):
+            old = getattr(store, key)
+            if old is not None and old != value:
+                logger.warning(
+                    "Blackboard conflict: document_metadata.%s changing from %r to %r",
+                    key,
+                    old,
+                    value,
+                )
+        setattr(store, key, value)
+
+    def _set_page_observation(self, key: str, value: Any) -> None:
+        parts = key.split(".", 1)
+        page_num = int(parts[0])
+        if len(parts) == 1 and isinstance(value, PageObservation):
+            self.page_observations[page_num] = value
+            return
+        obs = self.page_observations.get(page_num)
+        if obs is None:
+            # Defaults only, so validation can be skipped
+            obs = PageObservation.model_construct()
+            self.page_observations[page_num] = obs
+        if len(parts) > 1:
+            setattr(obs, parts[1], value)
+        elif isinstance(value, dict):
+            for k, v in value.items():
+                setattr(obs, k, v)
+
+    def _set_step_output(self, key: str, value: Any) -> None:
+        self.step_outputs[key] = value
+
+    def _set_agent_note(self, key: str, value: Any) -> None:
+        parts = key.split(".", 1)
+        agent_name = parts[0]
+        if agent_name not in self.agent_notes:
+            self.agent_notes[agent_name] = {}
+        if len(parts) > 1:
+            self.agent_notes[agent_name][parts[1]] = value
+        elif isinstance(value, dict):
+            self.agent_notes[agent_name].update(value)
+        else:
+            self.agent_notes[agent_name] = value
+
+    def _set_confidence_signal(self, key: str, value: Any) -> None:
+        self.confidence_signals[key] = value
+
+    # Per-region store accessors and read/write handlers, dispatched with a
+    # single dict lookup instead of getattr by name
+    _STORES: dict[str, Callable[[Blackboard], Any]] = {
+        region: operator.attrgetter("_" + region) for region in VALID_REGIONS
+    }
+    _GETTERS: dict[str, Callable[[Blackboard, str], Any]] = {
+        "document_metadata": _get_document_metadata,
+        "page_observations": _get_page_observation,
+        "step_outputs": _get_step_output,
+        "agent_notes": _get_agent_note,
+        "confidence_signals": _get_confidence_signal,
+    }
+    _SETTERS: dict[str, Callable[[Blackboard, str, Any], None]] = {
+        "document_metadata": _set_document_metadata,
+        "page_observations": _set_page_observation,
+        "step_outputs": _set_step_output,
+        "agent_notes": _set_agent_note,
+        "confidence_signals": _set_confidence_signal,
+    }
+
+    def _serialize_subscriptions(self, regions: list[str]) -> dict[str, Any]:
+        data: dict[str, Any] = {}
+        for region in regions:
+            base_region = region.split(".")[0]
+            self._validate_region(base_region)
+            data[base_region] = self._serialize_region(base_region)
+        return data
 
     def _serialize_region(self, region: str) -> Any:
+        # The clone keeps callers from mutating the cached copy
+        return clone_data(self._cached_region(region))
+
+    def _cached_region(self, region: str) -> Any:
+        # Unchanged regions reuse their last serialization
+        if region not in self._serialized:
+            self._serialized[region] = self._dump_region(region)
+        return self._serialized[region]
+
+    def _region_digest(self, region: str) -> bytes:
+        digest = self._digests.get(region)
+        if digest is None:
+            encoded = _HASH_ENCODER.encode(self._cached_region(region)).encode("utf-8")
+            digest = self._digests[region] = hashlib.sha256(encoded).digest()
+        return digest
+
+    def _invalidate(self, region: str) -> None:
+        self._serialized.pop(region, None)
+        self._digests.pop(region, None)
+
+    def _dump_region(self, region: str) -> Any:
         store = self._get_region_store(region)
         if isinstance(store, DocumentMetadata):
             return store.model_dump(exclude_none=True)
         if region == "page_observations":
             return {k: v.model_dump(exclude_none=True) for k, v in store.items()}
-        return copy.deepcopy(store)
+        return clone_data(store)
+
+
+def _copy_store(region: str, store: Any) -> Any:
+    if region == "document_metadata":
+        return store.model_copy(deep=True)
+    if region == "page_observations":
+        return {k: v.model_copy(deep=True) for k, v in store.items()}
+    if region == "step_outputs":
+        return dict(store)
+    return clone_data(store)
+
+
+def _get_dotted(store: dict[str, Any], key: str) -> Any:
+    parts = key.split(".", 1)
+    val = store.get(parts[0])
+    if val is not None and len(parts) > 1:
+        return _get_subkey(val, parts[1])
+    return val
+
+
+def _get_subkey(val: Any, subkey: str) -> Any:
+    if isinstance(val, PageObservation):
+        return getattr(val, subkey, None)
+    if isinstance(val, dict):
+        return val.get(subkey)
+    return val
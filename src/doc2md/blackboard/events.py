@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import bisect
+import itertools
 import time
+from collections import defaultdict
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
 from enum import StrEnum
-from typing import Any
-
-from pydantic import BaseModel, Field
+from typing import Any, overload
 
 
 class EventType(StrEnum):
@@ -14,10 +17,15 @@ class EventType(StrEnum):
     WRITE = "WRITE"
 
 
-class BlackboardEvent(BaseModel):
-    """A single blackboard read or write event."""
+@dataclass(frozen=True, slots=True, kw_only=True)
+class BlackboardEvent:
+    """A single blackboard read or write event.
+
+    A plain slotted dataclass: events are produced internally, so model
+    validation would be wasted work.
+    """
 
-    timestamp: float = Field(default_factory=time.monotonic)
+    timestamp: float = field(default_factory=time.monotonic)
     event_type: EventType
     region: str
     key: str
@@ -25,33 +33,176 @@ class BlackboardEvent(BaseModel):
     agent_name: str = ""
 
 
-class EventLog:
-    """Append-only, queryable event log."""
+# (timestamp, event_type, region, key, value, agent_name), in BlackboardEvent field order
+_RawEvent = tuple[float, EventType, str, str, Any, str]
 
-    def __init__(self) -> None:
-        self._events: list[BlackboardEvent] = []
+
+class EventLog:
+    """Append-only, queryable event log.
+
+    Events are stored as plain tuples and only materialized as
+    :class:`BlackboardEvent` objects when read back. Per-agent, per-region
+    and per-type indices of sequence numbers are maintained on append, so
+    queries touch only the matching events. ``max_events`` turns the log
+    into a ring buffer keeping the most recent events; a disabled log
+    records nothing.
+    """
+
+    def __init__(self, max_events: int | None = None, enabled: bool = True) -> None:
+        self._events: list[_RawEvent] = []
+        self._offset = 0  # Sequence number of self._events[0]
+        self._max_events = max_events
+        self._by_agent: defaultdict[str, list[int]] = defaultdict(list)
+        self._by_region: defaultdict[str, list[int]] = defaultdict(list)
+        self._by_type: defaultdict[str, list[int]] = defaultdict(list)
+        self.enabled = enabled
 
     def append(self, event: BlackboardEvent) -> None:
-        self._events.append(event)
+        if self.enabled:
+            self._record(
+                (
+                    event.timestamp,
+                    event.event_type,
+                    event.region,
+                    event.key,
+                    event.value,
+                    event.agent_name,
+                )
+            )
+
+    def append_raw(
+        self,
+        event_type: EventType,
+        region: str,
+        key: str,
+        value: Any = None,
+        agent_name: str = "",
+    ) -> None:
+        """Record an event without constructing a BlackboardEvent."""
+        if self.enabled:
+            self._record((time.monotonic(), event_type, region, key, value, agent_name))
+
+    def extend_raw(
+        self,
+        event_type: EventType,
+        region: str,
+        items: Iterable[tuple[str, Any]],
+        agent_name: str = "",
+    ) -> None:
+        """Record one event per (key, value) item, sharing a single timestamp."""
+        if self.enabled:
+            ts = time.monotonic()
+            for key, value in items:
+                self._record((ts, event_type, region, key, value, agent_name))
 
     @property
-    def events(self) -> list[BlackboardEvent]:
-        return list(self._events)
+    def max_events(self) -> int | None:
+        return self._max_events
+
+    @property
+    def events(self) -> Sequence[BlackboardEvent]:
+        """Read-only live view of the retained events, oldest first.
+
+        Nothing is copied up front; events are materialized as they are
+        indexed or iterated. Use ``list(log.events)`` for a snapshot.
+        """
+        return _EventView(self)
 
     def __len__(self) -> int:
-        return len(self._events)
+        return self._offset + len(self._events) - self._first_visible()
 
     def query_by_agent(self, agent_name: str) -> list[BlackboardEvent]:
-        return [e for e in self._events if e.agent_name == agent_name]
+        return self._select(self._by_agent, agent_name)
 
     def query_by_region(self, region: str) -> list[BlackboardEvent]:
-        return [e for e in self._events if e.region == region]
+        return self._select(self._by_region, region)
 
     def query_by_type(self, event_type: EventType) -> list[BlackboardEvent]:
-        return [e for e in self._events if e.event_type == event_type]
+        return self._select(self._by_type, event_type)
 
     def query_writes(self) -> list[BlackboardEvent]:
-        return self.query_by_type(EventType.WRITE)
+        return self._select(self._by_type, EventType.WRITE)
 
     def query_reads(self) -> list[BlackboardEvent]:
-        return self.query_by_type(EventType.READ)
+        return self._select(self._by_type, EventType.READ)
+
+    def _record(self, raw: _RawEvent) -> None:
+        seq = self._offset + len(self._events)
+        self._events.append(raw)
+        self._by_type[raw[1]].append(seq)
+        self._by_region[raw[2]].append(seq)
+        self._by_agent[raw[5]].append(seq)
+        # Ring buffer: keep up to twice the limit so trimming stays amortized O(1)
+        if self._max_events is not None and len(self._events) >= 2 * self._max_events:
+            self._trim(self._max_events)
+
+    def _trim(self, keep: int) -> None:
+        drop = len(self._events) - keep
+        del self._events[:drop]
+        self._offset += drop
+        for index in (self._by_agent, self._by_region, self._by_type):
+            for name, seqs in list(index.items()):
+                stale = bisect.bisect_left(seqs, self._offset)
+                if stale == len(seqs):
+                    del index[name]
+                else:
+                    del seqs[:stale]
+
+    def _first_visible(self) -> int:
+        """Sequence number of the oldest event still inside the ring."""
+        if self._max_events is None:
+            return self._offset
+        return max(self._offset, self._offset + len(self._events) - self._max_events)
+
+    def _select(self, index: dict[str, list[int]], name: str) -> list[BlackboardEvent]:
+        seqs = index.get(name, [])
+        start = bisect.bisect_left(seqs, self._first_visible())
+        offset = self._offset
+        return _materialize(self._events[seq - offset] for seq in seqs[start:])
+
+
+class _EventView(Sequence[BlackboardEvent]):
+    """Zero-copy, read-only sequence over an EventLog's retained events."""
+
+    __slots__ = ("_log",)
+
+    def __init__(self, log: EventLog) -> None:
+        self._log = log
+
+    def __len__(self) -> int:
+        return len(self._log)
+
+    @overload
+    def __getitem__(self, index: int) -> BlackboardEvent: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[BlackboardEvent]: ...
+
+    def __getitem__(self, index: int | slice) -> BlackboardEvent | list[BlackboardEvent]:
+        log = self._log
+        start = log._first_visible() - log._offset
+        if isinstance(index, slice):
+            return _materialize(log._events[start:][index])
+        size = len(log._events) - start
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("event index out of range")
+        return _to_event(log._events[start + index])
+
+    def __iter__(self) -> Iterator[BlackboardEvent]:
+        log = self._log
+        start = log._first_visible() - log._offset
+        for raw in itertools.islice(log._events, start, None):
+            yield _to_event(raw)
+
+
+def _materialize(raw_events: Iterable[_RawEvent]) -> list[BlackboardEvent]:
+    return [_to_event(raw) for raw in raw_events]
+
+
+def _to_event(raw: _RawEvent) -> BlackboardEvent:
+    ts, event_type, region, key, value, agent = raw
+    return BlackboardEvent(
+        timestamp=ts, event_type=event_type, region=region, key=key, value=value, agent_name=agent
+    )
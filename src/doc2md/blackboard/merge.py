@@ -3,15 +3,22 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
 from typing import TYPE_CHECKING
 
-from doc2md.blackboard.regions import DocumentMetadata, PageObservation
+from doc2md.blackboard.regions import DocumentMetadata, PageObservation, UncertainRegion
 
 if TYPE_CHECKING:
     from doc2md.blackboard.board import Blackboard
 
 logger = logging.getLogger(__name__)
 
+# Field metadata resolved once at import rather than on every merge
+_DOC_META_FIELDS = tuple(DocumentMetadata.model_fields)
+_PAGE_OBS_FIELDS = tuple(
+    (name, info.default) for name, info in PageObservation.model_fields.items()
+)
+
 
 def merge_parallel(target: Blackboard, sources: list[Blackboard]) -> None:
     """Merge blackboard writes from parallel branches into the target.
@@ -24,15 +31,16 @@ def merge_parallel(target: Blackboard, sources: list[Blackboard]) -> None:
       confidence_signals — keyed by step+page (no conflict possible)
     """
     for source in sources:
-        _merge_document_metadata(target, source)
-        _merge_page_observations(target, source)
-        _merge_step_outputs(target, source)
-        _merge_agent_notes(target, source)
-        _merge_confidence_signals(target, source)
+        for region, merge in _REGION_MERGERS:
+            # A branch that never wrote a region still shares the target's store
+            if source.shares_region(target, region):
+                continue
+            merge(target, source)
+    target.mark_dirty()
 
 
 def _merge_document_metadata(target: Blackboard, source: Blackboard) -> None:
-    for field_name in DocumentMetadata.model_fields:
+    for field_name in _DOC_META_FIELDS:
         source_val = getattr(source.document_metadata, field_name)
         target_val = getattr(target.document_metadata, field_name)
         if source_val is None:
@@ -61,25 +69,36 @@ def _merge_page_observations(target: Blackboard, source: Blackboard) -> None:
 
 def _deep_merge_observation(target_obs: PageObservation, source_obs: PageObservation) -> None:
     """Merge non-default fields from source into target."""
-    for field_name, field_info in PageObservation.model_fields.items():
-        source_val = getattr(source_obs, field_name)
-        default = field_info.default
+    # PageObservation has no assignment validation, so merged values are
+    # collected and written to the instance dict in one update
+    source = source_obs.__dict__
+    target = target_obs.__dict__
+    updates: dict[str, object] = {}
+    for field_name, default in _PAGE_OBS_FIELDS:
+        source_val = source[field_name]
         # Skip fields still at their default
         if source_val == default:
             continue
         if field_name == "uncertain_regions":
-            existing = {ur.model_dump_json() for ur in target_obs.uncertain_regions}
-            for ur in source_obs.uncertain_regions:
-                if ur.model_dump_json() not in existing:
-                    target_obs.uncertain_regions.append(ur)
-                    existing.add(ur.model_dump_json())
+            existing = {_uncertain_region_key(ur) for ur in target["uncertain_regions"]}
+            for ur in source_val:
+                key = _uncertain_region_key(ur)
+                if key not in existing:
+                    target["uncertain_regions"].append(ur)
+                    existing.add(key)
         elif field_name == "content_types":
-            merged = list(dict.fromkeys(target_obs.content_types + source_obs.content_types))
-            target_obs.content_types = merged
+            updates[field_name] = list(dict.fromkeys(target["content_types"] + source_val))
         elif field_name == "extra":
-            target_obs.extra.update(source_obs.extra)
+            target["extra"].update(source_val)
         else:
-            setattr(target_obs, field_name, source_val)
+            updates[field_name] = source_val
+    if updates:
+        target.update(updates)
+        target_obs.__pydantic_fields_set__.update(updates)
+
+
+def _uncertain_region_key(ur: UncertainRegion) -> tuple[int | None, str, str, str]:
+    return (ur.page, ur.area, ur.reason, ur.confidence)
 
 
 def _merge_step_outputs(target: Blackboard, source: Blackboard) -> None:
@@ -98,3 +117,12 @@ def _merge_agent_notes(target: Blackboard, source: Blackboard) -> None:
 
 def _merge_confidence_signals(target: Blackboard, source: Blackboard) -> None:
     target.confidence_signals.update(source.confidence_signals)
+
+
+_REGION_MERGERS: tuple[tuple[str, Callable[[Blackboard, Blackboard], None]], ...] = (
+    ("document_metadata", _merge_document_metadata),
+    ("page_observations", _merge_page_observations),
+    ("step_outputs", _merge_step_outputs),
+    ("agent_notes", _merge_agent_notes),
+    ("confidence_signals", _merge_confidence_signals),
+)
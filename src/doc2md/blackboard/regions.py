@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -49,4 +50,6 @@ REGION_TYPES: dict[str, type] = {
     "confidence_signals": dict,  # Dict[str, Dict[str, Any]]
 }
 
-VALID_REGIONS = frozenset(REGION_TYPES.keys())
+# Interned so membership checks against literal region names hit the
+# identity fast path before falling back to string comparison
+VALID_REGIONS = frozenset(sys.intern(name) for name in REGION_TYPES)
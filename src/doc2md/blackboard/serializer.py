@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
-import copy
+import json
+import operator
 from typing import TYPE_CHECKING, Any
 
+from doc2md.blackboard.regions import VALID_REGIONS
+
 if TYPE_CHECKING:
     from doc2md.blackboard.board import Blackboard
 
 # Max characters for a single region in the prompt context
 _MAX_REGION_CHARS = 8000
 
+_REGION_ACCESSORS = {region: operator.attrgetter(region) for region in VALID_REGIONS}
+
 
 def serialize_for_prompt(
     blackboard: Blackboard,
@@ -18,6 +23,9 @@ def serialize_for_prompt(
 ) -> dict[str, Any]:
     """Serialize only the subscribed regions/keys into a prompt-safe dict.
 
+    The result is read-only prompt context: plain values are shared with
+    the blackboard rather than copied, so callers must not mutate it.
+
     Subscriptions can be:
       - "document_metadata"                → entire region
       - "document_metadata.language"       → single field
@@ -28,7 +36,9 @@ def serialize_for_prompt(
     for sub in subscriptions:
         parts = sub.split(".")
         region = parts[0]
-        _add_region_data(blackboard, region, parts[1:], result)
+        # Unknown regions are skipped, never resolved as arbitrary attributes
+        if region in _REGION_ACCESSORS:
+            _add_region_data(blackboard, region, parts[1:], result)
 
     return result
 
@@ -40,9 +50,7 @@ def _add_region_data(
     result: dict[str, Any],
 ) -> None:
     """Add data from a single subscription path to the result dict."""
-    store = getattr(blackboard, region, None)
-    if store is None:
-        return
+    store = _REGION_ACCESSORS[region](blackboard)
 
     if region not in result:
         result[region] = {}
@@ -75,7 +83,7 @@ def _add_region_data(
     elif region in ("step_outputs", "agent_notes", "confidence_signals"):
         key = subpath[0]
         if key in store:
-            result[region][key] = copy.deepcopy(store[key])
+            result[region][key] = store[key]
 
 
 def _serialize_value(obj: Any) -> Any:
@@ -83,10 +91,34 @@ def _serialize_value(obj: Any) -> Any:
         return obj.model_dump(exclude_none=True)
     if isinstance(obj, dict):
         return {k: _serialize_value(v) for k, v in obj.items()}
-    return copy.deepcopy(obj)
+    return obj
 
 
 def _truncate_if_needed(result: dict, region: str) -> None:
-    serialized = str(result[region])
-    if len(serialized) > _MAX_REGION_CHARS:
-        result[region] = {"_truncated": True, "_preview": serialized[:_MAX_REGION_CHARS]}
+    value = result[region]
+    if _estimate_size(value, _MAX_REGION_CHARS) > _MAX_REGION_CHARS:
+        preview = json.dumps(value, default=str)[:_MAX_REGION_CHARS]
+        result[region] = {"_truncated": True, "_preview": preview}
+
+
+def _estimate_size(obj: Any, cap: int) -> int:
+    """Approximate the serialized length of obj, stopping once it exceeds cap.
+
+    Avoids rendering the whole structure just to learn it is small.
+    """
+    total = 0
+    stack = [obj]
+    while stack and total <= cap:
+        item = stack.pop()
+        if isinstance(item, str):
+            total += len(item) + 2  # quotes
+        elif isinstance(item, dict):
+            total += 2 + 4 * len(item)  # braces, ": " and ", "
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            total += 2 + 2 * len(item)
+            stack.extend(item)
+        else:
+            total += len(str(item))
+    return total
@@ -10,6 +10,12 @@ import re
 from collections.abc import Callable
 from typing import Any
 
+# A table separator row, e.g. "|---|:---:|"
+_TABLE_SEP_RE = re.compile(r"^\|[\s:|-]+\|$", re.MULTILINE)
+
+# Characters that end a sentence (or a quoted/parenthesized one)
+_TERMINATORS = frozenset(".!?\"')")
+
 # Registry of code-computed writers: function_name → (callable, output_key)
 _WRITER_REGISTRY: dict[str, tuple[Callable[..., Any], str]] = {}
 
@@ -47,12 +53,14 @@ def detect_continuations(markdown: str, page_num: int) -> bool:
     if stripped.endswith("|"):
         return True
     # Ends without sentence-terminating punctuation
-    return stripped[-1] not in ".!?\"')"
+    return stripped[-1] not in _TERMINATORS
 
 
 @blackboard_writer("page_observations.{page_num}.table_count")
 def count_tables(markdown: str, page_num: int = 0) -> int:
     """Count the number of Markdown tables in the output."""
+    # Most pages have no tables; a substring check skips the regex entirely
+    if "|" not in markdown:
+        return 0
     # A table starts with a header row followed by a separator row
-    table_sep_pattern = re.compile(r"^\|[\s:|-]+\|$", re.MULTILINE)
-    return len(table_sep_pattern.findall(markdown))
+    return len(_TABLE_SEP_RE.findall(markdown))
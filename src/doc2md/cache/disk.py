@@ -6,8 +6,11 @@ import contextlib
 import json
 import logging
 import sqlite3
+import threading
 import time
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any
 
 from doc2md.cache.stats import CacheEntry
 from doc2md.types import TokenUsage
@@ -16,10 +19,24 @@ logger = logging.getLogger(__name__)
 
 _DEFAULT_MAX_SIZE_MB = 5000
 _DEFAULT_DB_PATH = Path.home() / ".doc2md" / "cache.db"
+_MMAP_SIZE_BYTES = 256 * 1024 * 1024
+_PAGE_CACHE_KB = 64_000  # Negative cache_size is in KiB: ~64 MB of pages
+_WRITES_ENCODER = json.JSONEncoder(separators=(",", ":"))
+_MAX_SQL_PARAMS = 999  # SQLite's default bound-parameter limit on older builds
+
+_SELECT_SQL = "SELECT * FROM cache WHERE key = ?"
+_TOUCH_SQL = "UPDATE cache SET last_accessed = ? WHERE key = ?"
+_DELETE_SQL = "DELETE FROM cache WHERE key = ?"
 
 
 class DiskCache:
-    """SQLite-backed persistent cache with TTL and LRU eviction."""
+    """SQLite-backed persistent cache with TTL and LRU eviction.
+
+    Each thread gets its own connection, opened on first use, so parallel
+    pipeline branches read concurrently under WAL instead of queueing on
+    one connection. Connections run in autocommit mode; multi-statement
+    writes take an explicit ``BEGIN IMMEDIATE`` transaction.
+    """
 
     def __init__(
         self,
@@ -29,29 +46,41 @@ class DiskCache:
         self._db_path = db_path or _DEFAULT_DB_PATH
         self._max_size_bytes = int(max_size_mb * 1024 * 1024)
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._conn = sqlite3.connect(str(self._db_path))
-        self._conn.row_factory = sqlite3.Row
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._pool_lock = threading.Lock()
+        self._closed = False
         self._create_table()
 
+    @property
+    def _conn(self) -> sqlite3.Connection:
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._open_connection()
+        return conn
+
     def get(self, key: str) -> CacheEntry | None:
-        row = self._conn.execute("SELECT * FROM cache WHERE key = ?", (key,)).fetchone()
+        lookup = self._lookup_cursor()
+        row = lookup.execute(_SELECT_SQL, (key,)).fetchone()
         if row is None:
             return None
         entry = self._row_to_entry(row)
+        # Expiry deletes and LRU bumps autocommit; with WAL and
+        # synchronous=NORMAL that is a log append, not an fsync, and it
+        # never holds the write lock across calls
         if entry.is_expired:
-            self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
-            self._conn.commit()
+            lookup.execute(_DELETE_SQL, (key,))
             return None
-        # Update last_accessed for LRU
-        self._conn.execute(
-            "UPDATE cache SET last_accessed = ? WHERE key = ?",
-            (time.time(), key),
-        )
-        self._conn.commit()
+        lookup.execute(_TOUCH_SQL, (time.time(), key))
         return entry
 
     def set(self, key: str, entry: CacheEntry) -> None:
-        self._evict_if_needed(entry.size_bytes)
+        # One transaction covers the expiry sweep, evictions and the insert
+        with self._transaction():
+            self._evict_if_needed(entry.size_bytes)
+            self._insert(key, entry)
+
+    def _insert(self, key: str, entry: CacheEntry) -> None:
         self._conn.execute(
             """INSERT OR REPLACE INTO cache
                (key, created_at, ttl_seconds, last_accessed,
@@ -70,7 +99,7 @@ class DiskCache:
                 entry.agent_name,
                 entry.agent_version,
                 entry.markdown,
-                json.dumps(entry.blackboard_writes),
+                _encode_writes(entry.blackboard_writes),
                 entry.confidence,
                 entry.token_usage.prompt_tokens,
                 entry.token_usage.completion_tokens,
@@ -79,11 +108,9 @@ class DiskCache:
                 entry.size_bytes,
             ),
         )
-        self._conn.commit()
 
     def clear(self) -> None:
         self._conn.execute("DELETE FROM cache")
-        self._conn.commit()
 
     def invalidate(
         self,
@@ -108,7 +135,6 @@ class DiskCache:
 
         where = " AND ".join(conditions)
         cursor = self._conn.execute(f"DELETE FROM cache WHERE {where}", params)
-        self._conn.commit()
         return cursor.rowcount
 
     @property
@@ -122,7 +148,48 @@ class DiskCache:
         return row[0] / (1024 * 1024)
 
     def close(self) -> None:
-        self._conn.close()
+        with self._pool_lock:
+            self._closed = True
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+
+    def _open_connection(self) -> sqlite3.Connection:
+        # Connections open lazily per thread, so without this check any
+        # access after close() would quietly reopen the database
+        if self._closed:
+            raise sqlite3.ProgrammingError("Cannot operate on a closed cache.")
+        conn = sqlite3.connect(str(self._db_path), check_same_thread=False, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        _configure(conn)
+        self._local.conn = conn
+        # Dedicated cursor for the lookup path; the statements it runs stay
+        # in sqlite3's statement cache, so they are parsed once
+        self._local.lookup = conn.cursor()
+        with self._pool_lock:
+            self._connections.append(conn)
+        return conn
+
+    def _lookup_cursor(self) -> sqlite3.Cursor:
+        lookup: sqlite3.Cursor | None = getattr(self._local, "lookup", None)
+        if lookup is None:
+            self._open_connection()
+            lookup = self._local.lookup
+        return lookup
+
+    @contextlib.contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        conn = self._conn
+        # IMMEDIATE takes the write lock up front, so a concurrent writer
+        # waits at BEGIN instead of failing to upgrade mid-transaction
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
 
     def _create_table(self) -> None:
         self._conn.execute("""
@@ -145,7 +212,6 @@ class DiskCache:
                 size_bytes INTEGER
             )
         """)
-        self._conn.commit()
 
     def _evict_if_needed(self, new_entry_size: int) -> None:
         # First remove expired entries
@@ -153,30 +219,30 @@ class DiskCache:
             "DELETE FROM cache WHERE created_at + ttl_seconds < ?",
             (time.time(),),
         )
-        self._conn.commit()
 
-        # Then LRU evict if still over limit
-        while True:
-            row = self._conn.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM cache").fetchone()
-            current_size = row[0]
-            if current_size + new_entry_size <= self._max_size_bytes:
-                break
-            # Remove oldest accessed
-            oldest = self._conn.execute(
-                "SELECT key FROM cache ORDER BY last_accessed ASC LIMIT 1"
-            ).fetchone()
-            if oldest is None:
+        # Then LRU evict if still over limit: pick the oldest entries that
+        # free enough space and delete them in one statement
+        row = self._conn.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM cache").fetchone()
+        bytes_to_free = row[0] + new_entry_size - self._max_size_bytes
+        if bytes_to_free <= 0:
+            return
+        victims: list[str] = []
+        cursor = self._conn.execute("SELECT key, size_bytes FROM cache ORDER BY last_accessed ASC")
+        for key, size_bytes in cursor:
+            victims.append(key)
+            bytes_to_free -= size_bytes or 0
+            if bytes_to_free <= 0:
                 break
-            self._conn.execute("DELETE FROM cache WHERE key = ?", (oldest[0],))
-            self._conn.commit()
+        cursor.close()
+        for start in range(0, len(victims), _MAX_SQL_PARAMS):
+            batch = victims[start : start + _MAX_SQL_PARAMS]
+            placeholders = ",".join("?" * len(batch))
+            self._conn.execute(f"DELETE FROM cache WHERE key IN ({placeholders})", batch)
 
     @staticmethod
     def _row_to_entry(row: sqlite3.Row) -> CacheEntry:
-        bb_writes = {}
-        with contextlib.suppress(json.JSONDecodeError, TypeError):
-            bb_writes = json.loads(row["blackboard_writes"]) if row["blackboard_writes"] else {}
-
-        return CacheEntry(
+        # Rows were validated when stored; skip re-validating on every hit
+        return CacheEntry.model_construct(
             key=row["key"],
             created_at=row["created_at"],
             ttl_seconds=row["ttl_seconds"],
@@ -185,12 +251,38 @@ class DiskCache:
             agent_name=row["agent_name"] or "",
             agent_version=row["agent_version"] or "",
             markdown=row["markdown"] or "",
-            blackboard_writes=bb_writes,
+            blackboard_writes=_decode_writes(row["blackboard_writes"]),
             confidence=row["confidence"],
-            token_usage=TokenUsage(
+            token_usage=TokenUsage.model_construct(
                 prompt_tokens=row["prompt_tokens"] or 0,
                 completion_tokens=row["completion_tokens"] or 0,
                 total_tokens=row["total_tokens"] or 0,
             ),
             model_used=row["model_used"] or "",
+            size_bytes=row["size_bytes"] or 0,
         )
+
+
+def _configure(conn: sqlite3.Connection) -> None:
+    # WAL lets readers proceed during writes and, with synchronous=NORMAL,
+    # syncs at checkpoints instead of on every commit
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute(f"PRAGMA mmap_size={_MMAP_SIZE_BYTES}")
+    conn.execute(f"PRAGMA cache_size=-{_PAGE_CACHE_KB}")
+
+
+def _encode_writes(writes: dict[str, Any]) -> str | None:
+    # Most entries carry no blackboard writes; store those as NULL and skip
+    # JSON entirely. The rest are written without whitespace.
+    return _WRITES_ENCODER.encode(writes) if writes else None
+
+
+def _decode_writes(raw: str | None) -> dict[str, Any]:
+    if not raw or raw == "{}":
+        return {}
+    writes: Any = {}
+    with contextlib.suppress(json.JSONDecodeError, TypeError):
+        writes = json.loads(raw)
+    return writes if isinstance(writes, dict) else {}
@@ -4,8 +4,12 @@ from __future__ import annotations
 
 import hashlib
 import json
+from collections.abc import Callable
 from typing import Any
 
+# Sorted keys for determinism; no whitespace to keep the encoded text short
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"), default=str)
+
 
 def generate_cache_key(
     image_hash: str,
@@ -16,14 +20,19 @@ def generate_cache_key(
     model_id: str,
     prompt_hash: str,
     blackboard_snapshot: dict[str, Any] | None = None,
+    blackboard_hash: str | None = None,
 ) -> str:
     """Generate a SHA256 cache key from all deterministic inputs.
 
     The blackboard_snapshot should contain ONLY the regions this agent
     subscribed to (from agent's blackboard.reads). Unsubscribed regions
-    do not affect the cache key.
+    do not affect the cache key. Callers that already hashed the
+    subscribed regions (see :func:`hash_blackboard`) pass blackboard_hash
+    instead, which takes precedence over the snapshot.
     """
-    components = [
+    if blackboard_hash is None:
+        blackboard_hash = _hash_dict(blackboard_snapshot) if blackboard_snapshot else ""
+    components = (
         image_hash,
         pipeline_name,
         step_name,
@@ -31,10 +40,15 @@ def generate_cache_key(
         agent_version,
         model_id,
         prompt_hash,
-        _hash_dict(blackboard_snapshot) if blackboard_snapshot else "",
-    ]
-    combined = "|".join(components)
-    return hashlib.sha256(combined.encode("utf-8")).hexdigest()
+        blackboard_hash,
+    )
+    # Fed incrementally: same digest as hashing "|".join(components),
+    # without building the joined string
+    hasher = hashlib.sha256(components[0].encode("utf-8"))
+    for component in components[1:]:
+        hasher.update(b"|")
+        hasher.update(component.encode("utf-8"))
+    return hasher.hexdigest()
 
 
 def hash_image(image_bytes: bytes) -> str:
@@ -44,11 +58,24 @@ def hash_image(image_bytes: bytes) -> str:
 
 def hash_prompt(system_prompt: str, user_prompt: str) -> str:
     """Hash prompt content for cache key use."""
-    combined = system_prompt + "||" + user_prompt
-    return hashlib.sha256(combined.encode("utf-8")).hexdigest()
+    hasher = hashlib.sha256(system_prompt.encode("utf-8"))
+    hasher.update(b"||")
+    hasher.update(user_prompt.encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def hash_blackboard(feed: Callable[[Any], None]) -> str:
+    """Hash blackboard content streamed by ``feed`` into a SHA256 hasher.
+
+    ``feed`` receives the hasher and calls ``update`` on it, e.g.
+    ``functools.partial(blackboard.hash_into, reads)``.
+    """
+    hasher = hashlib.sha256()
+    feed(hasher)
+    return hasher.hexdigest()
 
 
 def _hash_dict(d: dict[str, Any]) -> str:
-    """Deterministic hash of a dict via sorted JSON."""
-    serialized = json.dumps(d, sort_keys=True, default=str)
+    """Deterministic hash of a dict via sorted, compact JSON."""
+    serialized = _CANONICAL_ENCODER.encode(d)
     return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
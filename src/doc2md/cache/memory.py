@@ -10,7 +10,11 @@ _DEFAULT_MAX_SIZE_MB = 500
 
 
 class MemoryCache:
-    """In-memory LRU cache with size-based eviction."""
+    """In-memory LRU cache with size-based eviction.
+
+    The store is kept in recency order: hits move the key to the end, so
+    eviction pops the least recently used entries from the front.
+    """
 
     def __init__(self, max_size_mb: float = _DEFAULT_MAX_SIZE_MB) -> None:
         self._store: OrderedDict[str, CacheEntry] = OrderedDict()
@@ -24,7 +28,6 @@ class MemoryCache:
         if entry.is_expired:
             self._remove(key)
             return None
-        # Move to end (most recently used)
         self._store.move_to_end(key)
         return entry
 
@@ -32,9 +35,8 @@ class MemoryCache:
         if key in self._store:
             self._remove(key)
         entry_size = entry.size_bytes
-        # Evict until there's room
-        while self._current_size_bytes + entry_size > self._max_size_bytes and self._store:
-            self._evict_oldest()
+        if self._current_size_bytes + entry_size > self._max_size_bytes:
+            self._evict_for(entry_size)
         self._store[key] = entry
         self._current_size_bytes += entry_size
 
@@ -70,14 +72,11 @@ class MemoryCache:
         if entry:
             self._current_size_bytes -= entry.size_bytes
 
-    def _evict_oldest(self) -> None:
-        if self._store:
-            key, _ = self._store.popitem(last=False)
-            # Recalculate; entry already removed from dict
-            self._recalculate_size()
-
-    def _recalculate_size(self) -> None:
-        self._current_size_bytes = sum(e.size_bytes for e in self._store.values())
+    def _evict_for(self, entry_size: int) -> None:
+        """Evict least recently used entries until entry_size fits (or empty)."""
+        while self._store and self._current_size_bytes + entry_size > self._max_size_bytes:
+            _, entry = self._store.popitem(last=False)
+            self._current_size_bytes -= entry.size_bytes
 
 
 def _matches_filter(
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 import time
 from typing import Any
 
@@ -25,15 +26,19 @@ class CacheEntry(BaseModel):
     confidence: float | None = None
     token_usage: TokenUsage = Field(default_factory=TokenUsage)
     model_used: str = ""
+    # Computed once at construction unless given (e.g. loaded from disk)
+    size_bytes: int = 0
+
+    def model_post_init(self, __context: Any) -> None:
+        if not self.size_bytes:
+            self.size_bytes = len(self.markdown.encode("utf-8")) + len(
+                json.dumps(self.blackboard_writes, default=str).encode("utf-8")
+            )
 
     @property
     def is_expired(self) -> bool:
         return time.time() > self.created_at + self.ttl_seconds
 
-    @property
-    def size_bytes(self) -> int:
-        return len(self.markdown.encode("utf-8")) + len(str(self.blackboard_writes).encode("utf-8"))
-
 
 class CacheStats(BaseModel):
     """Aggregate cache statistics."""
@@ -3,23 +3,45 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
+import os
 import sys
+from collections.abc import Callable
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
-from rich.console import Console
-from rich.logging import RichHandler
-from rich.table import Table
 
-from doc2md.config.hierarchy import load_config_hierarchy
+if TYPE_CHECKING:
+    from rich.console import Console
 
-console = Console()
-error_console = Console(stderr=True)
+    from doc2md.types import ConversionResult
+
+_SUPPORTED_SUFFIXES = frozenset({".pdf", ".png", ".jpg", ".jpeg", ".tiff", ".tif", ".bmp", ".webp"})
+
+# Rich and the doc2md internals are imported inside the commands that use
+# them, so `doc2md --help` and shell completion only pay for click.
+
+
+@functools.lru_cache(maxsize=1)
+def _console() -> Console:
+    from rich.console import Console
+
+    return Console()
+
+
+@functools.lru_cache(maxsize=1)
+def _error_console() -> Console:
+    from rich.console import Console
+
+    return Console(stderr=True)
 
 
 def _setup_logging(verbosity: int) -> None:
     """Configure logging based on verbosity level."""
+    from rich.logging import RichHandler
+
     level = logging.WARNING
     if verbosity == 1:
         level = logging.INFO
@@ -29,71 +51,114 @@ def _setup_logging(verbosity: int) -> None:
     logging.basicConfig(
         level=level,
         format="%(message)s",
-        handlers=[RichHandler(console=error_console, show_time=False, show_path=False)],
+        handlers=[RichHandler(console=_error_console(), show_time=False, show_path=False)],
     )
 
 
-@click.group()
+class _LazyGroup(click.Group):
+    """Group that builds each subcommand only when it is looked up.
+
+    A normal invocation constructs just the command named on the command
+    line; listing commands (e.g. top-level ``--help``) builds all of them.
+    """
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *_COMMAND_FACTORIES})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in _COMMAND_FACTORIES:
+            command = _COMMAND_FACTORIES[cmd_name]()
+            self.add_command(command, cmd_name)
+        return command
+
+
+_COMMAND_FACTORIES: dict[str, Callable[[], click.Command]] = {}
+
+
+def _lazy_command(
+    name: str,
+) -> Callable[[Callable[[], click.Command]], Callable[[], click.Command]]:
+    """Register a factory that builds the ``name`` subcommand on demand."""
+
+    def register(factory: Callable[[], click.Command]) -> Callable[[], click.Command]:
+        _COMMAND_FACTORIES[name] = factory
+        return factory
+
+    return register
+
+
+@click.group(cls=_LazyGroup)
 @click.version_option(package_name="doc2md")
 def cli() -> None:
     """doc2md — Agentic document-to-markdown converter."""
 
 
-@cli.command()
-@click.argument("input_path", type=click.Path(exists=True))
-@click.option("-o", "--output", type=click.Path(), help="Output file path.")
-@click.option("--output-dir", type=click.Path(), help="Output directory for batch conversion.")
-@click.option("--pipeline", type=str, default=None, help="Pipeline name to use.")
-@click.option("--agent", type=str, default=None, help="Single agent name.")
-@click.option("--model", type=str, default=None, help="Override model for all agents.")
-@click.option("--workers", type=int, default=None, help="Concurrent workers for batch.")
-@click.option("--no-cache", is_flag=True, default=False, help="Disable caching.")
-@click.option("--per-page", is_flag=True, default=False, help="Save each page as a separate file.")
-@click.option(
-    "--custom-dir", type=click.Path(exists=True), help="Directory with custom agent/pipeline YAMLs."
-)
-@click.option("-v", "--verbose", count=True, help="Increase verbosity (-v info, -vv debug).")
-def convert(
-    input_path: str,
-    output: str | None,
-    output_dir: str | None,
-    pipeline: str | None,
-    agent: str | None,
-    model: str | None,
-    workers: int | None,
-    no_cache: bool,
-    per_page: bool,
-    custom_dir: str | None,
-    verbose: int,
-) -> None:
-    """Convert document(s) to markdown."""
-    _setup_logging(verbose)
-
-    config = load_config_hierarchy(
-        model=model,
-        max_workers=workers,
-        cache_disabled=no_cache or None,
+@_lazy_command("convert")
+def _build_convert() -> click.Command:
+    @click.command("convert")
+    @click.argument("input_path", type=click.Path(exists=True))
+    @click.option("-o", "--output", type=click.Path(), help="Output file path.")
+    @click.option("--output-dir", type=click.Path(), help="Output directory for batch conversion.")
+    @click.option("--pipeline", type=str, default=None, help="Pipeline name to use.")
+    @click.option("--agent", type=str, default=None, help="Single agent name.")
+    @click.option("--model", type=str, default=None, help="Override model for all agents.")
+    @click.option("--workers", type=int, default=None, help="Concurrent workers for batch.")
+    @click.option("--no-cache", is_flag=True, default=False, help="Disable caching.")
+    @click.option(
+        "--per-page", is_flag=True, default=False, help="Save each page as a separate file."
+    )
+    @click.option(
+        "--custom-dir",
+        type=click.Path(exists=True),
+        help="Directory with custom agent/pipeline YAMLs.",
     )
+    @click.option("-v", "--verbose", count=True, help="Increase verbosity (-v info, -vv debug).")
+    def convert(
+        input_path: str,
+        output: str | None,
+        output_dir: str | None,
+        pipeline: str | None,
+        agent: str | None,
+        model: str | None,
+        workers: int | None,
+        no_cache: bool,
+        per_page: bool,
+        custom_dir: str | None,
+        verbose: int,
+    ) -> None:
+        """Convert document(s) to markdown."""
+        from doc2md.config.hierarchy import load_config_hierarchy
+
+        _setup_logging(verbose)
+
+        config = load_config_hierarchy(
+            model=model,
+            max_workers=workers,
+            cache_disabled=no_cache or None,
+        )
 
-    input_path_obj = Path(input_path)
+        input_path_obj = Path(input_path)
 
-    if input_path_obj.is_dir():
-        _convert_batch(
-            input_path_obj, output_dir, pipeline, agent, model, config, no_cache, custom_dir
-        )
-    else:
-        _convert_single(
-            input_path_obj,
-            output,
-            pipeline,
-            agent,
-            model,
-            config,
-            no_cache,
-            per_page,
-            custom_dir,
-            verbose,
-        )
+        if input_path_obj.is_dir():
+            _convert_batch(
+                input_path_obj, output_dir, pipeline, agent, model, config, no_cache, custom_dir
+            )
+        else:
+            _convert_single(
+                input_path_obj,
+                output,
+                pipeline,
+                agent,
+                model,
+                config,
+                no_cache,
+                per_page,
+                custom_dir,
+                verbose,
+            )
+
+    return convert
 
 
 def _convert_single(
@@ -121,26 +186,28 @@ def _convert_single(
         custom_dir=custom_dir,
     )
 
+    async def _run() -> ConversionResult:
+        # Conversion and cleanup share one event loop
+        try:
+            return await converter.convert_async(
+                input_path, agent=agent, pipeline=pipeline, model=model
+            )
+        finally:
+            await converter.close()
+
     try:
-        result = asyncio.run(
-            converter.convert_async(input_path, agent=agent, pipeline=pipeline, model=model)
-        )
-    except FileNotFoundError as e:
-        error_console.print(f"[red]Error:[/red] {e}")
-        sys.exit(1)
+        result = asyncio.run(_run())
     except Exception as e:
-        error_console.print(f"[red]Error:[/red] {e}")
+        _error_console().print(f"[red]Error:[/red] {e}")
         sys.exit(1)
-    finally:
-        asyncio.run(converter.close())
 
     # Output
     if output:
         written = result.save(output, per_page=per_page)
         for p in written:
-            console.print(f"[green]Written to {p}[/green]")
+            _console().print(f"[green]Written to {p}[/green]")
     else:
-        console.print(result.markdown)
+        _console().print(result.markdown)
 
     # Verbose summary
     if verbose >= 1:
@@ -160,11 +227,10 @@ def _convert_batch(
     """Convert all supported files in a directory."""
     from doc2md.core import Doc2Md
 
-    supported = {".pdf", ".png", ".jpg", ".jpeg", ".tiff", ".tif", ".bmp", ".webp"}
-    files = [f for f in sorted(input_dir.iterdir()) if f.suffix.lower() in supported]
+    files = _list_supported_files(input_dir)
 
     if not files:
-        error_console.print("[yellow]No supported files found in directory.[/yellow]")
+        _error_console().print("[yellow]No supported files found in directory.[/yellow]")
         return
 
     out_dir = Path(output_dir) if output_dir else input_dir / "markdown"
@@ -174,42 +240,78 @@ def _convert_batch(
     base_url = config.get("base_url")
     max_workers = config.get("max_workers", 5)
 
-    converter = Doc2Md(api_key=api_key, base_url=base_url, no_cache=no_cache, custom_dir=custom_dir)
+    converter = Doc2Md(
+        api_key=api_key,
+        base_url=base_url,
+        no_cache=no_cache,
+        custom_dir=custom_dir,
+        batch_classification=True,
+    )
 
     from doc2md.concurrency.pool import ConcurrencyPool
 
     async def _run() -> None:
         pool = ConcurrencyPool(max_file_workers=max_workers)
-        results = await pool.process_batch(
-            converter.convert_async,
-            file_paths=[str(f) for f in files],
-            agent=agent,
-            pipeline=pipeline,
-            model=model,
-        )
-        for file, result in zip(files, results, strict=False):
-            out_path = out_dir / f"{file.stem}.md"
-            out_path.write_text(result.markdown)
-
-        console.print(f"[green]Converted {len(results)} files to {out_dir}[/green]")
+        converted = 0
+        try:
+            # Each result is written as soon as it arrives, off the event
+            # loop, while the remaining files are still converting
+            async for index, result in pool.iter_batch(
+                converter.convert_async,
+                file_paths=[str(f) for f in files],
+                agent=agent,
+                pipeline=pipeline,
+                model=model,
+            ):
+                out_path = out_dir / f"{files[index].stem}.md"
+                await asyncio.to_thread(_write_markdown, out_path, result.markdown)
+                converted += 1
+                _console().print(f"[green]Written to {out_path}[/green]")
+        finally:
+            await converter.close()
+
+        _console().print(f"[green]Converted {converted} files to {out_dir}[/green]")
 
     try:
         asyncio.run(_run())
     except Exception as e:
-        error_console.print(f"[red]Error during batch conversion:[/red] {e}")
+        _error_console().print(f"[red]Error during batch conversion:[/red] {e}")
         sys.exit(1)
+
+
+def _write_markdown(path: Path, markdown: str) -> None:
+    """Write markdown to path as UTF-8 with a single open and raw writes."""
+    data = memoryview(markdown.encode("utf-8"))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data) :]
     finally:
-        asyncio.run(converter.close())
+        os.close(fd)
+
+
+def _list_supported_files(input_dir: Path) -> list[Path]:
+    """Supported documents directly inside input_dir, sorted by name."""
+    # scandir filters on the entry name before any Path is built
+    with os.scandir(input_dir) as entries:
+        names = [
+            entry.name
+            for entry in entries
+            if os.path.splitext(entry.name)[1].lower() in _SUPPORTED_SUFFIXES and entry.is_file()
+        ]
+    return [input_dir / name for name in sorted(names)]
 
 
 def _print_summary(result: object, verbose: int) -> None:
     """Print a conversion summary."""
+    from rich.table import Table
+
     from doc2md.types import ConversionResult
 
     if not isinstance(result, ConversionResult):
         return
 
-    error_console.print()
+    _error_console().print()
     table = Table(title="Conversion Summary", show_header=True)
     table.add_column("Field", style="cyan")
     table.add_column("Value")
@@ -232,7 +334,7 @@ def _print_summary(result: object, verbose: int) -> None:
         f"{usage.total_tokens:,} (prompt: {usage.prompt_tokens:,}, completion: {usage.completion_tokens:,})",
     )
 
-    error_console.print(table)
+    _error_console().print(table)
 
     # Show step details at -vv
     if verbose >= 2 and result.steps:
@@ -252,88 +354,102 @@ def _print_summary(result: object, verbose: int) -> None:
                 "yes" if step.cached else "no",
                 conf,
             )
-        error_console.print(step_table)
+        _error_console().print(step_table)
 
 
-@cli.command("pipelines")
-def list_pipelines() -> None:
-    """List available pipelines."""
-    from doc2md.agents.registry import PipelineRegistry
+@_lazy_command("pipelines")
+def _build_pipelines() -> click.Command:
+    @click.command("pipelines")
+    def list_pipelines() -> None:
+        """List available pipelines."""
+        from rich.table import Table
 
-    registry = PipelineRegistry()
+        from doc2md.agents.registry import PipelineRegistry
 
-    table = Table(title="Available Pipelines", show_header=True)
-    table.add_column("Name", style="cyan")
-    table.add_column("Version")
-    table.add_column("Description")
-    table.add_column("Steps")
+        registry = PipelineRegistry()
 
-    for info in sorted(registry.list_pipelines(), key=lambda p: p.name):
-        table.add_row(
-            info.name,
-            info.version,
-            info.description or "-",
-            str(info.step_count),
-        )
+        table = Table(title="Available Pipelines", show_header=True)
+        table.add_column("Name", style="cyan")
+        table.add_column("Version")
+        table.add_column("Description")
+        table.add_column("Steps")
 
-    console.print(table)
+        for info in sorted(registry.list_pipelines(), key=lambda p: p.name):
+            table.add_row(
+                info.name,
+                info.version,
+                info.description or "-",
+                str(info.step_count),
+            )
 
+        _console().print(table)
 
-@cli.group()
-def cache() -> None:
-    """Cache management commands."""
+    return list_pipelines
 
 
-@cache.command("stats")
-def cache_stats() -> None:
-    """Show cache statistics."""
-    from doc2md.cache.manager import CacheManager
+@_lazy_command("cache")
+def _build_cache() -> click.Command:
+    @click.group("cache")
+    def cache() -> None:
+        """Cache management commands."""
 
-    mgr = CacheManager()
+    @cache.command("stats")
+    def cache_stats() -> None:
+        """Show cache statistics."""
+        from rich.table import Table
 
-    table = Table(title="Cache Statistics", show_header=True)
-    table.add_column("Metric", style="cyan")
-    table.add_column("Value")
+        from doc2md.cache.manager import CacheManager
 
-    stats = mgr.stats()
-    table.add_row("Entries", str(stats.entries))
-    table.add_row("Size (MB)", f"{stats.size_mb:.1f}")
-    table.add_row("Hits", str(stats.hits))
-    table.add_row("Misses", str(stats.misses))
-    table.add_row("Hit rate", f"{stats.hit_rate:.1%}")
-    table.add_row("Tokens saved", f"{stats.tokens_saved:,}")
+        mgr = CacheManager()
 
-    console.print(table)
-    mgr.close()
+        table = Table(title="Cache Statistics", show_header=True)
+        table.add_column("Metric", style="cyan")
+        table.add_column("Value")
 
+        stats = mgr.stats()
+        table.add_row("Entries", str(stats.entries))
+        table.add_row("Size (MB)", f"{stats.size_mb:.1f}")
+        table.add_row("Hits", str(stats.hits))
+        table.add_row("Misses", str(stats.misses))
+        table.add_row("Hit rate", f"{stats.hit_rate:.1%}")
+        table.add_row("Tokens saved", f"{stats.tokens_saved:,}")
 
-@cache.command("clear")
-@click.confirmation_option(prompt="Are you sure you want to clear the cache?")
-def cache_clear() -> None:
-    """Clear all cached data."""
-    from doc2md.cache.manager import CacheManager
+        _console().print(table)
+        mgr.close()
 
-    mgr = CacheManager()
-    mgr.clear()
-    mgr.close()
-    console.print("[green]Cache cleared.[/green]")
+    @cache.command("clear")
+    @click.confirmation_option(prompt="Are you sure you want to clear the cache?")
+    def cache_clear() -> None:
+        """Clear all cached data."""
+        from doc2md.cache.manager import CacheManager
 
+        mgr = CacheManager()
+        mgr.clear()
+        mgr.close()
+        _console().print("[green]Cache cleared.[/green]")
 
-@cli.command("validate-pipeline")
-@click.argument("pipeline_yaml", type=click.Path(exists=True))
-def validate_pipeline(pipeline_yaml: str) -> None:
-    """Validate a pipeline YAML file."""
-    from doc2md.config.loader import load_pipeline_yaml
+    return cache
 
-    try:
-        config = load_pipeline_yaml(pipeline_yaml)
-        console.print(f"[green]Valid pipeline:[/green] {config.name} v{config.version}")
-        console.print(f"  Steps: {len(config.steps)}")
-        for step in config.steps:
-            console.print(f"    - {step.name} ({step.type.value})")
-    except Exception as e:
-        error_console.print(f"[red]Invalid pipeline:[/red] {e}")
-        sys.exit(1)
+
+@_lazy_command("validate-pipeline")
+def _build_validate_pipeline() -> click.Command:
+    @click.command("validate-pipeline")
+    @click.argument("pipeline_yaml", type=click.Path(exists=True))
+    def validate_pipeline(pipeline_yaml: str) -> None:
+        """Validate a pipeline YAML file."""
+        from doc2md.config.loader import load_pipeline_yaml
+
+        try:
+            config = load_pipeline_yaml(pipeline_yaml)
+            _console().print(f"[green]Valid pipeline:[/green] {config.name} v{config.version}")
+            _console().print(f"  Steps: {len(config.steps)}")
+            for step in config.steps:
+                _console().print(f"    - {step.name} ({step.type.value})")
+        except Exception as e:
+            _error_console().print(f"[red]Invalid pipeline:[/red] {e}")
+            sys.exit(1)
+
+    return validate_pipeline
 
 
 def main() -> None:
@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
+import os
+from collections.abc import AsyncIterator
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -14,12 +17,17 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# posix_fadvise is unavailable on macOS and Windows; prefetching is skipped there
+_CAN_PREFETCH = hasattr(os, "posix_fadvise")
+
 
 class ConcurrencyPool:
-    """Two-tier async dispatcher: files → pages, with semaphore + rate limiting.
+    """Two-tier async dispatcher: files → pages, with rate limiting.
 
-    Tier 1: File workers process documents concurrently.
-    Tier 2: Page workers within each file run concurrently (bounded by semaphore).
+    Tier 1: File workers process documents concurrently; the number of
+    worker tasks is the bound, so no semaphore is involved.
+    Tier 2: Page workers within each file run concurrently (bounded by the
+    pipeline's page semaphore).
     """
 
     def __init__(
@@ -31,7 +39,6 @@ class ConcurrencyPool:
         self._max_file_workers = max_file_workers
         self._max_page_workers = max_page_workers
         self._rate_limiter = rate_limiter or RateLimiter()
-        self._semaphore = asyncio.Semaphore(max_page_workers)
 
     @property
     def rate_limiter(self) -> RateLimiter:
@@ -52,33 +59,70 @@ class ConcurrencyPool:
 
         Returns list of ConversionResult (one per file, in input order).
         """
-        # Limit concurrent files
-        file_semaphore = asyncio.Semaphore(self._max_file_workers)
-
-        async def worker(path: str | Path) -> ConversionResult:
-            async with file_semaphore:
-                # Rate limit at the file level
-                await self._rate_limiter.acquire()
-                return await convert_fn(path, **kwargs)  # type: ignore[operator]
+        results: dict[int, ConversionResult] = {}
+        async for index, result in self.iter_batch(convert_fn, file_paths, **kwargs):
+            results[index] = result
+        # iter_batch yields exactly one result per input, failures included
+        return [results[index] for index in range(len(file_paths))]
 
-        tasks = [worker(p) for p in file_paths]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+    async def iter_batch(
+        self,
+        convert_fn: object,
+        file_paths: list[str | Path],
+        **kwargs: object,
+    ) -> AsyncIterator[tuple[int, ConversionResult]]:
+        """Process a batch of files, yielding (index, result) as each completes.
 
-        # Convert exceptions to failed results
+        Same arguments as :meth:`process_batch`. Callers that write results
+        out as they arrive need not hold the whole batch in memory.
+        """
         from doc2md.types import ConversionResult as CR
 
-        final: list[ConversionResult] = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.error("File %s failed: %s", file_paths[i], result)
-                final.append(
-                    CR(
-                        markdown="",
-                        pages_processed=0,
-                        pages_failed=[0],
-                    )
-                )
-            else:
-                final.append(result)
-
-        return final
+        # A fixed set of workers drains a shared iterator, so only
+        # max_file_workers tasks exist however large the batch is. The
+        # bounded queue stops workers running far ahead of the consumer.
+        pending = enumerate(file_paths)
+        done: asyncio.Queue[tuple[int, ConversionResult]] = asyncio.Queue(
+            maxsize=self._max_file_workers
+        )
+
+        async def worker() -> None:
+            for index, path in pending:
+                # Warm the page cache for the file this worker's peers will
+                # pick up next, so its read overlaps with this file's VLM calls.
+                # WILLNEED only queues readahead, so it is cheap enough inline.
+                upcoming = index + self._max_file_workers
+                if _CAN_PREFETCH and upcoming < len(file_paths):
+                    _prefetch(file_paths[upcoming])
+                try:
+                    # Rate limit at the file level
+                    await self._rate_limiter.acquire()
+                    result = await convert_fn(path, **kwargs)  # type: ignore[operator]
+                except asyncio.CancelledError:
+                    raise
+                except BaseException as e:
+                    # Convert every other failure to a failed result, so the
+                    # consumer is never left waiting on a dead worker
+                    logger.error("File %s failed: %s", path, e)
+                    result = CR(markdown="", pages_processed=0, pages_failed=[0])
+                await done.put((index, result))
+
+        worker_count = min(self._max_file_workers, len(file_paths))
+        workers = [asyncio.create_task(worker()) for _ in range(worker_count)]
+        try:
+            for _ in range(len(file_paths)):
+                yield await done.get()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+
+def _prefetch(path: str | Path) -> None:
+    """Ask the OS to start reading ``path`` into the page cache."""
+    with contextlib.suppress(OSError):
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
@@ -9,11 +9,21 @@ import time
 logger = logging.getLogger(__name__)
 
 
+_WINDOW_SECONDS = 60.0
+
+
 class RateLimiter:
     """Dual token-bucket rate limiter for requests/min and tokens/min.
 
     Both RPM and TPM buckets must have capacity before a request proceeds.
     Buckets refill continuously at their respective rates.
+
+    Each bucket is kept in "virtual scheduling" form: a single timestamp at
+    which the bucket would be full again. A full bucket holds one window
+    (60 s) of capacity, so a request may start once the timestamp, advanced
+    by its cost, is no more than a window ahead of now. Every caller reserves
+    its slot immediately and sleeps at most once, so waiters never re-check
+    or contend with each other.
     """
 
     def __init__(
@@ -23,13 +33,14 @@ class RateLimiter:
     ) -> None:
         self._rpm_limit = rpm_limit
         self._tpm_limit = tpm_limit
+        # Seconds of bucket capacity one request / one token consumes
+        self._rpm_interval = _WINDOW_SECONDS / rpm_limit
+        self._tpm_interval = _WINDOW_SECONDS / tpm_limit
 
-        # Bucket state
-        self._rpm_tokens = float(rpm_limit)
-        self._tpm_tokens = float(tpm_limit)
-        self._last_refill = time.monotonic()
-
-        self._lock = asyncio.Lock()
+        # Bucket state: time at which each bucket is full again
+        now = time.monotonic()
+        self._next_rpm = now
+        self._next_tpm = now
 
         # Stats
         self._total_requests = 0
@@ -37,44 +48,24 @@ class RateLimiter:
         self._total_wait_seconds = 0.0
 
     async def acquire(self, estimated_tokens: int = 1000) -> float:
-        """Wait until capacity is available, then deduct.
+        """Reserve capacity, waiting until it is available.
 
         Returns the time spent waiting (seconds).
         """
-        wait_total = 0.0
-
-        async with self._lock:
-            while True:
-                self._refill()
-
-                # Check both buckets
-                if self._rpm_tokens >= 1 and self._tpm_tokens >= estimated_tokens:
-                    self._rpm_tokens -= 1
-                    self._tpm_tokens -= estimated_tokens
-                    self._total_requests += 1
-                    break
-
-                # Compute wait time until both buckets have capacity
-                rpm_wait = 0.0
-                if self._rpm_tokens < 1:
-                    rpm_wait = (1 - self._rpm_tokens) / (self._rpm_limit / 60.0)
-
-                tpm_wait = 0.0
-                if self._tpm_tokens < estimated_tokens:
-                    tpm_wait = (estimated_tokens - self._tpm_tokens) / (self._tpm_limit / 60.0)
-
-                wait_time = max(rpm_wait, tpm_wait, 0.01)
-                wait_total += wait_time
-
-                # Release lock during sleep so other coroutines aren't blocked
-                self._lock.release()
-                try:
-                    await asyncio.sleep(wait_time)
-                finally:
-                    await self._lock.acquire()
+        # One clock read per call. There is no await between reading and
+        # advancing the schedule, so the reservation is atomic on the event
+        # loop without a lock.
+        now = time.monotonic()
+        self._next_rpm = max(self._next_rpm, now) + self._rpm_interval
+        self._next_tpm = max(self._next_tpm, now) + estimated_tokens * self._tpm_interval
+        self._total_requests += 1
 
-        self._total_wait_seconds += wait_total
-        return wait_total
+        wait = max(self._next_rpm, self._next_tpm) - _WINDOW_SECONDS - now
+        if wait <= 0:
+            return 0.0
+        self._total_wait_seconds += wait
+        await asyncio.sleep(wait)
+        return wait
 
     def record_usage(self, input_tokens: int, output_tokens: int) -> None:
         """Record actual token usage after a VLM response (for stats)."""
@@ -83,10 +74,10 @@ class RateLimiter:
     @property
     def stats(self) -> dict:
         """Return current rate limiter statistics."""
-        self._refill()
+        now = time.monotonic()
         return {
-            "rpm_available": self._rpm_tokens,
-            "tpm_available": self._tpm_tokens,
+            "rpm_available": _available(self._next_rpm, self._rpm_limit, now),
+            "tpm_available": _available(self._next_tpm, self._tpm_limit, now),
             "total_requests": self._total_requests,
             "total_tokens_used": self._total_tokens_used,
             "total_wait_seconds": self._total_wait_seconds,
@@ -94,24 +85,15 @@ class RateLimiter:
 
     def reset(self) -> None:
         """Reset all state (for testing)."""
-        self._rpm_tokens = float(self._rpm_limit)
-        self._tpm_tokens = float(self._tpm_limit)
-        self._last_refill = time.monotonic()
+        now = time.monotonic()
+        self._next_rpm = now
+        self._next_tpm = now
         self._total_requests = 0
         self._total_tokens_used = 0
         self._total_wait_seconds = 0.0
 
-    def _refill(self) -> None:
-        """Refill buckets based on elapsed time."""
-        now = time.monotonic()
-        elapsed = now - self._last_refill
-        self._last_refill = now
-
-        self._rpm_tokens = min(
-            float(self._rpm_limit),
-            self._rpm_tokens + elapsed * (self._rpm_limit / 60.0),
-        )
-        self._tpm_tokens = min(
-            float(self._tpm_limit),
-            self._tpm_tokens + elapsed * (self._tpm_limit / 60.0),
-        )
+
+def _available(next_full: float, limit: int, now: float) -> float:
+    """Capacity left in a bucket that is full again at ``next_full``."""
+    backlog = max(next_full - now, 0.0)
+    return max(limit - backlog * limit / _WINDOW_SECONDS, 0.0)
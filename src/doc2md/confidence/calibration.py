@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import bisect
+import functools
 import logging
 
 logger = logging.getLogger(__name__)
 
+_CURVE_CACHE_SIZE = 64
+
 
 def calibrate(
     raw_score: float,
@@ -50,24 +54,36 @@ def _manual_calibrate(
     if not curve:
         return raw_score
 
-    # Sort by raw value
-    sorted_curve = sorted(curve, key=lambda p: p[0])
+    xs, ys = _sorted_curve(_curve_key(curve))
 
     # Below curve range
-    if raw_score <= sorted_curve[0][0]:
-        return max(0.0, sorted_curve[0][1])
+    if raw_score <= xs[0]:
+        return max(0.0, ys[0])
 
     # Above curve range
-    if raw_score >= sorted_curve[-1][0]:
-        return min(1.0, sorted_curve[-1][1])
-
-    # Linear interpolation between two nearest points
-    for i in range(len(sorted_curve) - 1):
-        raw_lo, cal_lo = sorted_curve[i]
-        raw_hi, cal_hi = sorted_curve[i + 1]
-        if raw_lo <= raw_score <= raw_hi:
-            t = (raw_score - raw_lo) / (raw_hi - raw_lo) if raw_hi != raw_lo else 0.0
-            calibrated = cal_lo + t * (cal_hi - cal_lo)
-            return max(0.0, min(1.0, calibrated))
+    if raw_score >= xs[-1]:
+        return min(1.0, ys[-1])
 
-    return raw_score
+    # Linear interpolation between the two nearest points
+    hi = bisect.bisect_left(xs, raw_score)
+    raw_lo, raw_hi = xs[hi - 1], xs[hi]
+    cal_lo, cal_hi = ys[hi - 1], ys[hi]
+    t = (raw_score - raw_lo) / (raw_hi - raw_lo) if raw_hi != raw_lo else 0.0
+    calibrated = cal_lo + t * (cal_hi - cal_lo)
+    return max(0.0, min(1.0, calibrated))
+
+
+def _curve_key(curve: list[list[float]]) -> tuple[tuple[float, float], ...]:
+    return tuple((point[0], point[1]) for point in curve)
+
+
+@functools.lru_cache(maxsize=_CURVE_CACHE_SIZE)
+def _sorted_curve(
+    points: tuple[tuple[float, float], ...],
+) -> tuple[tuple[float, ...], tuple[float, ...]]:
+    """Split a curve into raw and calibrated columns, sorted by raw value.
+
+    Curves come from agent YAML and rarely change, so each is sorted once.
+    """
+    ordered = sorted(points, key=lambda p: p[0])
+    return tuple(p[0] for p in ordered), tuple(p[1] for p in ordered)
@@ -2,11 +2,21 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel
+import functools
+import math
+from collections.abc import Mapping
+from dataclasses import dataclass
 
+_WEIGHT_CACHE_SIZE = 256
 
-class SignalResult(BaseModel):
-    """Result from a single confidence signal."""
+
+@dataclass(frozen=True, slots=True)
+class SignalResult:
+    """Result from a single confidence signal.
+
+    A plain dataclass: every producer is internal, so construction skips
+    pydantic validation. StepConfidenceReport still serializes it.
+    """
 
     name: str
     score: float = 0.0
@@ -16,7 +26,7 @@ class SignalResult(BaseModel):
 
 def combine_signals(
     signals: list[SignalResult],
-    weights: dict[str, float],
+    weights: Mapping[str, float],
 ) -> tuple[float, dict[str, float]]:
     """Combine signal scores using weighted average with adaptive redistribution.
 
@@ -34,21 +44,31 @@ def combine_signals(
     if not available:
         return 0.0, {}
 
-    # Compute effective weights (redistribute unavailable weight)
-    effective = _redistribute_weights(weights, set(available.keys()))
+    # Compute effective weights (redistribute unavailable weight). Agents
+    # see only a handful of weight configs and availability masks, so the
+    # redistribution is memoized; callers get their own copy.
+    effective = dict(_cached_weights(tuple(weights.items()), frozenset(available)))
 
     # Weighted average
     combined = sum(
-        available[name].score * weight for name, weight in effective.items() if name in available
+        [available[name].score * weight for name, weight in effective.items() if name in available]
     )
 
     return combined, effective
 
 
+@functools.lru_cache(maxsize=_WEIGHT_CACHE_SIZE)
+def _cached_weights(
+    weight_items: tuple[tuple[str, float], ...],
+    available_names: frozenset[str],
+) -> Mapping[str, float]:
+    return _redistribute_weights(dict(weight_items), set(available_names))
+
+
 def _redistribute_weights(
-    original: dict[str, float],
+    original: Mapping[str, float],
     available_names: set[str],
-) -> dict[str, float]:
+) -> Mapping[str, float]:
     """Redistribute weights from unavailable signals to available ones.
 
     Proportional redistribution: each available signal gets its share
@@ -58,7 +78,16 @@ def _redistribute_weights(
         return {}
 
     # Calculate total weight of available signals
-    available_weight_sum = sum(original.get(name, 0.0) for name in available_names)
+    available_weight_sum = sum([original.get(name, 0.0) for name in available_names])
+
+    # Common case: every weighted signal is available and the weights are
+    # already normalized, so there is nothing to redistribute
+    if (
+        len(available_names) == len(original)
+        and available_names >= original.keys()
+        and math.isclose(available_weight_sum, 1.0)
+    ):
+        return original
 
     if available_weight_sum <= 0:
         # Equal weights if no original weights defined for available signals
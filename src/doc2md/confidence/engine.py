@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
+from types import MappingProxyType
 
 from doc2md.confidence.calibration import calibrate
 from doc2md.confidence.combiner import SignalResult, combine_signals
@@ -22,14 +24,17 @@ from doc2md.types import AgentConfig, StepResult, VLMResponse
 
 logger = logging.getLogger(__name__)
 
-# Default weights when agent YAML doesn't specify any
-_DEFAULT_WEIGHTS: dict[str, float] = {
-    "vlm_self_assessment": 0.30,
-    "logprobs_analysis": 0.20,
-    "validation_pass_rate": 0.20,
-    "completeness_check": 0.15,
-    "image_quality": 0.15,
-}
+# Default weights when agent YAML doesn't specify any (read-only: shared by
+# every step that falls back to them)
+_DEFAULT_WEIGHTS: Mapping[str, float] = MappingProxyType(
+    {
+        "vlm_self_assessment": 0.30,
+        "logprobs_analysis": 0.20,
+        "validation_pass_rate": 0.20,
+        "completeness_check": 0.15,
+        "image_quality": 0.15,
+    }
+)
 
 
 class ConfidenceEngine:
@@ -73,13 +78,13 @@ class ConfidenceEngine:
             f"calibrated={calibrated:.3f}",
             f"level={level.value}",
         ]
-        available_signals = [s for s in signals if s.available]
-        if available_signals:
-            reasoning_parts.append(
-                f"signals: {', '.join(s.name + '=' + f'{s.score:.2f}' for s in available_signals)}"
-            )
+        signal_parts = [f"{s.name}={s.score:.2f}" for s in signals if s.available]
+        if signal_parts:
+            reasoning_parts.append("signals: " + ", ".join(signal_parts))
 
-        return StepConfidenceReport(
+        # Every field is built here from already-typed values, so skip
+        # pydantic validation on this per-step path
+        return StepConfidenceReport.model_construct(
             step_name=step_result.step_name,
             agent_name=step_result.agent_name,
             raw_score=raw_score,
@@ -102,11 +107,11 @@ class ConfidenceEngine:
         overall = aggregate_step_scores(step_scores, strategy, step_weights)
         level = score_to_level(overall)
 
-        return ConfidenceReport(
+        return ConfidenceReport.model_construct(
             overall=overall,
             level=level,
             needs_human_review=needs_human_review(overall),
-            per_step=step_reports,
+            per_step=dict(step_reports),
             strategy=strategy,
             reasoning=f"Aggregated {len(step_reports)} steps via {strategy}: {overall:.3f}",
         )
@@ -119,9 +124,7 @@ class ConfidenceEngine:
         image_bytes: bytes | None,
     ) -> list[SignalResult]:
         """Collect all configured confidence signals."""
-        configured = (
-            set(agent_config.confidence.signals) if agent_config.confidence.signals else set()
-        )
+        configured = agent_config.confidence.configured_signals
         # If no signals configured, use all available
         use_all = not configured
 
@@ -141,10 +144,15 @@ class ConfidenceEngine:
                 )
             )
 
+        # Signals whose inputs are missing are reported unavailable without
+        # calling the compute function
+
         # Logprobs
         if use_all or "logprobs_analysis" in configured:
-            logprobs_data = vlm_response.logprobs if vlm_response else None
-            score, available, reasoning = compute_logprobs(logprobs_data)
+            if vlm_response is None or not vlm_response.logprobs:
+                score, available, reasoning = 0.0, False, "Model did not return logprobs"
+            else:
+                score, available, reasoning = compute_logprobs(vlm_response.logprobs)
             signals.append(
                 SignalResult(
                     name="logprobs_analysis",
@@ -156,10 +164,13 @@ class ConfidenceEngine:
 
         # Validation pass rate
         if use_all or "validation_pass_rate" in configured:
-            score, available, reasoning = compute_validation_pass_rate(
-                step_result.markdown,
-                agent_config.validation,
-            )
+            if not agent_config.validation:
+                score, available, reasoning = 0.0, False, "No validation rules configured"
+            else:
+                score, available, reasoning = compute_validation_pass_rate(
+                    step_result.markdown,
+                    agent_config.validation,
+                )
             signals.append(
                 SignalResult(
                     name="validation_pass_rate",
@@ -186,7 +197,10 @@ class ConfidenceEngine:
 
         # Image quality
         if use_all or "image_quality" in configured:
-            score, available, reasoning = compute_image_quality(image_bytes)
+            if image_bytes is None:
+                score, available, reasoning = 0.0, False, "No image provided"
+            else:
+                score, available, reasoning = compute_image_quality(image_bytes)
             signals.append(
                 SignalResult(
                     name="image_quality",
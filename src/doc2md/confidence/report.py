@@ -2,17 +2,27 @@
 
 from __future__ import annotations
 
+import bisect
+import math
+
+import numpy as np
 from pydantic import BaseModel, Field
 
 from doc2md.confidence.combiner import SignalResult
 from doc2md.types import ConfidenceLevel
 
-# Decision thresholds
-_THRESHOLDS: list[tuple[float, ConfidenceLevel]] = [
-    (0.8, ConfidenceLevel.HIGH),
-    (0.6, ConfidenceLevel.MEDIUM),
-    (0.3, ConfidenceLevel.LOW),
-]
+# Decision thresholds: a score at or above _THRESHOLD_POINTS[i] maps to
+# _THRESHOLD_LEVELS[i + 1]
+_THRESHOLD_POINTS: tuple[float, ...] = (0.3, 0.6, 0.8)
+_THRESHOLD_LEVELS: tuple[ConfidenceLevel, ...] = (
+    ConfidenceLevel.FAILED,
+    ConfidenceLevel.LOW,
+    ConfidenceLevel.MEDIUM,
+    ConfidenceLevel.HIGH,
+)
+
+# Above this many steps the weighted average is computed with NumPy
+_VECTORIZE_MIN_STEPS = 16
 
 
 class StepConfidenceReport(BaseModel):
@@ -42,10 +52,10 @@ class ConfidenceReport(BaseModel):
 
 def score_to_level(score: float) -> ConfidenceLevel:
     """Convert a numeric confidence score to a ConfidenceLevel."""
-    for threshold, level in _THRESHOLDS:
-        if score >= threshold:
-            return level
-    return ConfidenceLevel.FAILED
+    # NaN compares false against every threshold; bisect would rank it highest
+    if math.isnan(score):
+        return ConfidenceLevel.FAILED
+    return _THRESHOLD_LEVELS[bisect.bisect_right(_THRESHOLD_POINTS, score)]
 
 
 def needs_human_review(score: float) -> bool:
@@ -73,9 +83,20 @@ def aggregate_step_scores(
 
     if strategy == "last_step":
         # Use the last step's score (dict is ordered in Python 3.7+)
-        return list(step_scores.values())[-1]
+        return next(reversed(step_scores.values()))
 
     # weighted_average (default)
+    if step_weights and len(step_scores) > _VECTORIZE_MIN_STEPS:
+        count = len(step_scores)
+        scores = np.fromiter(step_scores.values(), dtype=np.float64, count=count)
+        weights = np.fromiter(
+            (step_weights.get(name, 0.0) for name in step_scores), dtype=np.float64, count=count
+        )
+        total = weights.sum()
+        if total > 0:
+            return float(scores @ weights / total)
+        return float(scores.mean())
+
     if step_weights:
         total_weight = sum(step_weights.get(name, 0.0) for name in step_scores)
         if total_weight > 0:
@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-import re
-
 
 def compute_completeness(
     markdown: str,
@@ -11,7 +9,8 @@ def compute_completeness(
 ) -> tuple[float, bool, str]:
     """Check how many expected fields appear in the markdown output.
 
-    Fields are matched case-insensitively as substrings or markdown headers.
+    Fields are matched case-insensitively as substrings (which also covers
+    fields that appear in markdown headers).
 
     Returns (score, available, reasoning).
     """
@@ -22,11 +21,11 @@ def compute_completeness(
     missing: list[str] = []
     lower_md = markdown.lower()
 
+    # One substring scan per field over the lowercased text. A header
+    # containing the field is itself a substring match, so no second,
+    # regex-based scan is needed.
     for field in expected_fields:
-        # Check as substring (case-insensitive)
-        if field.lower() in lower_md or re.search(
-            rf"#{1, 6}\s+.*{re.escape(field)}", markdown, re.IGNORECASE
-        ):
+        if field.lower() in lower_md:
             found.append(field)
         else:
             missing.append(field)
@@ -5,6 +5,8 @@ from __future__ import annotations
 import math
 from typing import Any
 
+_SPECIAL_TOKENS = frozenset({"<|endoftext|>", "<|begin_of_text|>", "<|end_of_text|>"})
+
 
 def compute_logprobs(
     logprobs: list[dict[str, Any]] | None,
@@ -19,16 +21,13 @@ def compute_logprobs(
     if not logprobs:
         return 0.0, False, "Model did not return logprobs"
 
-    log_probs: list[float] = []
-    for token_data in logprobs:
-        lp = token_data.get("logprob")
-        if lp is None:
-            continue
-        # Skip special tokens
-        token = token_data.get("token", "")
-        if token in ("<|endoftext|>", "<|begin_of_text|>", "<|end_of_text|>"):
-            continue
-        log_probs.append(lp)
+    # Skip special tokens
+    log_probs = [
+        lp
+        for token_data in logprobs
+        if (lp := token_data.get("logprob")) is not None
+        and token_data.get("token", "") not in _SPECIAL_TOKENS
+    ]
 
     if not log_probs:
         return 0.0, False, "No usable logprob tokens found"
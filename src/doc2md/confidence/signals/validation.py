@@ -7,11 +7,35 @@ from typing import Any
 
 from doc2md.types import ValidationRule
 
+_HEADER_LINE_RE = re.compile(r"^#{1,6}\s", re.MULTILINE)
+_HEADER_PREFIX_RE = re.compile(r"#{1,6}\s")
+
+
+# Bits set by _scan_all, one per parameter-free built-in rule
+_NOT_EMPTY = 1
+_HAS_HEADER = 2
+_CONTENT_AFTER_HEADER = 4
+
+
+def _scan_all(markdown: str) -> int:
+    """Evaluate every parameter-free built-in rule at once, as a bitmask."""
+    stripped = markdown.strip()
+    if not stripped:
+        return _CONTENT_AFTER_HEADER
+    mask = _NOT_EMPTY
+    if _HEADER_LINE_RE.search(markdown) is not None:
+        mask |= _HAS_HEADER
+    # Only the last line can be a header with nothing after it
+    last_line = stripped[stripped.rfind("\n") + 1 :]
+    if _HEADER_PREFIX_RE.match(last_line) is None:
+        mask |= _CONTENT_AFTER_HEADER
+    return mask
+
 
 # Built-in validation rules
 def _rule_has_header(markdown: str, **params: Any) -> bool:
     """Check that the markdown contains at least one header."""
-    return bool(re.search(r"^#{1,6}\s", markdown, re.MULTILINE))
+    return bool(_scan_all(markdown) & _HAS_HEADER)
 
 
 def _rule_min_length(markdown: str, min_chars: int = 50, **params: Any) -> bool:
@@ -21,16 +45,12 @@ def _rule_min_length(markdown: str, min_chars: int = 50, **params: Any) -> bool:
 
 def _rule_no_empty_output(markdown: str, **params: Any) -> bool:
     """Check markdown is not empty or whitespace-only."""
-    return bool(markdown.strip())
+    return bool(_scan_all(markdown) & _NOT_EMPTY)
 
 
 def _rule_has_content_after_header(markdown: str, **params: Any) -> bool:
     """Check that headers are followed by content."""
-    lines = markdown.strip().split("\n")
-    for i, line in enumerate(lines):
-        if re.match(r"^#{1,6}\s", line) and i == len(lines) - 1:
-            return False  # Header is last line with no content after
-    return True
+    return bool(_scan_all(markdown) & _CONTENT_AFTER_HEADER)
 
 
 _BUILTIN_RULES: dict[str, Any] = {
@@ -40,6 +60,12 @@ _BUILTIN_RULES: dict[str, Any] = {
     "has_content_after_header": _rule_has_content_after_header,
 }
 
+_MASK_RULES: dict[str, int] = {
+    "has_header": _HAS_HEADER,
+    "no_empty_output": _NOT_EMPTY,
+    "has_content_after_header": _CONTENT_AFTER_HEADER,
+}
+
 
 def compute_validation_pass_rate(
     markdown: str,
@@ -55,8 +81,19 @@ def compute_validation_pass_rate(
     passed = 0
     total = len(rules)
     failed_names: list[str] = []
+    mask: int | None = None
 
     for rule in rules:
+        bit = _MASK_RULES.get(rule.rule)
+        if bit is not None:
+            # Scan once, however many of these rules are configured
+            if mask is None:
+                mask = _scan_all(markdown)
+            if mask & bit:
+                passed += 1
+            else:
+                failed_names.append(rule.rule)
+            continue
         fn = _BUILTIN_RULES.get(rule.rule)
         if fn is None:
             total -= 1  # Unknown rule doesn't count
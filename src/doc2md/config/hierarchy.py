@@ -18,6 +18,7 @@ from typing import Any
 import yaml
 
 from doc2md.config.defaults import get_defaults
+from doc2md.config.loader import YAML_LOADER
 
 logger = logging.getLogger(__name__)
 
@@ -96,7 +97,7 @@ def _load_yaml_config(path: Path) -> dict[str, Any] | None:
         return None
     try:
         with open(path) as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=YAML_LOADER)
         if isinstance(data, dict):
             return data
         logger.warning("Config file %s is not a mapping, ignoring", path)
@@ -10,6 +10,9 @@ import yaml
 from doc2md.config.schema import PipelineConfig
 from doc2md.types import AgentConfig
 
+# libyaml-backed loader when available; same semantics as yaml.SafeLoader
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def load_agent_yaml(path: str | Path) -> AgentConfig:
     """Load an agent YAML file and return a validated AgentConfig."""
@@ -18,8 +21,13 @@ def load_agent_yaml(path: str | Path) -> AgentConfig:
         raise FileNotFoundError(f"Agent YAML not found: {path}")
 
     with open(path) as f:
-        raw = yaml.safe_load(f)
+        raw = yaml.load(f, Loader=YAML_LOADER)
+
+    return agent_config_from_raw(raw, path)
+
 
+def agent_config_from_raw(raw: Any, path: str | Path) -> AgentConfig:
+    """Validate an already-parsed agent YAML document."""
     if not isinstance(raw, dict) or "agent" not in raw:
         raise ValueError(f"Invalid agent YAML: missing top-level 'agent' key in {path}")
 
@@ -33,7 +41,7 @@ def load_yaml(path: str | Path) -> dict[str, Any]:
         raise FileNotFoundError(f"YAML file not found: {path}")
 
     with open(path) as f:
-        raw = yaml.safe_load(f)
+        raw = yaml.load(f, Loader=YAML_LOADER)
 
     if not isinstance(raw, dict):
         raise ValueError(f"Expected YAML mapping, got {type(raw).__name__} in {path}")
@@ -48,8 +56,13 @@ def load_pipeline_yaml(path: str | Path) -> PipelineConfig:
         raise FileNotFoundError(f"Pipeline YAML not found: {path}")
 
     with open(path) as f:
-        raw = yaml.safe_load(f)
+        raw = yaml.load(f, Loader=YAML_LOADER)
+
+    return pipeline_config_from_raw(raw, path)
+
 
+def pipeline_config_from_raw(raw: Any, path: str | Path) -> PipelineConfig:
+    """Validate an already-parsed pipeline YAML document."""
     if not isinstance(raw, dict) or "pipeline" not in raw:
         raise ValueError(f"Invalid pipeline YAML: missing top-level 'pipeline' key in {path}")
 
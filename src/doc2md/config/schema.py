@@ -37,12 +37,14 @@ class PageSelector(BaseModel):
         if self.raw is None:
             return list(range(1, total_pages + 1))
 
-        result: list[int] = []
+        # Mark selected pages in a bitmap; one scan then yields them sorted
+        # and deduplicated without a set or a sort
+        seen = bytearray(total_pages + 1)
         for item in self.raw:
             if isinstance(item, int):
                 idx = item if item > 0 else total_pages + item + 1
                 if 1 <= idx <= total_pages:
-                    result.append(idx)
+                    seen[idx] = 1
             elif isinstance(item, str) and ":" in item:
                 parts = item.split(":")
                 start = int(parts[0]) if parts[0] else 1
@@ -51,9 +53,11 @@ class PageSelector(BaseModel):
                     start = total_pages + start + 1
                 if end < 0:
                     end = total_pages + end + 1
-                for p in range(max(1, start), min(total_pages, end) + 1):
-                    result.append(p)
-        return sorted(set(result))
+                start = max(1, start)
+                end = min(total_pages, end)
+                if start <= end:
+                    seen[start : end + 1] = b"\x01" * (end - start + 1)
+        return [page for page in range(1, total_pages + 1) if seen[page]]
 
 
 class RouterRule(BaseModel):
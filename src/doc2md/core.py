@@ -4,9 +4,12 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-from doc2md.agents.classifier import ClassificationResult, classify_document
+from doc2md.agents.classifier import ClassificationResult, ClassifierBatcher, classify_document
 from doc2md.agents.engine import AgentEngine
 from doc2md.agents.registry import AgentRegistry, PipelineRegistry
 from doc2md.blackboard.board import Blackboard
@@ -14,11 +17,16 @@ from doc2md.cache.manager import CacheManager
 from doc2md.config.schema import PipelineConfig, StepConfig, StepType
 from doc2md.pipeline.engine import PipelineEngine
 from doc2md.types import AgentConfig, ConversionResult
-from doc2md.utils.image import is_pdf, load_image, pdf_to_images
+from doc2md.utils.image import is_pdf, load_image, pdf_page_count, render_pdf_pages
 from doc2md.vlm.client import AsyncVLMClient
 
 logger = logging.getLogger(__name__)
 
+# PDFs up to this many pages render on a worker thread; larger ones are split
+# into blocks of _PDF_RENDER_BLOCK pages rendered across processes
+_PDF_INLINE_MAX_PAGES = 4
+_PDF_RENDER_BLOCK = 8
+
 
 def _run_async(coro):
     """Run a coroutine, handling both standalone and nested event loops (e.g. Jupyter)."""
@@ -48,10 +56,22 @@ class Doc2Md:
         cache_memory_mb: float = 500,
         cache_disk_mb: float = 5000,
         cache_db_path: Path | None = None,
+        batch_classification: bool = False,
     ) -> None:
+        """Create a converter.
+
+        Args:
+            batch_classification: Coalesce auto-classification of concurrent
+                conversions into multi-image VLM calls. Worth enabling when
+                converting many files at once; a lone conversion would only
+                wait out the batching window.
+        """
         self._api_key = api_key
         self._base_url = base_url
         self._vlm_client: AsyncVLMClient | None = None
+        self._batch_classification = batch_classification
+        self._classifier_batcher: ClassifierBatcher | None = None
+        self._render_pool: ProcessPoolExecutor | None = None
 
         # Build registries from builtin + user directories
         # Both registries scan the same directory — each picks up
@@ -60,6 +80,10 @@ class Doc2Md:
         self._agent_registry = AgentRegistry(user_dirs=user_dirs)
         self._pipeline_registry = PipelineRegistry(user_dirs=user_dirs)
 
+        # Model-overridden agent copies, keyed by (agent, model) and stored
+        # with the registry config they were copied from
+        self._model_overrides: dict[tuple[str, str], tuple[AgentConfig, AgentConfig]] = {}
+
         # Cache
         self._cache_manager = CacheManager(
             memory_max_mb=cache_memory_mb,
@@ -91,7 +115,7 @@ class Doc2Md:
         """Convert a document to markdown asynchronously."""
         input_path = Path(input_path)
         logger.info("Converting '%s'", input_path.name)
-        page_images = self._load_pages(input_path)
+        page_images = await self._load_pages(input_path)
         logger.info("Loaded %d page(s)", len(page_images))
         vlm_client = self._get_vlm_client()
         agent_engine = AgentEngine(vlm_client)
@@ -170,12 +194,7 @@ class Doc2Md:
         # Auto-classification
         if auto_classify and page_images:
             try:
-                classification = await classify_document(
-                    page1_image=page_images[0],
-                    pipeline_registry=self._pipeline_registry,
-                    vlm_client=vlm_client,
-                    blackboard=blackboard,
-                )
+                classification = await self._classify(page_images[0], vlm_client, blackboard)
                 logger.info(
                     "Classified as '%s' (confidence=%.2f)",
                     classification.pipeline_name,
@@ -190,6 +209,23 @@ class Doc2Md:
         pc, ac = self._resolve_agent("generic", model)
         return pc, ac, None
 
+    async def _classify(
+        self,
+        page1_image: bytes,
+        vlm_client: AsyncVLMClient,
+        blackboard: Blackboard,
+    ) -> ClassificationResult:
+        if not self._batch_classification:
+            return await classify_document(
+                page1_image=page1_image,
+                pipeline_registry=self._pipeline_registry,
+                vlm_client=vlm_client,
+                blackboard=blackboard,
+            )
+        if self._classifier_batcher is None:
+            self._classifier_batcher = ClassifierBatcher(self._pipeline_registry, vlm_client)
+        return await self._classifier_batcher.classify(page1_image, blackboard=blackboard)
+
     def _resolve_pipeline(
         self,
         pipeline_name: str,
@@ -201,10 +237,7 @@ class Doc2Md:
         agent_configs: dict[str, AgentConfig] = {}
         for name in agent_names:
             config = self._agent_registry.get(name)
-            if model:
-                config = config.model_copy(deep=True)
-                config.model.preferred = model
-            agent_configs[name] = config
+            agent_configs[name] = self._with_model(config, model) if model else config
         return pipeline_config, agent_configs
 
     def _resolve_agent(
@@ -215,8 +248,7 @@ class Doc2Md:
         """Wrap a single agent in an implicit pipeline."""
         config = self._agent_registry.get(agent_name)
         if model:
-            config = config.model_copy(deep=True)
-            config.model.preferred = model
+            config = self._with_model(config, model)
 
         implicit_pipeline = PipelineConfig(
             name=agent_name,
@@ -224,31 +256,87 @@ class Doc2Md:
         )
         return implicit_pipeline, {agent_name: config}
 
+    def _with_model(self, config: AgentConfig, model: str) -> AgentConfig:
+        """Copy of an agent config preferring ``model``, reused across calls.
+
+        Batch conversions resolve the same agents once per file; the copy is
+        made once per (agent, model) and redone only if the registry entry has
+        been replaced since. Only ``model`` is copied: the rest of the config
+        is never mutated, so it is shared with the registry entry.
+        """
+        key = (config.name, model)
+        cached = self._model_overrides.get(key)
+        if cached is not None and cached[0] is config:
+            return cached[1]
+        override = config.model_copy(
+            update={"model": config.model.model_copy(update={"preferred": model})}
+        )
+        self._model_overrides[key] = (config, override)
+        return override
+
     def _get_vlm_client(self) -> AsyncVLMClient:
         if self._vlm_client is None:
             self._vlm_client = AsyncVLMClient(api_key=self._api_key, base_url=self._base_url)
         return self._vlm_client
 
-    @staticmethod
-    def _load_pages(input_path: Path) -> list[bytes]:
-        if is_pdf(input_path):
-            return pdf_to_images(input_path)
-        return [load_image(input_path)]
+    def _get_render_pool(self) -> ProcessPoolExecutor:
+        if self._render_pool is None:
+            # Spawn rather than fork: the parent runs an event loop and holds
+            # sqlite and HTTP handles that must not be duplicated into workers.
+            self._render_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._render_pool
+
+    async def _load_pages(self, input_path: Path) -> list[bytes]:
+        """Load page images without blocking the event loop.
+
+        Rasterization is CPU-bound and holds the GIL, so large PDFs are
+        rendered in blocks across worker processes.
+        """
+        if not is_pdf(input_path):
+            return [await asyncio.to_thread(load_image, input_path)]
+
+        page_count = await asyncio.to_thread(pdf_page_count, input_path)
+        path = str(input_path)
+        if page_count <= _PDF_INLINE_MAX_PAGES:
+            return await asyncio.to_thread(render_pdf_pages, path, 0, page_count)
+
+        loop = asyncio.get_running_loop()
+        pool = self._get_render_pool()
+        blocks = await asyncio.gather(
+            *(
+                loop.run_in_executor(pool, render_pdf_pages, path, start, start + _PDF_RENDER_BLOCK)
+                for start in range(0, page_count, _PDF_RENDER_BLOCK)
+            )
+        )
+        return [page for block in blocks for page in block]
 
     async def close(self) -> None:
+        if self._classifier_batcher is not None:
+            await self._classifier_batcher.close()
+            self._classifier_batcher = None
         if self._vlm_client:
             await self._vlm_client.close()
+        if self._render_pool is not None:
+            await asyncio.to_thread(self._render_pool.shutdown, cancel_futures=True)
+            self._render_pool = None
         self._cache_manager.close()
 
 
 def _collect_agent_names(steps: list[StepConfig]) -> set[str]:
-    """Recursively collect all agent names from step configs."""
+    """Collect all agent names from step configs, including nested steps."""
     names: set[str] = set()
-    for step in steps:
+    # Iterative walk over nested steps: no recursion depth limit and no
+    # intermediate sets
+    stack = list(steps)
+    while stack:
+        step = stack.pop()
         if step.agent:
             names.add(step.agent)
         if step.steps:
-            names.update(_collect_agent_names(step.steps))
+            stack.extend(step.steps)
         if step.router:
             for rule in step.router.rules:
                 names.add(rule.agent)
@@ -285,15 +373,21 @@ def convert(
         custom_dir: Directory containing custom agent and pipeline YAML files.
     """
     converter = Doc2Md(api_key=api_key, no_cache=no_cache, custom_dir=custom_dir)
-    try:
-        result = _run_async(
-            converter.convert_async(input_path, agent=agent, pipeline=pipeline, model=model)
-        )
-        if output:
-            result.save(output, per_page=per_page)
-        return result
-    finally:
-        _run_async(converter.close())
+
+    # Convert and close on one event loop, so the VLM client is torn down on
+    # the loop that created it
+    async def _run() -> ConversionResult:
+        try:
+            return await converter.convert_async(
+                input_path, agent=agent, pipeline=pipeline, model=model
+            )
+        finally:
+            await converter.close()
+
+    result = _run_async(_run())
+    if output:
+        result.save(output, per_page=per_page)
+    return result
 
 
 def convert_batch(
@@ -308,20 +402,19 @@ def convert_batch(
     """Convert multiple documents concurrently (sync wrapper)."""
     from doc2md.concurrency.pool import ConcurrencyPool
 
-    converter = Doc2Md(api_key=api_key, no_cache=no_cache)
+    converter = Doc2Md(api_key=api_key, no_cache=no_cache, batch_classification=True)
 
     async def _run() -> list[ConversionResult]:
-        pool = ConcurrencyPool(max_file_workers=max_workers)
-        results = await pool.process_batch(
-            converter.convert_async,
-            file_paths=input_paths,
-            agent=agent,
-            pipeline=pipeline,
-            model=model,
-        )
-        return results
-
-    try:
-        return _run_async(_run())
-    finally:
-        _run_async(converter.close())
+        try:
+            pool = ConcurrencyPool(max_file_workers=max_workers)
+            return await pool.process_batch(
+                converter.convert_async,
+                file_paths=input_paths,
+                agent=agent,
+                pipeline=pipeline,
+                model=model,
+            )
+        finally:
+            await converter.close()
+
+    return _run_async(_run())
@@ -17,7 +17,13 @@ class FallbackChain:
 
     def __init__(self, preferred: str, fallbacks: list[str] | None = None) -> None:
         self._models = [preferred] + (fallbacks or [])
-        self._tried: set[str] = set()
+        # Tried models as a bitmask over chain positions. A model listed more
+        # than once owns several bits, all set together when it is tried.
+        self._name_bits: dict[str, int] = {}
+        for i, name in enumerate(self._models):
+            self._name_bits[name] = self._name_bits.get(name, 0) | (1 << i)
+        self._all_bits = (1 << len(self._models)) - 1
+        self._tried_mask = 0
         self._current_index = 0
 
     @property
@@ -26,24 +32,28 @@ class FallbackChain:
 
     @property
     def exhausted(self) -> bool:
-        return len(self._tried) >= len(self._models)
+        return self._tried_mask == self._all_bits
 
     def next_model(self) -> str:
         """Advance to the next untried model.
 
         Raises TerminalError if all models have been exhausted.
         """
-        self._tried.add(self.current_model)
-
-        for i in range(self._current_index + 1, len(self._models)):
-            if self._models[i] not in self._tried:
-                self._current_index = i
+        self._tried_mask |= self._name_bits[self.current_model]
+
+        # Untried positions after the current one; the lowest set bit is next
+        remaining = ~self._tried_mask & self._all_bits & ~((2 << self._current_index) - 1)
+        if remaining:
+            self._current_index = (remaining & -remaining).bit_length() - 1
+            # The tried list is built, sorted and joined eagerly, so skip it
+            # when INFO is off
+            if logger.isEnabledFor(logging.INFO):
                 logger.info(
                     "Falling back to model '%s' (tried: %s)",
                     self.current_model,
-                    ", ".join(sorted(self._tried)),
+                    ", ".join(sorted(self._tried_names())),
                 )
-                return self.current_model
+            return self.current_model
 
         raise TerminalError(
             f"All models exhausted: {', '.join(self._models)}",
@@ -53,9 +63,12 @@ class FallbackChain:
 
     def mark_tried(self, model: str) -> None:
         """Mark a model as tried (e.g., after failure)."""
-        self._tried.add(model)
+        self._tried_mask |= self._name_bits.get(model, 0)
 
     def reset(self) -> None:
         """Reset the chain for a new request."""
-        self._tried.clear()
+        self._tried_mask = 0
         self._current_index = 0
+
+    def _tried_names(self) -> set[str]:
+        return {name for name, bits in self._name_bits.items() if bits & self._tried_mask}
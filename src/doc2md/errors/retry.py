@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import logging
+import os
 import random
 from collections.abc import Awaitable, Callable
 from typing import Any, TypeVar
@@ -25,58 +26,94 @@ T = TypeVar("T")
 
 _MAX_WAIT = 60.0  # seconds
 
+# Private generator for backoff jitter, seeded from os.urandom: unaffected by
+# application calls to random.seed(). Reseeded in forked children, which
+# would otherwise inherit its state and retry in lockstep.
+_JITTER_RNG = random.Random()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_JITTER_RNG.seed)
+
+
+def _rate_limit_error(exc: Exception) -> Doc2MdError:
+    retry_after = None
+    if hasattr(exc, "response") and exc.response:
+        retry_after_str = exc.response.headers.get("retry-after")
+        if retry_after_str:
+            with contextlib.suppress(ValueError):
+                retry_after = float(retry_after_str)
+    return TransientError(
+        str(exc),
+        error_type="rate_limit",
+        http_status=429,
+        retry_after=retry_after,
+        original=exc,
+    )
+
+
+def _server_error(exc: Exception) -> Doc2MdError:
+    status = getattr(exc, "status_code", 500)
+    return TransientError(
+        str(exc),
+        error_type="server_error",
+        http_status=status,
+        original=exc,
+    )
+
+
+def _timeout_error(exc: Exception) -> Doc2MdError:
+    return TransientError(
+        str(exc),
+        error_type="timeout",
+        original=exc,
+    )
+
+
+def _auth_error(exc: Exception) -> Doc2MdError:
+    return TerminalError(
+        str(exc),
+        error_type="auth_failure",
+        http_status=401,
+        recoverable_with_fallback=False,
+    )
+
+
+def _not_found_error(exc: Exception) -> Doc2MdError:
+    return TerminalError(
+        str(exc),
+        error_type="model_not_found",
+        http_status=404,
+        recoverable_with_fallback=True,
+    )
+
+
+def _bad_request_error(exc: Exception) -> Doc2MdError:
+    return TerminalError(
+        str(exc),
+        error_type="bad_input",
+        http_status=400,
+        recoverable_with_fallback=False,
+    )
+
+
+# Keyed by exception class; classify_openai_error walks the MRO, so
+# subclasses resolve to their nearest registered ancestor
+_OPENAI_ERROR_HANDLERS: dict[type, Callable[[Exception], Doc2MdError]] = {
+    openai.RateLimitError: _rate_limit_error,
+    openai.InternalServerError: _server_error,
+    openai.APIConnectionError: _timeout_error,
+    openai.APITimeoutError: _timeout_error,
+    openai.AuthenticationError: _auth_error,
+    openai.NotFoundError: _not_found_error,
+    openai.BadRequestError: _bad_request_error,
+}
+
 
 def classify_openai_error(exc: Exception) -> Doc2MdError:
     """Convert an openai exception to our exception hierarchy."""
-    if isinstance(exc, openai.RateLimitError):
-        retry_after = None
-        if hasattr(exc, "response") and exc.response:
-            retry_after_str = exc.response.headers.get("retry-after")
-            if retry_after_str:
-                with contextlib.suppress(ValueError):
-                    retry_after = float(retry_after_str)
-        return TransientError(
-            str(exc),
-            error_type="rate_limit",
-            http_status=429,
-            retry_after=retry_after,
-            original=exc,
-        )
-    if isinstance(exc, (openai.InternalServerError,)):
-        status = getattr(exc, "status_code", 500)
-        return TransientError(
-            str(exc),
-            error_type="server_error",
-            http_status=status,
-            original=exc,
-        )
-    if isinstance(exc, (openai.APIConnectionError, openai.APITimeoutError)):
-        return TransientError(
-            str(exc),
-            error_type="timeout",
-            original=exc,
-        )
-    if isinstance(exc, openai.AuthenticationError):
-        return TerminalError(
-            str(exc),
-            error_type="auth_failure",
-            http_status=401,
-            recoverable_with_fallback=False,
-        )
-    if isinstance(exc, openai.NotFoundError):
-        return TerminalError(
-            str(exc),
-            error_type="model_not_found",
-            http_status=404,
-            recoverable_with_fallback=True,
-        )
-    if isinstance(exc, openai.BadRequestError):
-        return TerminalError(
-            str(exc),
-            error_type="bad_input",
-            http_status=400,
-            recoverable_with_fallback=False,
-        )
+    for klass in type(exc).__mro__:
+        handler = _OPENAI_ERROR_HANDLERS.get(klass)
+        if handler is not None:
+            return handler(exc)
     return TerminalError(str(exc), error_type="unknown")
 
 
@@ -95,7 +132,7 @@ def compute_wait(
         wait = initial_wait
 
     if jitter:
-        wait += random.uniform(0, wait * 0.25)
+        wait += _JITTER_RNG.uniform(0, wait * 0.25)
 
     return min(wait, _MAX_WAIT)
 
@@ -150,8 +187,11 @@ async def retry_with_fallback(
                 except TerminalError:
                     raise classified from exc
 
-            # Terminal or unrecoverable — raise
-            raise classified from exc if isinstance(classified, Doc2MdError) else exc
+            # Terminal or unrecoverable — raise. Errors that were not
+            # classified are re-raised as they are, not chained to themselves.
+            if classified is exc:
+                raise
+            raise classified from exc
 
     # Exhausted attempts
     if last_error:
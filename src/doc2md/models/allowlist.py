@@ -2,16 +2,23 @@
 
 from __future__ import annotations
 
+import functools
 import logging
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 
 import yaml
 from pydantic import BaseModel
 
+from doc2md.config.loader import YAML_LOADER
+
 logger = logging.getLogger(__name__)
 
 _MODELS_YAML = Path(__file__).parent / "models.yaml"
 
+_PARSED_CACHE_SIZE = 8
+
 
 class ModelInfo(BaseModel):
     """Information about a supported model."""
@@ -28,25 +35,7 @@ class ModelAllowlist:
     """Curated list of supported models loaded from models.yaml."""
 
     def __init__(self, models_path: Path | None = None) -> None:
-        self._models: dict[str, ModelInfo] = {}
-        self._load(models_path or _MODELS_YAML)
-
-    def _load(self, path: Path) -> None:
-        """Load models from YAML file."""
-        if not path.exists():
-            logger.warning("Models YAML not found: %s", path)
-            return
-
-        with open(path) as f:
-            data = yaml.safe_load(f)
-
-        if not isinstance(data, dict) or "models" not in data:
-            logger.warning("Invalid models YAML: missing 'models' key")
-            return
-
-        for name, info in data["models"].items():
-            if isinstance(info, dict):
-                self._models[name] = ModelInfo(name=name, **info)
+        self._models: Mapping[str, ModelInfo] = _load_models(models_path or _MODELS_YAML)
 
     def is_allowed(self, model_id: str) -> bool:
         """Check if a model is in the allowlist."""
@@ -73,3 +62,35 @@ class ModelAllowlist:
     def model_names(self) -> list[str]:
         """All model names in the allowlist."""
         return list(self._models.keys())
+
+
+def _load_models(path: Path) -> Mapping[str, ModelInfo]:
+    """Models defined in a YAML file; missing or invalid files yield none.
+
+    Parsed files are shared between allowlists until the file changes.
+    """
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        logger.warning("Models YAML not found: %s", path)
+        return MappingProxyType({})
+    return _parse_models(path, stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=_PARSED_CACHE_SIZE)
+def _parse_models(path: Path, mtime_ns: int, size: int) -> Mapping[str, ModelInfo]:
+    # mtime_ns and size only key the cache, so an edited file is re-read
+    with open(path, "rb") as f:
+        data = yaml.load(f, Loader=YAML_LOADER)
+
+    if not isinstance(data, dict) or "models" not in data:
+        logger.warning("Invalid models YAML: missing 'models' key")
+        return MappingProxyType({})
+
+    return MappingProxyType(
+        {
+            name: ModelInfo(name=name, **info)
+            for name, info in data["models"].items()
+            if isinstance(info, dict)
+        }
+    )
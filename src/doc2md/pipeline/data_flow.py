@@ -6,8 +6,20 @@ from dataclasses import dataclass, field
 
 from doc2md.types import InputMode, StepResult
 
+# Input modes that receive the page images
+_IMAGE_MODES = frozenset({InputMode.IMAGE, InputMode.IMAGE_AND_PREVIOUS})
 
-@dataclass
+# Input modes that receive only the last dependency's output
+_SINGLE_PREVIOUS_MODES = frozenset(
+    {
+        InputMode.PREVIOUS_OUTPUT,
+        InputMode.IMAGE_AND_PREVIOUS,
+        InputMode.PREVIOUS_OUTPUT_ONLY,
+    }
+)
+
+
+@dataclass(slots=True)
 class StepInput:
     """Resolved input for a pipeline step."""
 
@@ -23,28 +35,22 @@ def resolve_step_input(
     step_results: dict[str, StepResult],
 ) -> StepInput:
     """Resolve what a step receives based on its input mode and dependencies."""
-    step_input = StepInput()
-
-    if input_mode in (InputMode.IMAGE, InputMode.IMAGE_AND_PREVIOUS):
-        step_input.images = images
-
-    if depends_on:
-        dep_outputs = {
-            name: step_results[name].markdown for name in depends_on if name in step_results
-        }
-
-        if input_mode == InputMode.PREVIOUS_OUTPUTS:
-            step_input.previous_outputs = dep_outputs
-        elif (
-            input_mode
-            in (
-                InputMode.PREVIOUS_OUTPUT,
-                InputMode.IMAGE_AND_PREVIOUS,
-                InputMode.PREVIOUS_OUTPUT_ONLY,
-            )
-            and dep_outputs
-        ):
-            last_dep = depends_on[-1]
-            step_input.previous_output = dep_outputs.get(last_dep)
-
-    return step_input
+    step_images = images if input_mode in _IMAGE_MODES else []
+    if not depends_on:
+        return StepInput(images=step_images)
+
+    if input_mode == InputMode.PREVIOUS_OUTPUTS:
+        return StepInput(
+            images=step_images,
+            previous_outputs={
+                name: step_results[name].markdown for name in depends_on if name in step_results
+            },
+        )
+
+    previous_output = None
+    if input_mode in _SINGLE_PREVIOUS_MODES:
+        # Only the last dependency is passed on; look it up directly
+        last_result = step_results.get(depends_on[-1])
+        if last_result is not None:
+            previous_output = last_result.markdown
+    return StepInput(images=step_images, previous_output=previous_output)
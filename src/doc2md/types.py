@@ -89,6 +89,11 @@ class ConfidenceConfig(BaseModel):
     expected_fields: list[str] = Field(default_factory=list)
     calibration: dict[str, Any] = Field(default_factory=dict)
 
+    @property
+    def configured_signals(self) -> frozenset[str]:
+        """Signal names as a set (empty means all)."""
+        return frozenset(self.signals)
+
 
 class AgentConfig(BaseModel):
     name: str
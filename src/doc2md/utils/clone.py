@@ -0,0 +1,34 @@
+"""Fast structural copies for plain JSON-like data."""
+
+from __future__ import annotations
+
+import copy
+from typing import Any, TypeVar, cast
+
+_T = TypeVar("_T")
+
+# Immutable scalar types that can be shared rather than copied
+_ATOMIC_TYPES = frozenset({str, int, float, bool, type(None), bytes})
+
+
+def clone_data(obj: _T) -> _T:
+    """Deep-copy nested dicts/lists of scalars without ``copy.deepcopy``.
+
+    Blackboard values are almost always plain dicts, lists, and scalars,
+    which this walks directly. Anything else falls back to ``copy.deepcopy``
+    so behavior matches for arbitrary values.
+    """
+    return cast(_T, _clone(obj))
+
+
+def _clone(obj: Any) -> Any:
+    cls = type(obj)
+    if cls in _ATOMIC_TYPES:
+        return obj
+    if cls is dict:
+        return {k: _clone(v) for k, v in obj.items()}
+    if cls is list:
+        return [_clone(v) for v in obj]
+    if cls is tuple:
+        return tuple(_clone(v) for v in obj)
+    return copy.deepcopy(obj)
@@ -25,20 +25,34 @@ def image_to_base64(image_bytes: bytes) -> str:
 
 def pdf_to_images(path: str | Path, dpi: int = 200) -> list[bytes]:
     """Convert a PDF file to a list of PNG image byte arrays (one per page)."""
+    path = Path(path)
+    _validate_path(path)
+    return render_pdf_pages(str(path), 0, None, dpi)
+
+
+def pdf_page_count(path: str | Path) -> int:
+    """Number of pages in a PDF file."""
     import pymupdf
 
     path = Path(path)
     _validate_path(path)
+    with pymupdf.open(str(path)) as doc:
+        return int(doc.page_count)
+
+
+def render_pdf_pages(path: str, start: int, stop: int | None, dpi: int = 200) -> list[bytes]:
+    """Render pages ``start`` to ``stop`` (0-based, exclusive) of a PDF to PNG bytes.
+
+    Takes a plain string path and opens its own document, so it can run in a
+    worker process.
+    """
+    import pymupdf
 
-    doc = pymupdf.open(str(path))
-    result: list[bytes] = []
     zoom = dpi / 72  # PyMuPDF default is 72 DPI
     matrix = pymupdf.Matrix(zoom, zoom)
-    for page in doc:
-        pix = page.get_pixmap(matrix=matrix)
-        result.append(pix.tobytes("png"))
-    doc.close()
-    return result
+    with pymupdf.open(path) as doc:
+        stop = doc.page_count if stop is None else min(stop, doc.page_count)
+        return [doc[i].get_pixmap(matrix=matrix).tobytes("png") for i in range(start, stop)]
 
 
 def is_pdf(path: str | Path) -> bool:
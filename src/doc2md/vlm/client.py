@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import openai
 from tenacity import (
@@ -16,6 +17,7 @@ from tenacity import (
 from doc2md.errors.exceptions import TerminalError
 from doc2md.errors.fallback import FallbackChain
 from doc2md.types import TokenUsage, VLMResponse
+from doc2md.utils.image import image_to_base64
 
 if TYPE_CHECKING:
     from doc2md.concurrency.rate_limiter import RateLimiter
@@ -34,6 +36,12 @@ _TRANSIENT_EXCEPTIONS = (
 class AsyncVLMClient:
     """Sends requests to an OpenAI-compatible vision-language model."""
 
+    # Whether callers may pass raw image bytes instead of base64. The OpenAI
+    # chat completions API only accepts base64 data URLs, so this client
+    # encodes internally; subclasses for providers with binary image uploads
+    # set this to True and send image_bytes as-is.
+    supports_binary_images: bool = False
+
     def __init__(
         self,
         api_key: str | None = None,
@@ -58,8 +66,16 @@ class AsyncVLMClient:
         max_tokens: int = 4096,
         temperature: float = 0.0,
         logprobs: bool = False,
+        image_bytes: bytes | None = None,
     ) -> VLMResponse:
-        """Send a single VLM request and return parsed response."""
+        """Send a single VLM request and return parsed response.
+
+        ``image_bytes`` is used only when ``image_b64`` is not given; it is
+        encoded off the event loop for clients without binary support.
+        """
+        if image_b64 is None and image_bytes is not None:
+            image_b64 = await asyncio.to_thread(image_to_base64, image_bytes)
+
         # Rate limit if available
         if self._rate_limiter:
             await self._rate_limiter.acquire(estimated_tokens=max_tokens)
@@ -68,28 +84,39 @@ class AsyncVLMClient:
             "VLM request: model=%s, max_tokens=%d, image=%s", model, max_tokens, bool(image_b64)
         )
         messages = self._build_messages(system_prompt, user_prompt, image_b64)
+        return await self._complete(model, messages, max_tokens, temperature, logprobs)
 
-        kwargs: dict = {
-            "model": model,
-            "messages": messages,
-            "max_tokens": max_tokens,
-            "temperature": temperature,
-        }
-        if logprobs:
-            kwargs["logprobs"] = True
-            kwargs["top_logprobs"] = 5
-
-        response = await self._client.chat.completions.create(**kwargs)
-        result = self._parse_response(response)
+    @retry(
+        retry=retry_if_exception_type(_TRANSIENT_EXCEPTIONS),
+        wait=wait_exponential(multiplier=1, min=1, max=60),
+        stop=stop_after_attempt(3),
+        reraise=True,
+    )
+    async def send_batch_request(
+        self,
+        model: str,
+        system_prompt: str,
+        user_prompt: str,
+        images_b64: list[str],
+        max_tokens: int = 4096,
+        temperature: float = 0.0,
+    ) -> VLMResponse:
+        """Send one VLM request carrying several images in a single user message.
 
-        # Record actual usage
+        Images are attached in order, so the prompt can refer to them by
+        position. Used to amortize per-request overhead across documents.
+        """
         if self._rate_limiter:
-            self._rate_limiter.record_usage(
-                result.token_usage.prompt_tokens,
-                result.token_usage.completion_tokens,
-            )
+            await self._rate_limiter.acquire(estimated_tokens=max_tokens)
 
-        return result
+        logger.debug(
+            "VLM batch request: model=%s, max_tokens=%d, images=%d",
+            model,
+            max_tokens,
+            len(images_b64),
+        )
+        messages = self._build_batch_messages(system_prompt, user_prompt, images_b64)
+        return await self._complete(model, messages, max_tokens, temperature, False)
 
     async def send_request_with_fallback(
         self,
@@ -126,9 +153,41 @@ class AsyncVLMClient:
     async def close(self) -> None:
         await self._client.close()
 
+    async def _complete(
+        self,
+        model: str,
+        messages: list[dict[str, Any]],
+        max_tokens: int,
+        temperature: float,
+        logprobs: bool,
+    ) -> VLMResponse:
+        kwargs: dict[str, Any] = {
+            "model": model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+        }
+        if logprobs:
+            kwargs["logprobs"] = True
+            kwargs["top_logprobs"] = 5
+
+        response = await self._client.chat.completions.create(**kwargs)
+        result = self._parse_response(response)
+
+        # Record actual usage
+        if self._rate_limiter:
+            self._rate_limiter.record_usage(
+                result.token_usage.prompt_tokens,
+                result.token_usage.completion_tokens,
+            )
+
+        return result
+
     @staticmethod
-    def _build_messages(system_prompt: str, user_prompt: str, image_b64: str | None) -> list[dict]:
-        messages: list[dict] = [{"role": "system", "content": system_prompt}]
+    def _build_messages(
+        system_prompt: str, user_prompt: str, image_b64: str | None
+    ) -> list[dict[str, Any]]:
+        messages: list[dict[str, Any]] = [{"role": "system", "content": system_prompt}]
 
         if image_b64:
             messages.append(
@@ -148,6 +207,23 @@ class AsyncVLMClient:
 
         return messages
 
+    @staticmethod
+    def _build_batch_messages(
+        system_prompt: str, user_prompt: str, images_b64: list[str]
+    ) -> list[dict[str, Any]]:
+        content: list[dict[str, Any]] = [{"type": "text", "text": user_prompt}]
+        for image_b64 in images_b64:
+            content.append(
+                {
+                    "type": "image_url",
+                    "image_url": {"url": f"data:image/png;base64,{image_b64}"},
+                }
+            )
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": content},
+        ]
+
     @staticmethod
     def _parse_response(response: openai.types.chat.ChatCompletion) -> VLMResponse:
         choice = response.choices[0]
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import json
 import re
 from typing import Any
 
 import yaml
 
+from doc2md.config.loader import YAML_LOADER
 from doc2md.types import ConfidenceLevel
 
 # Pattern to extract <blackboard>...</blackboard> blocks
@@ -56,10 +58,12 @@ def _extract_blackboard(raw_text: str) -> dict[str, Any] | None:
         return None
 
     raw_yaml = match.group(1)
-    try:
-        parsed = yaml.safe_load(raw_yaml)
-    except yaml.YAMLError:
-        return None
+    parsed = _load_json_block(raw_yaml)
+    if parsed is None:
+        try:
+            parsed = yaml.load(raw_yaml, Loader=YAML_LOADER)
+        except yaml.YAMLError:
+            return None
 
     if not isinstance(parsed, dict):
         return None
@@ -67,6 +71,20 @@ def _extract_blackboard(raw_text: str) -> dict[str, Any] | None:
     return parsed
 
 
+def _load_json_block(raw: str) -> Any:
+    """Decode a blackboard block written as JSON, or None to fall back to YAML.
+
+    VLMs often emit JSON objects here; the C JSON decoder handles those
+    much faster than the YAML parser, which remains the general path.
+    """
+    if not raw.startswith("{"):
+        return None
+    try:
+        return json.loads(raw)
+    except ValueError:
+        return None
+
+
 def _extract_confidence(text: str) -> ConfidenceLevel | None:
     match = _CONFIDENCE_PATTERN.search(text)
     if match:
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 
@@ -53,3 +55,31 @@ pipeline:
     path = tmp_path / "test_pipeline.yaml"
     path.write_text(content)
     return path
+
+
+class LoopRecordingConverter:
+    """Stand-in for Doc2Md that records the loop each coroutine runs on."""
+
+    loops: list[asyncio.AbstractEventLoop] = []
+
+    def __init__(self, **kwargs):
+        pass
+
+    async def convert_async(self, *args, **kwargs):
+        from doc2md.types import ConversionResult
+
+        self.loops.append(asyncio.get_running_loop())
+        return ConversionResult(markdown="# converted")
+
+    async def close(self):
+        self.loops.append(asyncio.get_running_loop())
+
+
+@pytest.fixture
+def loop_recording_converter(monkeypatch):
+    """Replace doc2md.core.Doc2Md with LoopRecordingConverter, starting with no loops."""
+    import doc2md.core
+
+    monkeypatch.setattr(LoopRecordingConverter, "loops", [])
+    monkeypatch.setattr(doc2md.core, "Doc2Md", LoopRecordingConverter)
+    return LoopRecordingConverter
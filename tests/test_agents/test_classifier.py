@@ -1,10 +1,17 @@
 """Tests for document auto-classification."""
 
+import asyncio
 from unittest.mock import AsyncMock
 
 import pytest
 
-from doc2md.agents.classifier import classify_document
+from doc2md.agents.classifier import (
+    ClassifierBatcher,
+    _build_classification_prompt,
+    _parse_classification,
+    classify_document,
+    classify_documents,
+)
 from doc2md.agents.registry import PipelineRegistry
 from doc2md.blackboard.board import Blackboard
 from doc2md.types import TokenUsage, VLMResponse
@@ -110,3 +117,120 @@ class TestClassifyDocument:
 
         assert result.pipeline_name == "academic"
         assert result.confidence == 0.85
+
+
+class TestClassifyDocuments:
+    @pytest.fixture
+    def registry(self):
+        return PipelineRegistry()
+
+    async def test_single_batched_call(self, registry):
+        mock_vlm = AsyncMock()
+        mock_vlm.send_batch_request = AsyncMock(
+            return_value=_mock_vlm_response(
+                '[{"pipeline_name": "receipt", "confidence": 0.9, '
+                '"content_types_detected": ["tables"]}, '
+                '{"pipeline_name": "academic", "confidence": 0.85}]'
+            )
+        )
+        bbs = [Blackboard(), Blackboard()]
+
+        results = await classify_documents([b"a", b"b"], registry, mock_vlm, blackboards=bbs)
+
+        assert [r.pipeline_name for r in results] == ["receipt", "academic"]
+        assert mock_vlm.send_batch_request.await_count == 1
+        assert len(mock_vlm.send_batch_request.call_args.kwargs["images_b64"]) == 2
+        assert bbs[0].document_metadata.content_types == ["tables"]
+        mock_vlm.send_request.assert_not_called()
+
+    async def test_mismatched_batch_falls_back_to_individual(self, registry):
+        mock_vlm = AsyncMock()
+        mock_vlm.send_batch_request = AsyncMock(
+            return_value=_mock_vlm_response('[{"pipeline_name": "receipt", "confidence": 0.9}]')
+        )
+        mock_vlm.send_request = AsyncMock(
+            return_value=_mock_vlm_response('{"pipeline_name": "academic", "confidence": 0.9}')
+        )
+
+        results = await classify_documents([b"a", b"b"], registry, mock_vlm)
+
+        assert [r.pipeline_name for r in results] == ["academic", "academic"]
+        assert mock_vlm.send_request.await_count == 2
+
+    async def test_single_image_uses_single_request(self, registry):
+        mock_vlm = AsyncMock()
+        mock_vlm.send_request = AsyncMock(
+            return_value=_mock_vlm_response('{"pipeline_name": "receipt", "confidence": 0.9}')
+        )
+
+        results = await classify_documents([b"a"], registry, mock_vlm)
+
+        assert results[0].pipeline_name == "receipt"
+        mock_vlm.send_batch_request.assert_not_called()
+
+
+class TestClassifierBatcher:
+    async def test_coalesces_concurrent_requests(self):
+        registry = PipelineRegistry()
+        mock_vlm = AsyncMock()
+        mock_vlm.send_batch_request = AsyncMock(
+            return_value=_mock_vlm_response(
+                '[{"pipeline_name": "receipt", "confidence": 0.9}, '
+                '{"pipeline_name": "academic", "confidence": 0.9}, '
+                '{"pipeline_name": "legal_contract", "confidence": 0.9}]'
+            )
+        )
+        batcher = ClassifierBatcher(registry, mock_vlm, window_seconds=0.01)
+
+        results = await asyncio.gather(
+            batcher.classify(b"a"), batcher.classify(b"b"), batcher.classify(b"c")
+        )
+        await batcher.close()
+
+        assert [r.pipeline_name for r in results] == ["receipt", "academic", "legal_contract"]
+        assert mock_vlm.send_batch_request.await_count == 1
+
+    async def test_close_flushes_pending_requests(self):
+        registry = PipelineRegistry()
+        mock_vlm = AsyncMock()
+        mock_vlm.send_batch_request = AsyncMock(
+            return_value=_mock_vlm_response(
+                '[{"pipeline_name": "receipt", "confidence": 0.9}, '
+                '{"pipeline_name": "academic", "confidence": 0.9}]'
+            )
+        )
+        # A window long enough that the batch is still collecting at close()
+        batcher = ClassifierBatcher(registry, mock_vlm, window_seconds=60)
+
+        pending = asyncio.gather(batcher.classify(b"a"), batcher.classify(b"b"))
+        await asyncio.sleep(0)
+        await asyncio.wait_for(batcher.close(), timeout=5)
+        results = await asyncio.wait_for(pending, timeout=5)
+
+        assert [r.pipeline_name for r in results] == ["receipt", "academic"]
+        assert mock_vlm.send_batch_request.await_count == 1
+
+
+class TestParseClassification:
+    def test_ignores_surrounding_prose(self):
+        registry = PipelineRegistry()
+        result = _parse_classification(
+            'Here you go:\n{"pipeline_name": "receipt", "confidence": 0.9}\nThanks!',
+            registry,
+        )
+        assert result.pipeline_name == "receipt"
+        assert result.confidence == 0.9
+
+    def test_truncated_json_falls_back(self):
+        registry = PipelineRegistry()
+        result = _parse_classification('{"pipeline_name": "receipt", "conf', registry)
+        assert result.pipeline_name == "generic"
+        assert result.confidence == 0.0
+
+
+class TestClassificationPrompt:
+    def test_prompt_is_reused_for_unchanged_registry(self):
+        registry = PipelineRegistry()
+        first = _build_classification_prompt(registry)
+        assert _build_classification_prompt(registry) is first
+        assert '"generic"' in first
@@ -1,11 +1,12 @@
 """Tests for agent execution engine with mocked VLM."""
 
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from doc2md.agents.engine import AgentEngine
 from doc2md.types import AgentConfig, InputMode, PromptConfig, TokenUsage, VLMResponse
+from doc2md.utils.image import image_to_base64
 
 
 def _make_agent(input_mode: InputMode = InputMode.IMAGE) -> AgentConfig:
@@ -28,6 +29,7 @@ class TestAgentEngine:
     @pytest.fixture
     def mock_vlm(self):
         client = AsyncMock()
+        client.supports_binary_images = False
         client.send_request = AsyncMock(return_value=_make_vlm_response())
         return client
 
@@ -91,3 +93,46 @@ class TestAgentEngine:
         assert call_kwargs["model"] == "gpt-4.1"
         assert call_kwargs["max_tokens"] == 2048
         assert call_kwargs["temperature"] == 0.5
+
+    async def test_page_image_encoded_once_across_agents(self, mock_vlm, sample_image_bytes):
+        engine = AgentEngine(mock_vlm)
+        config = _make_agent()
+
+        with patch("doc2md.agents.engine.image_to_base64", side_effect=image_to_base64) as encode:
+            await engine.execute(config, image_bytes=sample_image_bytes, step_name="a")
+            await engine.execute(config, image_bytes=sample_image_bytes, step_name="b")
+
+        encode.assert_called_once()
+        first, second = (c.kwargs["image_b64"] for c in mock_vlm.send_request.call_args_list)
+        assert first is second
+
+    async def test_cache_hit_then_miss_reuses_page_encoding(self, mock_vlm, sample_image_bytes):
+        from doc2md.cache.stats import CacheEntry
+
+        cache_manager = MagicMock()
+        cache_manager.enabled = True
+        cache_manager.lookup.side_effect = [CacheEntry(key="k", markdown="# Cached"), None]
+        engine = AgentEngine(mock_vlm)
+        config = _make_agent()
+
+        hit = await engine.execute(
+            config, image_bytes=sample_image_bytes, cache_manager=cache_manager, step_name="a"
+        )
+        miss = await engine.execute(
+            config, image_bytes=sample_image_bytes, cache_manager=cache_manager, step_name="b"
+        )
+
+        assert hit.cached and hit.markdown == "# Cached"
+        assert not miss.cached
+        expected = image_to_base64(sample_image_bytes)
+        assert mock_vlm.send_request.call_args.kwargs["image_b64"] == expected
+
+    async def test_binary_capable_client_receives_raw_bytes(self, mock_vlm, sample_image_bytes):
+        mock_vlm.supports_binary_images = True
+        engine = AgentEngine(mock_vlm)
+
+        await engine.execute(_make_agent(), image_bytes=sample_image_bytes)
+
+        call_kwargs = mock_vlm.send_request.call_args.kwargs
+        assert call_kwargs["image_bytes"] is sample_image_bytes
+        assert call_kwargs["image_b64"] is None
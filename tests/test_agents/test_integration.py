@@ -25,6 +25,7 @@ class TestConvertIntegration:
 
         with patch.object(converter, "_get_vlm_client") as mock_get_client:
             mock_client = AsyncMock()
+            mock_client.supports_binary_images = False
             mock_client.send_request = AsyncMock(return_value=_mock_vlm_response())
             mock_get_client.return_value = mock_client
 
@@ -58,6 +59,7 @@ agent:
 
         with patch.object(converter, "_get_vlm_client") as mock_get_client:
             mock_client = AsyncMock()
+            mock_client.supports_binary_images = False
             mock_client.send_request = AsyncMock(return_value=_mock_vlm_response())
             mock_get_client.return_value = mock_client
 
@@ -75,6 +77,7 @@ agent:
 
         with patch.object(converter, "_get_vlm_client") as mock_get_client:
             mock_client = AsyncMock()
+            mock_client.supports_binary_images = False
             mock_client.send_request = AsyncMock(return_value=_mock_vlm_response())
             mock_get_client.return_value = mock_client
 
@@ -1,5 +1,7 @@
 """Tests for agent and pipeline registries."""
 
+import os
+
 import pytest
 
 from doc2md.agents.registry import AgentRegistry, PipelineRegistry
@@ -52,6 +54,46 @@ agent:
         assert config.version == "99.0"
         assert config.model.preferred == "custom-model"
 
+    def test_rescan_picks_up_modified_file(self, tmp_path):
+        path = tmp_path / "custom.yaml"
+        template = """
+agent:
+  name: custom
+  version: "{version}"
+  prompt:
+    system: "S"
+    user: "U"
+"""
+        path.write_text(template.format(version="1.0"))
+        assert AgentRegistry(user_dirs=[tmp_path]).get("custom").version == "1.0"
+
+        path.write_text(template.format(version="2.0"))
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert AgentRegistry(user_dirs=[tmp_path]).get("custom").version == "2.0"
+
+    def test_malformed_yaml_is_skipped(self, tmp_path):
+        (tmp_path / "a_broken.yaml").write_text("agent: [unclosed\n")
+        (tmp_path / "b_good.yaml").write_text(
+            'agent:\n  name: good\n  prompt:\n    system: "S"\n    user: "U"\n'
+        )
+        registry = AgentRegistry(user_dirs=[tmp_path])
+        assert registry.has("good")
+        assert registry.has("generic")
+
+    def test_non_agent_yaml_is_not_parsed(self, tmp_path, caplog):
+        # Unparseable, but never parsed: no top-level "agent" key
+        (tmp_path / "notes.yaml").write_text("title: [unclosed\n")
+        registry = AgentRegistry(user_dirs=[tmp_path])
+        assert registry.has("generic")
+        assert "Failed to load agent" not in caplog.text
+
+    def test_quoted_top_level_key_is_loaded(self, tmp_path):
+        (tmp_path / "quoted.yaml").write_text(
+            '# comment\n"agent":\n  name: quoted\n  prompt:\n    system: "S"\n    user: "U"\n'
+        )
+        assert AgentRegistry(user_dirs=[tmp_path]).has("quoted")
+
     def test_register_programmatic(self):
         registry = AgentRegistry()
         custom = AgentConfig(
@@ -74,6 +116,16 @@ agent:
         generic_info = next(a for a in agents if a.name == "generic")
         assert generic_info.builtin is True
 
+    def test_listing_reused_until_register(self):
+        registry = AgentRegistry()
+        listing = registry.list_agents()
+        assert registry.list_agents() is listing
+
+        registry.register(
+            AgentConfig(name="custom_listed", prompt=PromptConfig(system="s", user="u"))
+        )
+        assert "custom_listed" in {a.name for a in registry.list_agents()}
+
 
 class TestPipelineRegistry:
     def test_discovers_builtin_pipelines(self):
@@ -114,3 +166,26 @@ class TestPipelineRegistry:
         pipelines = registry.list_pipelines()
         receipt = next(p for p in pipelines if p.name == "receipt")
         assert receipt.step_count == 2  # extract + validate
+
+
+class TestPipelineRegistryFingerprint:
+    def test_fingerprint_tracks_registrations(self):
+        registry = PipelineRegistry()
+        before = registry.fingerprint()
+        assert ("generic", registry.get("generic").description) in before
+
+        registry.register(
+            PipelineConfig(name="custom_fp", description="Custom", steps=[StepConfig(name="s")])
+        )
+
+        after = registry.fingerprint()
+        assert after != before
+        assert ("custom_fp", "Custom") in after
+
+    def test_listing_reused_until_register(self):
+        registry = PipelineRegistry()
+        listing = registry.list_pipelines()
+        assert registry.list_pipelines() is listing
+
+        registry.register(PipelineConfig(name="custom_listed", steps=[StepConfig(name="s")]))
+        assert "custom_listed" in {p.name for p in registry.list_pipelines()}
@@ -1,8 +1,11 @@
 """Tests for the core Blackboard class."""
 
+import hashlib
+
 import pytest
 
 from doc2md.blackboard.board import Blackboard, BlackboardView
+from doc2md.blackboard.regions import PageObservation
 
 
 class TestBlackboardReadWrite:
@@ -23,6 +26,18 @@ class TestBlackboardReadWrite:
         assert 5 in bb.page_observations
         assert bb.page_observations[5].continues_on_next_page is True
 
+    def test_created_page_has_defaults(self):
+        bb = Blackboard()
+        bb.write("page_observations", "2.quality_score", 0.7, writer="agent")
+        assert bb.page_observations[2] == PageObservation(quality_score=0.7)
+
+    def test_write_whole_page_observation_replaces(self):
+        bb = Blackboard()
+        bb.write("page_observations", "2.quality_score", 0.7, writer="agent")
+        obs = PageObservation(rotation=90.0)
+        bb.write("page_observations", "2", obs, writer="agent")
+        assert bb.page_observations[2] is obs
+
     def test_write_step_output(self):
         bb = Blackboard()
         bb.write("step_outputs", "extract", "# Title\nContent", writer="agent")
@@ -80,6 +95,52 @@ class TestBlackboardSubscribe:
         assert bb.document_metadata.language == "fr"  # Unchanged
 
 
+class TestBlackboardWriteMany:
+    def test_matches_individual_writes(self):
+        items = {"3.quality_score": 0.4, "3.rotation": 90.0, "4.table_count": 2}
+        one_by_one = Blackboard()
+        for key, value in items.items():
+            one_by_one.write("page_observations", key, value, writer="agent")
+        batched = Blackboard()
+        batched.write_many("page_observations", items, writer="agent")
+        assert batched.page_observations == one_by_one.page_observations
+
+    def test_logs_one_event_per_key(self):
+        bb = Blackboard()
+        bb.write_many("agent_notes", {"a.x": 1, "b.y": 2}, writer="agent")
+        writes = bb.event_log.query_writes()
+        assert [(e.key, e.value, e.agent_name) for e in writes] == [
+            ("a.x", 1, "agent"),
+            ("b.y", 2, "agent"),
+        ]
+
+    def test_refreshes_context_and_unshares(self):
+        bb = Blackboard()
+        bb.to_jinja_context(["document_metadata"])
+        copy = bb.copy()
+        copy.write_many("document_metadata", {"language": "fr"}, writer="agent")
+        assert copy.to_jinja_context(["document_metadata"])["document_metadata"]["language"] == "fr"
+        assert bb.document_metadata.language is None
+
+    def test_invalid_region_raises(self):
+        with pytest.raises(ValueError, match="Invalid blackboard region"):
+            Blackboard().write_many("nonexistent", {"k": 1})
+
+
+class TestBlackboardEventRecording:
+    def test_record_events_disabled(self):
+        bb = Blackboard(record_events=False)
+        bb.write("step_outputs", "extract", "text", writer="agent")
+        assert bb.read("step_outputs", "extract") == "text"
+        assert len(bb.event_log) == 0
+
+    def test_copy_inherits_event_settings(self):
+        bb = Blackboard(record_events=False, max_events=10)
+        copy = bb.copy()
+        assert copy.event_log.enabled is False
+        assert copy.event_log.max_events == 10
+
+
 class TestBlackboardSnapshot:
     def test_snapshot_contains_all_regions(self):
         bb = Blackboard()
@@ -113,6 +174,45 @@ class TestBlackboardCopy:
         assert bb.document_metadata.language == "en"
         assert copy.document_metadata.language == "fr"
 
+    def test_copy_nested_notes_are_independent(self):
+        bb = Blackboard()
+        bb.write("agent_notes", "a", {"items": [1, 2]}, writer="agent")
+        copy = bb.copy()
+        copy.agent_notes["a"]["items"].append(3)
+        assert bb.agent_notes["a"]["items"] == [1, 2]
+
+    def test_copy_shares_stores_until_write(self):
+        bb = Blackboard()
+        bb.write("page_observations", "1.quality_score", 0.9, writer="agent")
+        copy = bb.copy()
+        assert copy.shares_region(bb, "page_observations")
+        copy.to_jinja_context(["page_observations"])
+        assert copy.shares_region(bb, "page_observations")
+
+        copy.write("page_observations", "1.quality_score", 0.2, writer="agent")
+        assert not copy.shares_region(bb, "page_observations")
+        assert bb.page_observations[1].quality_score == 0.9
+        assert copy.page_observations[1].quality_score == 0.2
+        assert copy.shares_region(bb, "step_outputs")
+
+    def test_in_place_mutation_of_copy_does_not_leak(self):
+        bb = Blackboard()
+        bb.write("page_observations", "1.quality_score", 0.9, writer="agent")
+        bb.write("step_outputs", "extract", "text", writer="agent")
+        copy = bb.copy()
+        copy.page_observations[1].quality_score = 0.1
+        copy.step_outputs["extract"] = "changed"
+        bb.query("agent_notes", lambda v: True)
+        assert bb.page_observations[1].quality_score == 0.9
+        assert bb.step_outputs["extract"] == "text"
+
+    def test_original_write_does_not_leak_into_copy(self):
+        bb = Blackboard()
+        bb.write("agent_notes", "a.x", 1, writer="agent")
+        copy = bb.copy()
+        bb.write("agent_notes", "a.x", 2, writer="agent")
+        assert copy.read("agent_notes", "a.x") == 1
+
     def test_copy_has_own_event_log(self):
         bb = Blackboard()
         bb.write("document_metadata", "language", "en", writer="agent")
@@ -133,6 +233,16 @@ class TestBlackboardQuery:
         )
         assert len(low_quality) == 1
 
+    def test_query_sees_replaced_store(self):
+        bb = Blackboard()
+        bb.step_outputs = {"extract": "text"}
+        assert bb.query("step_outputs", lambda v: True) == ["text"]
+
+    def test_query_invalid_region_raises(self):
+        bb = Blackboard()
+        with pytest.raises(ValueError, match="Invalid blackboard region"):
+            bb.query("nonexistent", lambda v: True)
+
 
 class TestBlackboardJinjaContext:
     def test_to_jinja_context(self):
@@ -140,3 +250,83 @@ class TestBlackboardJinjaContext:
         bb.write("document_metadata", "language", "fr", writer="agent")
         ctx = bb.to_jinja_context(["document_metadata.language"])
         assert ctx["document_metadata"]["language"] == "fr"
+
+    def test_context_reflects_later_writes(self):
+        bb = Blackboard()
+        bb.write("document_metadata", "language", "fr", writer="agent")
+        assert bb.to_jinja_context(["document_metadata"])["document_metadata"]["language"] == "fr"
+        bb.write("document_metadata", "language", "de", writer="agent")
+        assert bb.to_jinja_context(["document_metadata"])["document_metadata"]["language"] == "de"
+
+    def test_context_reflects_in_place_mutation(self):
+        bb = Blackboard()
+        assert bb.to_jinja_context(["agent_notes"])["agent_notes"] == {}
+        bb.agent_notes["a"] = {"note": 1}
+        bb.step_outputs["s"] = "x"
+        ctx = bb.to_jinja_context(["agent_notes", "step_outputs"])
+        assert ctx["agent_notes"] == {"a": {"note": 1}}
+        assert ctx["step_outputs"] == {"s": "x"}
+
+    def test_context_mutation_does_not_leak(self):
+        bb = Blackboard()
+        bb.write("document_metadata", "language", "fr", writer="agent")
+        ctx = bb.to_jinja_context(["document_metadata"])
+        ctx["document_metadata"]["language"] = "xx"
+        again = bb.to_jinja_context(["document_metadata"])
+        assert again["document_metadata"]["language"] == "fr"
+
+
+class TestBlackboardHashInto:
+    @staticmethod
+    def _digest(bb, regions):
+        h = hashlib.sha256()
+        bb.hash_into(regions, h)
+        return h.hexdigest()
+
+    def test_subscription_order_independent(self):
+        bb = Blackboard()
+        bb.write("document_metadata", "language", "fr", writer="agent")
+        bb.write("agent_notes", "a.b", 1, writer="agent")
+        assert self._digest(bb, ["document_metadata", "agent_notes"]) == self._digest(
+            bb, ["agent_notes.a", "document_metadata"]
+        )
+
+    def test_reflects_in_place_mutation(self):
+        bb = Blackboard()
+        before = self._digest(bb, ["agent_notes"])
+        bb.agent_notes["a"] = {"note": 1}
+        assert self._digest(bb, ["agent_notes"]) != before
+
+    def test_reflects_writes(self):
+        bb = Blackboard()
+        bb.write("document_metadata", "language", "fr", writer="agent")
+        before = self._digest(bb, ["document_metadata"])
+        bb.write("document_metadata", "language", "de", writer="agent")
+        assert self._digest(bb, ["document_metadata"]) != before
+
+    def test_ignores_unsubscribed_regions(self):
+        bb = Blackboard()
+        before = self._digest(bb, ["document_metadata"])
+        bb.write("agent_notes", "a.b", 1, writer="agent")
+        assert self._digest(bb, ["document_metadata"]) == before
+
+    def test_invalid_region_raises(self):
+        with pytest.raises(ValueError, match="Invalid blackboard region"):
+            self._digest(Blackboard(), ["nonexistent"])
+
+    def test_unchanged_region_digest_reused(self):
+        bb = Blackboard()
+        bb.write("document_metadata", "language", "fr", writer="agent")
+        self._digest(bb, ["document_metadata", "agent_notes"])
+        cached = bb._digests["document_metadata"]
+        bb.write("agent_notes", "a.b", 1, writer="agent")
+        assert "agent_notes" not in bb._digests
+        self._digest(bb, ["document_metadata", "agent_notes"])
+        assert bb._digests["document_metadata"] is cached
+
+    def test_mark_dirty_refreshes_digest(self):
+        bb = Blackboard()
+        before = self._digest(bb, ["step_outputs"])
+        bb.step_outputs["s"] = "x"
+        bb.mark_dirty("step_outputs")
+        assert self._digest(bb, ["step_outputs"]) != before
@@ -1,5 +1,9 @@
 """Tests for blackboard event log."""
 
+import dataclasses
+
+import pytest
+
 from doc2md.blackboard.events import BlackboardEvent, EventLog, EventType
 
 
@@ -24,6 +28,11 @@ class TestBlackboardEvent:
         )
         assert event.value is None
 
+    def test_event_is_immutable(self):
+        event = BlackboardEvent(event_type=EventType.READ, region="r", key="k")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            event.key = "other"
+
 
 class TestEventLog:
     def test_append_and_len(self):
@@ -32,13 +41,29 @@ class TestEventLog:
         log.append(BlackboardEvent(event_type=EventType.WRITE, region="r", key="k", agent_name="a"))
         assert len(log) == 1
 
-    def test_events_returns_copy(self):
+    def test_events_is_read_only_view(self):
         log = EventLog()
         log.append(BlackboardEvent(event_type=EventType.WRITE, region="r", key="k", agent_name="a"))
         events = log.events
-        events.clear()
+        assert not hasattr(events, "clear")
+        assert not hasattr(events, "append")
+        snapshot = list(events)
+        snapshot.clear()
         assert len(log) == 1  # Original unaffected
 
+    def test_events_view_indexing(self):
+        log = EventLog(max_events=2)
+        for key in ("a", "b", "c"):
+            log.append_raw(EventType.READ, "r", key)
+        events = log.events
+        assert events[0].key == "b"
+        assert events[-1].key == "c"
+        assert [e.key for e in events[:1]] == ["b"]
+        with pytest.raises(IndexError):
+            events[2]
+        log.append_raw(EventType.READ, "r", "d")
+        assert [e.key for e in events] == ["c", "d"]  # Live view
+
     def test_query_by_agent(self):
         log = EventLog()
         log.append(
@@ -71,3 +96,50 @@ class TestEventLog:
         log.append(BlackboardEvent(event_type=EventType.READ, region="r", key="k", agent_name="b"))
         assert len(log.query_writes()) == 1
         assert len(log.query_reads()) == 1
+
+    def test_append_raw_materializes_events(self):
+        log = EventLog()
+        log.append_raw(EventType.WRITE, "step_outputs", "extract", "# Title", "agent_a")
+        (event,) = log.events
+        assert isinstance(event, BlackboardEvent)
+        assert event.event_type == EventType.WRITE
+        assert event.value == "# Title"
+        assert event.agent_name == "agent_a"
+        assert event.timestamp > 0
+
+    def test_append_keeps_event_timestamp(self):
+        log = EventLog()
+        log.append(BlackboardEvent(timestamp=1.5, event_type=EventType.READ, region="r", key="k"))
+        assert log.events[0].timestamp == 1.5
+
+    def test_max_events_keeps_most_recent(self):
+        log = EventLog(max_events=2)
+        for key in ("a", "b", "c"):
+            log.append_raw(EventType.READ, "r", key)
+        assert [e.key for e in log.events] == ["b", "c"]
+
+    def test_disabled_log_records_nothing(self):
+        log = EventLog(enabled=False)
+        log.append_raw(EventType.WRITE, "r", "k", 1)
+        log.append(BlackboardEvent(event_type=EventType.READ, region="r", key="k"))
+        assert len(log) == 0
+
+    def test_queries_preserve_append_order(self):
+        log = EventLog()
+        for i in range(5):
+            log.append_raw(
+                EventType.WRITE if i % 2 else EventType.READ, f"r{i % 2}", str(i), i, "a"
+            )
+        assert [e.key for e in log.query_by_region("r1")] == ["1", "3"]
+        assert [e.key for e in log.query_reads()] == ["0", "2", "4"]
+        assert [e.key for e in log.query_by_agent("a")] == ["0", "1", "2", "3", "4"]
+
+    def test_ring_buffer_queries_only_see_retained_events(self):
+        log = EventLog(max_events=3)
+        for i in range(10):
+            log.append_raw(EventType.WRITE, "r", str(i), agent_name=f"agent_{i % 2}")
+        assert len(log) == 3
+        assert [e.key for e in log.events] == ["7", "8", "9"]
+        assert [e.key for e in log.query_by_agent("agent_0")] == ["8"]
+        assert [e.key for e in log.query_writes()] == ["7", "8", "9"]
+        assert log.query_by_region("missing") == []
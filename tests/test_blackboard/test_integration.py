@@ -40,6 +40,7 @@ class TestBlackboardIntegration:
         )
 
         mock_vlm = AsyncMock()
+        mock_vlm.supports_binary_images = False
         mock_vlm.send_request = AsyncMock(
             return_value=_make_vlm_response(
                 "---\ntitle: Test\n---\n\n"
@@ -94,6 +95,7 @@ class TestBlackboardIntegration:
         bb = Blackboard()
 
         mock_vlm = AsyncMock()
+        mock_vlm.supports_binary_images = False
         mock_vlm.send_request = AsyncMock(
             return_value=_make_vlm_response(
                 "Content\n<blackboard>\ndocument_metadata:\n  layout: two_column\n</blackboard>"
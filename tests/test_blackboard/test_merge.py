@@ -17,6 +17,18 @@ class TestMergeParallel:
         assert target.document_metadata.language == "fr"
         assert target.document_metadata.layout == "two_column"
 
+    def test_merge_refreshes_serialized_context(self):
+        target = Blackboard()
+        target.write("document_metadata", "language", "fr", writer="pre")
+        assert "layout" not in target.to_jinja_context(["document_metadata"])["document_metadata"]
+
+        branch = target.copy()
+        branch.write("document_metadata", "layout", "two_column", writer="b")
+        merge_parallel(target, [branch])
+
+        ctx = target.to_jinja_context(["document_metadata"])
+        assert ctx["document_metadata"]["layout"] == "two_column"
+
     def test_merge_page_observations_new_pages(self):
         target = Blackboard()
         branch_a = target.copy()
@@ -41,6 +53,19 @@ class TestMergeParallel:
         assert target.page_observations[3].quality_score == 0.4
         assert target.page_observations[3].table_count == 2
 
+    def test_merge_page_observations_marks_fields_set(self):
+        target = Blackboard()
+        target.write("page_observations", "1.content_types", ["text"], writer="pre")
+        branch = target.copy()
+        branch.write("page_observations", "1.content_types", ["table"], writer="b")
+        branch.write("page_observations", "1.rotation", 90.0, writer="b")
+
+        merge_parallel(target, [branch])
+        obs = target.page_observations[1]
+        assert obs.content_types == ["text", "table"]
+        assert obs.model_dump(exclude_unset=True)["rotation"] == 90.0
+        assert {"content_types", "rotation"} <= obs.model_fields_set
+
     def test_merge_step_outputs(self):
         target = Blackboard()
         branch_a = target.copy()
@@ -79,3 +104,34 @@ class TestMergeParallel:
         branch.page_observations[1].uncertain_regions.append(UncertainRegion(area="bottom"))
         merge_parallel(target, [branch])
         assert len(target.page_observations[1].uncertain_regions) == 2
+
+    def test_merge_uncertain_regions_deduplicated(self):
+        target = Blackboard()
+        target.page_observations[1] = PageObservation(
+            uncertain_regions=[UncertainRegion(page=1, area="top", reason="blur")]
+        )
+        branch = Blackboard()
+        branch.page_observations[1] = PageObservation(
+            uncertain_regions=[
+                UncertainRegion(page=1, area="top", reason="blur"),
+                UncertainRegion(page=1, area="top", reason="glare"),
+                UncertainRegion(page=1, area="top", reason="glare"),
+            ]
+        )
+        merge_parallel(target, [branch])
+        reasons = [ur.reason for ur in target.page_observations[1].uncertain_regions]
+        assert reasons == ["blur", "glare"]
+
+    def test_merge_leaves_untouched_branches_alone(self):
+        target = Blackboard()
+        target.write("page_observations", "1.quality_score", 0.9, writer="pre")
+        branch_a = target.copy()
+        branch_b = target.copy()
+        branch_b.write("page_observations", "2.quality_score", 0.5, writer="b")
+
+        merge_parallel(target, [branch_a, branch_b])
+
+        assert target.page_observations[2].quality_score == 0.5
+        assert 2 not in branch_a.page_observations
+        target.write("page_observations", "1.quality_score", 0.1, writer="post")
+        assert branch_b.page_observations[1].quality_score == 0.9
@@ -48,3 +48,31 @@ class TestSerializeForPrompt:
         result = serialize_for_prompt(bb, ["document_metadata.language"])
         # Language is None so it won't appear
         assert result.get("document_metadata", {}).get("language") is None
+
+    def test_large_region_truncated_to_json_preview(self):
+        bb = Blackboard()
+        for i in range(200):
+            bb.write("step_outputs", f"step_{i}", "x" * 100, writer="a")
+        result = serialize_for_prompt(bb, ["step_outputs"])
+        region = result["step_outputs"]
+        assert region["_truncated"] is True
+        assert len(region["_preview"]) == 8000
+        assert region["_preview"].startswith('{"step_0": "xxx')
+
+    def test_small_region_not_truncated(self):
+        bb = Blackboard()
+        bb.write("step_outputs", "extract", "x" * 100, writer="a")
+        result = serialize_for_prompt(bb, ["step_outputs"])
+        assert result["step_outputs"] == {"extract": "x" * 100}
+
+    def test_values_shared_not_copied(self):
+        bb = Blackboard()
+        notes = {"items": [1, 2]}
+        bb.write("agent_notes", "a", notes, writer="a")
+        result = serialize_for_prompt(bb, ["agent_notes.a"])
+        assert result["agent_notes"]["a"] is bb.agent_notes["a"]
+
+    def test_unknown_region_skipped(self):
+        bb = Blackboard()
+        result = serialize_for_prompt(bb, ["nonexistent", "_event_log", "step_outputs"])
+        assert result == {"step_outputs": {}}
@@ -37,6 +37,10 @@ class TestCountTables:
         md = "| A | B |\n|---|---|\n| 1 | 2 |\n\n| X | Y |\n|---|---|\n| 3 | 4 |"
         assert count_tables(md) == 2
 
+    def test_aligned_separator_row(self):
+        md = "| A | B |\n| :-- | --: |\n| 1 | 2 |"
+        assert count_tables(md) == 1
+
 
 class TestWriterRegistry:
     def test_writers_registered(self):
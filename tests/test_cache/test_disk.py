@@ -1,7 +1,11 @@
 """Tests for SQLite disk cache."""
 
+import sqlite3
+import threading
 import time
 
+import pytest
+
 from doc2md.cache.disk import DiskCache
 from doc2md.cache.stats import CacheEntry
 from doc2md.types import TokenUsage
@@ -140,6 +144,42 @@ class TestDiskCache:
         finally:
             cache.close()
 
+    def test_round_trip_equals_stored_entry(self, tmp_path):
+        cache = DiskCache(db_path=tmp_path / "cache.db")
+        try:
+            entry = _entry(
+                "k1",
+                "# Doc",
+                pipeline_name="p",
+                agent_name="a",
+                blackboard_writes={"agent_notes": {"a": 1}},
+                confidence=0.8,
+                token_usage=TokenUsage(prompt_tokens=1, completion_tokens=2, total_tokens=3),
+            )
+            cache.set("k1", entry)
+            assert cache.get("k1") == entry
+        finally:
+            cache.close()
+
+    def test_empty_writes_stored_as_null(self, tmp_path):
+        cache = DiskCache(db_path=tmp_path / "cache.db")
+        try:
+            cache.set("k1", _entry("k1"))
+            raw = cache._conn.execute("SELECT blackboard_writes FROM cache").fetchone()[0]
+            assert raw is None
+            assert cache.get("k1").blackboard_writes == {}
+        finally:
+            cache.close()
+
+    def test_reads_rows_written_with_spaced_json(self, tmp_path):
+        cache = DiskCache(db_path=tmp_path / "cache.db")
+        try:
+            cache.set("k1", _entry("k1", blackboard_writes={"a": 1}))
+            cache._conn.execute("UPDATE cache SET blackboard_writes = ?", ('{"a": 2}',))
+            assert cache.get("k1").blackboard_writes == {"a": 2}
+        finally:
+            cache.close()
+
     def test_lru_eviction(self, tmp_path):
         # Very small max size to trigger eviction
         cache = DiskCache(db_path=tmp_path / "cache.db", max_size_mb=0.0001)
@@ -152,6 +192,21 @@ class TestDiskCache:
         finally:
             cache.close()
 
+    def test_lru_eviction_frees_several_entries_at_once(self, tmp_path):
+        cache = DiskCache(db_path=tmp_path / "cache.db", max_size_mb=0.001)  # ~1 KB
+        try:
+            for i in range(4):
+                cache.set(f"small{i}", _entry(f"small{i}", "a" * 200))
+            assert cache.get("small3") is not None  # most recently used
+            cache.set("big", _entry("big", "b" * 800))
+            assert cache.get("big") is not None
+            assert cache.get("small3") is not None
+            assert cache.get("small0") is None
+            assert cache.get("small1") is None
+            assert cache.get("small2") is None
+        finally:
+            cache.close()
+
     def test_persistence(self, tmp_path):
         db_path = tmp_path / "cache.db"
         cache1 = DiskCache(db_path=db_path)
@@ -166,3 +221,70 @@ class TestDiskCache:
             assert result.markdown == "persistent data"
         finally:
             cache2.close()
+
+    def test_use_after_close_raises(self, tmp_path):
+        cache = DiskCache(db_path=tmp_path / "cache.db")
+        cache.set("k1", _entry("k1"))
+        cache.close()
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            cache.get("k1")
+        with pytest.raises(sqlite3.ProgrammingError):
+            cache.set("k2", _entry("k2"))
+        cache.close()
+
+    def test_uses_wal_journal(self, tmp_path):
+        cache = DiskCache(db_path=tmp_path / "cache.db")
+        try:
+            mode = cache._conn.execute("PRAGMA journal_mode").fetchone()[0]
+            assert mode == "wal"
+            assert cache._conn.execute("PRAGMA cache_size").fetchone()[0] == -64_000
+        finally:
+            cache.close()
+
+    def test_lru_bump_persists_across_reopen(self, tmp_path):
+        db_path = tmp_path / "cache.db"
+        cache1 = DiskCache(db_path=db_path)
+        cache1.set("k1", _entry("k1"))
+        before = cache1._conn.execute("SELECT last_accessed FROM cache").fetchone()[0]
+        time.sleep(0.01)
+        assert cache1.get("k1") is not None
+        cache1.close()
+
+        cache2 = DiskCache(db_path=db_path)
+        try:
+            after = cache2._conn.execute("SELECT last_accessed FROM cache").fetchone()[0]
+            assert after > before
+        finally:
+            cache2.close()
+
+    def test_threads_use_own_connections(self, tmp_path):
+        cache = DiskCache(db_path=tmp_path / "cache.db")
+        cache.set("k1", _entry("k1"))
+        seen: dict[str, object] = {}
+
+        def worker(name: str) -> None:
+            seen[name] = cache._conn
+            assert cache.get("k1") is not None
+
+        threads = [threading.Thread(target=worker, args=(f"t{i}",)) for i in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        try:
+            assert len({id(conn) for conn in seen.values()} | {id(cache._conn)}) == 4
+        finally:
+            cache.close()
+        assert cache._connections == []
+
+    def test_failed_set_rolls_back(self, tmp_path):
+        cache = DiskCache(db_path=tmp_path / "cache.db")
+        try:
+            cache.set("k1", _entry("k1"))
+            with pytest.raises(sqlite3.Error), cache._transaction() as conn:
+                conn.execute("DELETE FROM cache")
+                conn.execute("SELECT * FROM missing_table")
+            assert cache.entry_count == 1
+        finally:
+            cache.close()
@@ -1,9 +1,10 @@
 """Integration test: cache with agent engine pipeline execution."""
 
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
 from doc2md.agents.engine import AgentEngine
 from doc2md.blackboard.board import Blackboard
+from doc2md.cache.keys import hash_image
 from doc2md.cache.manager import CacheManager
 from doc2md.types import AgentConfig, ModelConfig, PromptConfig, TokenUsage, VLMResponse
 
@@ -31,6 +32,7 @@ class TestCacheWithAgentEngine:
         cache_mgr = CacheManager(disk_path=tmp_path / "cache.db")
         try:
             mock_client = AsyncMock()
+            mock_client.supports_binary_images = False
             mock_client.send_request = AsyncMock(return_value=_mock_vlm_response())
             engine = AgentEngine(mock_client)
 
@@ -68,6 +70,7 @@ class TestCacheWithAgentEngine:
         cache_mgr = CacheManager(disk_path=tmp_path / "cache.db")
         try:
             mock_client = AsyncMock()
+            mock_client.supports_binary_images = False
             mock_client.send_request = AsyncMock(
                 side_effect=[_mock_vlm_response("first"), _mock_vlm_response("second")]
             )
@@ -98,6 +101,7 @@ class TestCacheWithAgentEngine:
     async def test_no_cache_manager_always_calls_vlm(self, tmp_path, sample_image_bytes):
         """Without a cache manager, every call goes to VLM."""
         mock_client = AsyncMock()
+        mock_client.supports_binary_images = False
         mock_client.send_request = AsyncMock(return_value=_mock_vlm_response())
         engine = AgentEngine(mock_client)
         config = _make_agent_config()
@@ -122,6 +126,7 @@ class TestCacheWithAgentEngine:
                 "# Output\n\n<blackboard>\npage_observations:\n  1:\n    quality_score: 0.9\n</blackboard>"
             )
             mock_client = AsyncMock()
+            mock_client.supports_binary_images = False
             mock_client.send_request = AsyncMock(return_value=response)
             engine = AgentEngine(mock_client)
             config = _make_agent_config()
@@ -157,6 +162,7 @@ class TestCacheWithAgentEngine:
         cache_mgr = CacheManager(disk_path=tmp_path / "cache.db")
         try:
             mock_client = AsyncMock()
+            mock_client.supports_binary_images = False
             mock_client.send_request = AsyncMock(return_value=_mock_vlm_response())
             engine = AgentEngine(mock_client)
             config = _make_agent_config()
@@ -183,3 +189,28 @@ class TestCacheWithAgentEngine:
             assert stats.misses == 1
         finally:
             cache_mgr.close()
+
+    async def test_image_hashed_once_across_steps(self, tmp_path, sample_image_bytes):
+        """A page shared by several steps is hashed once, including miss + store."""
+        cache_mgr = CacheManager(disk_path=tmp_path / "cache.db")
+        try:
+            mock_client = AsyncMock()
+            mock_client.supports_binary_images = False
+            mock_client.send_request = AsyncMock(return_value=_mock_vlm_response())
+            engine = AgentEngine(mock_client)
+            config = _make_agent_config()
+
+            with patch("doc2md.cache.keys.hash_image", side_effect=hash_image) as hasher:
+                for step in ("a", "b"):
+                    await engine.execute(
+                        agent_config=config,
+                        image_bytes=sample_image_bytes,
+                        cache_manager=cache_mgr,
+                        pipeline_name="p",
+                        step_name=step,
+                    )
+
+            hasher.assert_called_once()
+            assert mock_client.send_request.call_count == 2
+        finally:
+            cache_mgr.close()
@@ -1,6 +1,8 @@
 """Tests for cache key generation."""
 
-from doc2md.cache.keys import generate_cache_key, hash_image, hash_prompt
+import hashlib
+
+from doc2md.cache.keys import generate_cache_key, hash_blackboard, hash_image, hash_prompt
 
 
 class TestHashImage:
@@ -85,6 +87,21 @@ class TestGenerateCacheKey:
             **base, blackboard_snapshot=snap2
         )
 
+    def test_blackboard_hash_takes_precedence(self):
+        base = dict(
+            image_hash="abc",
+            pipeline_name="p",
+            step_name="s",
+            agent_name="a",
+            agent_version="1.0",
+            model_id="m",
+            prompt_hash="ph",
+        )
+        k1 = generate_cache_key(**base, blackboard_hash="h1")
+        k2 = generate_cache_key(**base, blackboard_snapshot={"lang": "en"}, blackboard_hash="h1")
+        assert k1 == k2
+        assert k1 != generate_cache_key(**base, blackboard_hash="h2")
+
     def test_returns_hex_string(self):
         k = generate_cache_key(
             image_hash="x",
@@ -96,3 +113,38 @@ class TestGenerateCacheKey:
             prompt_hash="ph",
         )
         assert len(k) == 64
+
+
+class TestHashBlackboard:
+    def test_streams_into_sha256(self):
+        expected = hashlib.sha256(b"region{}").hexdigest()
+        assert hash_blackboard(lambda h: (h.update(b"region"), h.update(b"{}"))) == expected
+
+
+class TestKeyStability:
+    """Keys must stay byte-compatible with entries already in the disk cache."""
+
+    def test_cache_key_matches_joined_components(self):
+        parts = ["img", "pipe", "step", "agent", "1.0", "model", "prompt", ""]
+        expected = hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+        assert generate_cache_key(*parts[:7]) == expected
+
+    def test_prompt_hash_matches_joined_prompts(self):
+        expected = hashlib.sha256("sys||usér".encode()).hexdigest()
+        assert hash_prompt("sys", "usér") == expected
+
+    def test_snapshot_hash_uses_compact_sorted_json(self):
+        base = dict(
+            image_hash="i",
+            pipeline_name="p",
+            step_name="s",
+            agent_name="a",
+            agent_version="1",
+            model_id="m",
+            prompt_hash="ph",
+        )
+        snap_hash = hashlib.sha256(b'{"a":{"x":1,"y":[1,2]},"b":"2"}').hexdigest()
+        snapshot = {"b": "2", "a": {"y": [1, 2], "x": 1}}
+        assert generate_cache_key(**base, blackboard_snapshot=snapshot) == generate_cache_key(
+            **base, blackboard_hash=snap_hash
+        )
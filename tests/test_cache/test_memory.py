@@ -109,3 +109,23 @@ class TestMemoryCache:
         cache.set("k1", _entry("k1", "second"))
         assert cache.get("k1").markdown == "second"
         assert len(cache) == 1
+
+    def test_size_tracks_evictions(self):
+        cache = MemoryCache(max_size_mb=0.001)  # ~1 KB
+        entries = [_entry(f"k{i}", "a" * 300) for i in range(6)]
+        for entry in entries:
+            cache.set(entry.key, entry)
+        remaining = [e for e in entries if cache.get(e.key) is not None]
+        assert len(cache) == len(remaining) == 3
+        assert cache.size_mb * 1024 * 1024 == sum(e.size_bytes for e in remaining)
+
+    def test_get_refreshes_recency_for_batch_eviction(self):
+        cache = MemoryCache(max_size_mb=0.001)  # ~1 KB
+        for key in ("k1", "k2", "k3"):
+            cache.set(key, _entry(key, "a" * 300))
+        cache.get("k1")
+        cache.set("big", _entry("big", "b" * 650))
+        assert cache.get("k1") is not None
+        assert cache.get("k2") is None
+        assert cache.get("k3") is None
+        assert cache.get("big") is not None
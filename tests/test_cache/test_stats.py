@@ -36,6 +36,16 @@ class TestCacheEntry:
         )
         assert entry_bb.size_bytes > entry_plain.size_bytes
 
+    def test_size_bytes_computed_for_model_construct(self):
+        built = CacheEntry(key="k1", markdown="héllo", blackboard_writes={"a": 1})
+        constructed = CacheEntry.model_construct(
+            key="k1", markdown="héllo", blackboard_writes={"a": 1}
+        )
+        assert constructed.size_bytes == built.size_bytes == 6 + len('{"a": 1}')
+
+    def test_explicit_size_bytes_kept(self):
+        assert CacheEntry(key="k1", markdown="x", size_bytes=123).size_bytes == 123
+
 
 class TestCacheStats:
     def test_defaults(self):
@@ -1,5 +1,8 @@
 """Tests for CLI commands."""
 
+import subprocess
+import sys
+
 import pytest
 from click.testing import CliRunner
 
@@ -21,6 +24,22 @@ class TestCLIGroup:
         result = runner.invoke(cli, ["--version"])
         assert result.exit_code == 0
 
+    def test_help_lists_all_commands(self, runner):
+        result = runner.invoke(cli, ["--help"])
+        for name in ("convert", "pipelines", "cache", "validate-pipeline"):
+            assert name in result.output
+
+    def test_builds_only_invoked_command(self):
+        code = (
+            "from doc2md.cli import cli; "
+            "cli(['validate-pipeline', '--help'], standalone_mode=False); "
+            "print(sorted(cli.commands))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        assert out.strip().splitlines()[-1] == "['validate-pipeline']"
+
 
 class TestConvertCommand:
     def test_help(self, runner):
@@ -98,3 +117,69 @@ class TestValidatePipelineCommand:
     def test_nonexistent_yaml(self, runner):
         result = runner.invoke(cli, ["validate-pipeline", "nonexistent.yaml"])
         assert result.exit_code != 0
+
+
+class TestImportCost:
+    def test_cli_import_defers_heavy_modules(self):
+        code = (
+            "import sys, doc2md.cli; "
+            "print(sorted(m for m in ('rich', 'doc2md.core', 'doc2md.config.hierarchy') "
+            "if m in sys.modules))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        assert out.strip() == "[]"
+
+    def test_package_exports_resolve_lazily(self):
+        import doc2md
+        from doc2md.core import Doc2Md
+
+        assert doc2md.Doc2Md is Doc2Md
+        with pytest.raises(AttributeError):
+            _ = doc2md.missing_name
+
+
+class TestConvertEventLoop:
+    def test_single_convert_and_close_share_loop(self, runner, tmp_path, loop_recording_converter):
+        image = tmp_path / "page.png"
+        image.write_bytes(b"png")
+
+        result = runner.invoke(cli, ["convert", str(image)])
+        assert result.exit_code == 0
+        assert "# converted" in result.output
+        loops = loop_recording_converter.loops
+        assert len(loops) == 2
+        assert loops[0] is loops[1]
+
+
+class TestListSupportedFiles:
+    def test_filters_and_sorts_by_name(self, tmp_path):
+        from doc2md.cli import _list_supported_files
+
+        for name in ("b.PNG", "a.pdf", "notes.txt", "pdf", ".pdf"):
+            (tmp_path / name).write_bytes(b"x")
+        (tmp_path / "dir.png").mkdir()
+        assert _list_supported_files(tmp_path) == [tmp_path / "a.pdf", tmp_path / "b.PNG"]
+
+    @pytest.mark.usefixtures("loop_recording_converter")
+    def test_batch_writes_each_result(self, runner, tmp_path):
+        for name in ("a.png", "b.png"):
+            (tmp_path / name).write_bytes(b"png")
+        out_dir = tmp_path / "out"
+
+        result = runner.invoke(cli, ["convert", str(tmp_path), "--output-dir", str(out_dir)])
+        assert result.exit_code == 0
+        assert "Converted 2 files" in result.output
+        assert (out_dir / "a.md").read_text() == "# converted"
+        assert (out_dir / "b.md").read_text() == "# converted"
+
+
+class TestWriteMarkdown:
+    def test_writes_utf8_and_truncates(self, tmp_path):
+        from doc2md.cli import _write_markdown
+
+        out = tmp_path / "out.md"
+        out.write_text("x" * 100)
+        _write_markdown(out, "# Título ✓\n")
+        assert out.read_bytes() == "# Título ✓\n".encode()
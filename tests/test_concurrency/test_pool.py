@@ -1,6 +1,9 @@
 """Tests for concurrency pool."""
 
 import asyncio
+import os
+
+import pytest
 
 from doc2md.concurrency.pool import ConcurrencyPool
 from doc2md.types import ConversionResult
@@ -48,6 +51,23 @@ class TestConcurrencyPool:
         assert results[1].markdown == ""  # Failed
         assert results[2].markdown == "# OK"
 
+    async def test_base_exception_becomes_failed_result(self):
+        class Aborted(BaseException):
+            pass
+
+        async def mock_convert(path, **kwargs):
+            if path == "bad.png":
+                raise Aborted
+            return ConversionResult(markdown=path, pages_processed=1)
+
+        pool = ConcurrencyPool(max_file_workers=1)
+        results = await asyncio.wait_for(
+            pool.process_batch(mock_convert, ["a.png", "bad.png", "c.png"]), timeout=5
+        )
+
+        assert [r.markdown for r in results] == ["a.png", "", "c.png"]
+        assert results[1].pages_failed == [0]
+
     async def test_respects_max_workers(self):
         """Should not exceed max concurrent workers."""
         concurrent = 0
@@ -94,3 +114,77 @@ class TestConcurrencyPool:
 
         assert received_kwargs["agent"] == "custom"
         assert received_kwargs["pipeline"] == "receipt"
+
+    async def test_prefetches_queued_files(self, monkeypatch):
+        import doc2md.concurrency.pool as pool_module
+
+        prefetched: list[str] = []
+        monkeypatch.setattr(pool_module, "_CAN_PREFETCH", True)
+        monkeypatch.setattr(pool_module, "_prefetch", prefetched.append)
+
+        async def mock_convert(path, **kwargs):
+            await asyncio.sleep(0.01)
+            return ConversionResult(markdown="ok", pages_processed=1)
+
+        pool = ConcurrencyPool(max_file_workers=2)
+        await pool.process_batch(mock_convert, [f"f{i}.png" for i in range(5)])
+        # The first two files start immediately; the rest are warmed ahead
+        assert sorted(prefetched) == ["f2.png", "f3.png", "f4.png"]
+
+    @pytest.mark.skipif(not hasattr(os, "posix_fadvise"), reason="needs posix_fadvise")
+    def test_prefetch_ignores_missing_file(self, tmp_path):
+        from doc2md.concurrency.pool import _prefetch
+
+        _prefetch(tmp_path / "missing.png")
+        existing = tmp_path / "page.png"
+        existing.write_bytes(b"data")
+        _prefetch(existing)
+
+    async def test_results_keep_input_order(self):
+        async def mock_convert(path, **kwargs):
+            # Earlier files finish last
+            await asyncio.sleep(0.01 * (5 - int(path[1])))
+            return ConversionResult(markdown=path, pages_processed=1)
+
+        pool = ConcurrencyPool(max_file_workers=3)
+        paths = [f"f{i}" for i in range(5)]
+        results = await pool.process_batch(mock_convert, paths)
+        assert [r.markdown for r in results] == paths
+
+    async def test_worker_tasks_bounded(self):
+        tasks_seen: set[int] = set()
+
+        async def mock_convert(path, **kwargs):
+            tasks_seen.add(id(asyncio.current_task()))
+            await asyncio.sleep(0)
+            return ConversionResult(markdown="ok", pages_processed=1)
+
+        pool = ConcurrencyPool(max_file_workers=2)
+        results = await pool.process_batch(mock_convert, [f"f{i}" for i in range(20)])
+        assert len(results) == 20
+        assert len(tasks_seen) == 2
+
+    async def test_iter_batch_yields_as_completed(self):
+        async def mock_convert(path, **kwargs):
+            await asyncio.sleep(0.01 * (3 - int(path[1])))
+            return ConversionResult(markdown=path, pages_processed=1)
+
+        pool = ConcurrencyPool(max_file_workers=3)
+        order = [index async for index, _ in pool.iter_batch(mock_convert, ["f0", "f1", "f2"])]
+        assert order == [2, 1, 0]
+
+    async def test_iter_batch_cancels_workers_when_closed_early(self):
+        started: list[str] = []
+
+        async def mock_convert(path, **kwargs):
+            started.append(path)
+            await asyncio.sleep(0.01)
+            return ConversionResult(markdown=path, pages_processed=1)
+
+        pool = ConcurrencyPool(max_file_workers=1)
+        batch = pool.iter_batch(mock_convert, [f"f{i}" for i in range(10)])
+        async for _ in batch:
+            break
+        await batch.aclose()
+        await asyncio.sleep(0.05)
+        assert len(started) < 10
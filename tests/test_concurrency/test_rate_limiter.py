@@ -1,5 +1,10 @@
 """Tests for token-bucket rate limiter."""
 
+import asyncio
+import time
+
+import pytest
+
 from doc2md.concurrency.rate_limiter import RateLimiter
 
 
@@ -40,3 +45,48 @@ class TestRateLimiter:
         initial_rpm = limiter.stats["rpm_available"]
         await limiter.acquire(estimated_tokens=100)
         assert limiter.stats["rpm_available"] < initial_rpm
+
+    async def test_waits_once_bucket_exhausted(self, monkeypatch):
+        sleeps: list[float] = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+        limiter = RateLimiter(rpm_limit=2, tpm_limit=100_000)
+        assert await limiter.acquire(estimated_tokens=1) == 0.0
+        assert await limiter.acquire(estimated_tokens=1) == 0.0
+        third = await limiter.acquire(estimated_tokens=1)
+        fourth = await limiter.acquire(estimated_tokens=1)
+        # Each extra request waits one more refill interval (30 s at 2 RPM)
+        assert third == pytest.approx(30.0, abs=0.1)
+        assert fourth == pytest.approx(60.0, abs=0.1)
+        assert sleeps == [third, fourth]
+        assert limiter.stats["total_wait_seconds"] == pytest.approx(third + fourth)
+
+    async def test_tpm_bucket_limits_large_requests(self, monkeypatch):
+        async def fake_sleep(delay):
+            return None
+
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+        limiter = RateLimiter(rpm_limit=1000, tpm_limit=600)
+        assert await limiter.acquire(estimated_tokens=600) == 0.0
+        # The bucket refills at 10 tokens/s, so 100 more tokens take 10 s
+        assert await limiter.acquire(estimated_tokens=100) == pytest.approx(10.0, abs=0.1)
+        assert limiter.stats["tpm_available"] == 0.0
+
+    async def test_acquire_reads_clock_once(self, monkeypatch):
+        import doc2md.concurrency.rate_limiter as rate_limiter_module
+
+        limiter = RateLimiter(rpm_limit=100, tpm_limit=100_000)
+        calls = 0
+        real_monotonic = time.monotonic
+
+        def counting_monotonic():
+            nonlocal calls
+            calls += 1
+            return real_monotonic()
+
+        monkeypatch.setattr(rate_limiter_module.time, "monotonic", counting_monotonic)
+        await limiter.acquire(estimated_tokens=10)
+        assert calls == 1
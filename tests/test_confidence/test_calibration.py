@@ -51,3 +51,8 @@ class TestManualCalibrate:
         curve = [[0.0, 0.0], [1.0, 0.8]]
         # At midpoint: t = 0.5, result = 0 + 0.5 * 0.8 = 0.4
         assert abs(_manual_calibrate(0.5, curve) - 0.4) < 0.001
+
+    def test_unsorted_curve_with_duplicate_raw(self):
+        curve = [[1.0, 1.0], [0.5, 0.4], [0.0, 0.0], [0.5, 0.6]]
+        assert _manual_calibrate(0.5, curve) == 0.4
+        assert _manual_calibrate(0.75, curve) == 0.8
@@ -53,6 +53,18 @@ class TestCombineSignals:
         assert effective["a"] == 1.0
         assert effective["b"] == 0.0
 
+    def test_memoized_weights_returned_as_copies(self):
+        signals = [
+            SignalResult(name="a", score=1.0, available=True),
+            SignalResult(name="b", score=0.0, available=False),
+        ]
+        weights = {"a": 0.4, "b": 0.6}
+        _, first = combine_signals(signals, weights)
+        first["a"] = 0.0
+        score, second = combine_signals(signals, weights)
+        assert second == {"a": 1.0}
+        assert score == 1.0
+
 
 class TestRedistributeWeights:
     def test_all_available(self):
@@ -66,6 +78,14 @@ class TestRedistributeWeights:
         assert abs(result["a"] - 0.333) < 0.01
         assert abs(result["c"] - 0.667) < 0.01
 
+    def test_all_available_normalized_returns_original(self):
+        weights = {"a": 0.3, "b": 0.7}
+        assert _redistribute_weights(weights, {"a", "b"}) is weights
+
+    def test_all_available_unnormalized_still_normalizes(self):
+        result = _redistribute_weights({"a": 1.0, "b": 3.0}, {"a", "b"})
+        assert result == {"a": 0.25, "b": 0.75}
+
     def test_empty_available(self):
         result = _redistribute_weights({"a": 1.0}, set())
         assert result == {}
@@ -1,5 +1,7 @@
 """Tests for the confidence engine."""
 
+import pytest
+
 from doc2md.confidence.engine import ConfidenceEngine
 from doc2md.types import (
     AgentConfig,
@@ -157,6 +159,55 @@ class TestConfidenceEngine:
         assert "vlm_self_assessment" in names
         assert "completeness_check" in names
 
+    def test_missing_inputs_skip_signal_computation(self, monkeypatch):
+        import doc2md.confidence.engine as engine_module
+
+        def fail(*args, **kwargs):
+            raise AssertionError("signal should not be computed")
+
+        for name in ("compute_logprobs", "compute_image_quality", "compute_validation_pass_rate"):
+            monkeypatch.setattr(engine_module, name, fail)
+        report = ConfidenceEngine().compute_step_confidence(
+            _make_step_result(), _make_agent_config()
+        )
+        unavailable = {s.name: s.reasoning for s in report.signals if not s.available}
+        assert unavailable["logprobs_analysis"] == "Model did not return logprobs"
+        assert unavailable["validation_pass_rate"] == "No validation rules configured"
+        assert unavailable["image_quality"] == "No image provided"
+
+    def test_reasoning_lists_available_signals(self):
+        config = _make_agent_config(
+            confidence=ConfidenceConfig(
+                signals=["vlm_self_assessment", "image_quality"],
+                weights={"vlm_self_assessment": 1.0},
+            ),
+        )
+        report = ConfidenceEngine().compute_step_confidence(_make_step_result(), config)
+        assert report.reasoning == (
+            "raw=0.900; calibrated=0.900; level=HIGH; signals: vlm_self_assessment=0.90"
+        )
+
+    def test_default_weights_are_read_only(self):
+        from doc2md.confidence.engine import _DEFAULT_WEIGHTS
+
+        with pytest.raises(TypeError):
+            _DEFAULT_WEIGHTS["image_quality"] = 1.0  # type: ignore[index]
+        report = ConfidenceEngine().compute_step_confidence(
+            _make_step_result(), _make_agent_config()
+        )
+        report.effective_weights["vlm_self_assessment"] = 0.0
+        assert _DEFAULT_WEIGHTS["vlm_self_assessment"] == 0.30
+
+    def test_configured_signals_tracks_updates_and_not_dumped(self):
+        config = ConfidenceConfig(signals=["image_quality", "image_quality"])
+        assert config.configured_signals == frozenset({"image_quality"})
+        assert "configured_signals" not in config.model_dump()
+
+        copied = config.model_copy(update={"signals": ["logprobs_analysis"]})
+        assert copied.configured_signals == frozenset({"logprobs_analysis"})
+        config.signals = []
+        assert config.configured_signals == frozenset()
+
 
 class TestPipelineAggregation:
     def test_weighted_average(self):
@@ -202,3 +253,19 @@ class TestPipelineAggregation:
         assert doc_report.overall == 0.35
         assert doc_report.level == ConfidenceLevel.LOW
         assert doc_report.needs_human_review is True
+
+    def test_reports_serialize_like_validated_models(self):
+        from doc2md.confidence.report import ConfidenceReport, StepConfidenceReport
+
+        engine = ConfidenceEngine()
+        step_reports = {
+            "s1": engine.compute_step_confidence(_make_step_result(), _make_agent_config())
+        }
+        doc_report = engine.aggregate_pipeline(step_reports)
+
+        step_dump = step_reports["s1"].model_dump()
+        assert StepConfidenceReport.model_validate(step_dump).model_dump() == step_dump
+        doc_dump = doc_report.model_dump()
+        assert ConfidenceReport.model_validate(doc_dump).model_dump() == doc_dump
+        assert doc_dump["per_page"] == {}
+        assert doc_report.per_step is not step_reports
@@ -27,6 +27,7 @@ def _mock_response(content: str = "# Title\n\nContent here [confidence: HIGH]")
 class TestConfidencePipelineIntegration:
     async def test_single_step_gets_confidence(self, sample_image_bytes):
         mock_client = AsyncMock()
+        mock_client.supports_binary_images = False
         mock_client.send_request = AsyncMock(return_value=_mock_response())
         engine = AgentEngine(mock_client)
 
@@ -58,6 +59,7 @@ class TestConfidencePipelineIntegration:
 
     async def test_confidence_signals_written_to_blackboard(self, sample_image_bytes):
         mock_client = AsyncMock()
+        mock_client.supports_binary_images = False
         mock_client.send_request = AsyncMock(return_value=_mock_response())
         engine = AgentEngine(mock_client)
 
@@ -85,6 +87,7 @@ class TestConfidencePipelineIntegration:
 
     async def test_two_step_pipeline_aggregates_confidence(self, sample_image_bytes):
         mock_client = AsyncMock()
+        mock_client.supports_binary_images = False
         mock_client.send_request = AsyncMock(return_value=_mock_response())
         engine = AgentEngine(mock_client)
 
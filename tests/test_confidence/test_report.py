@@ -1,6 +1,12 @@
 """Tests for confidence report and aggregation."""
 
+import dataclasses
+
+import pytest
+
+from doc2md.confidence.combiner import SignalResult
 from doc2md.confidence.report import (
+    StepConfidenceReport,
     aggregate_step_scores,
     needs_human_review,
     score_to_level,
@@ -25,6 +31,11 @@ class TestScoreToLevel:
         assert score_to_level(0.1) == ConfidenceLevel.FAILED
         assert score_to_level(0.0) == ConfidenceLevel.FAILED
 
+    def test_out_of_range_and_nan(self):
+        assert score_to_level(1.5) == ConfidenceLevel.HIGH
+        assert score_to_level(-1.0) == ConfidenceLevel.FAILED
+        assert score_to_level(float("nan")) == ConfidenceLevel.FAILED
+
 
 class TestNeedsHumanReview:
     def test_high_no_review(self):
@@ -63,8 +74,41 @@ class TestAggregateStepScores:
         result = aggregate_step_scores(scores, "last_step")
         assert result == 0.9
 
+    def test_weighted_average_many_steps_matches_scalar(self):
+        scores = {f"s{i}": (i % 7) / 7 for i in range(40)}
+        weights = {f"s{i}": float(i % 3) for i in range(40)}
+        expected = sum(scores[n] * weights[n] for n in scores) / sum(weights.values())
+        result = aggregate_step_scores(scores, "weighted_average", weights)
+        assert isinstance(result, float)
+        assert result == pytest.approx(expected)
+
+    def test_weighted_average_many_steps_zero_weights(self):
+        scores = {f"s{i}": i / 40 for i in range(40)}
+        result = aggregate_step_scores(scores, "weighted_average", {"other": 1.0})
+        assert result == pytest.approx(sum(scores.values()) / 40)
+
     def test_empty_scores(self):
         assert aggregate_step_scores({}, "weighted_average") == 0.0
 
     def test_single_step(self):
         assert aggregate_step_scores({"s1": 0.75}, "weighted_average") == 0.75
+
+
+class TestSignalResultInReport:
+    def test_signals_round_trip_through_report(self):
+        signal = SignalResult(name="image_quality", score=0.7, available=True)
+        report = StepConfidenceReport(step_name="s", signals=[signal])
+        assert report.signals[0] is signal
+        dumped = report.model_dump()
+        assert dumped["signals"][0] == {
+            "name": "image_quality",
+            "score": 0.7,
+            "available": True,
+            "reasoning": "",
+        }
+        restored = StepConfidenceReport.model_validate(dumped)
+        assert restored.signals[0] == signal
+
+    def test_signal_result_is_frozen(self):
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            SignalResult(name="x").score = 1.0  # type: ignore[misc]
@@ -1,5 +1,11 @@
 """Tests for individual confidence signals."""
 
+import math
+from unittest.mock import patch
+
+import pytest
+
+from doc2md.confidence.signals import validation
 from doc2md.confidence.signals.completeness import compute_completeness
 from doc2md.confidence.signals.consistency import compute_consistency
 from doc2md.confidence.signals.image_quality import compute_image_quality
@@ -64,6 +70,13 @@ class TestLogprobs:
         _, available, _ = compute_logprobs([])
         assert available is False
 
+    def test_skips_missing_logprobs(self):
+        logprobs = [{"token": "a", "logprob": None}, {"logprob": -1.0}, {"token": "b"}]
+        score, available, reasoning = compute_logprobs(logprobs)
+        assert available is True
+        assert score == pytest.approx(math.exp(-1.0))
+        assert "1 token" in reasoning
+
     def test_skips_special_tokens(self):
         logprobs = [
             {"token": "<|endoftext|>", "logprob": -10.0},
@@ -140,6 +153,19 @@ class TestCompleteness:
         score, _, _ = compute_completeness(md, ["invoice", "total"])
         assert score == 1.0
 
+    def test_overlapping_fields_and_headers(self):
+        md = "## Total Amount Due\n\nSee below."
+        score, _, reasoning = compute_completeness(md, ["total amount", "amount", "Total", "tax"])
+        assert score == 0.75
+        assert reasoning.endswith("missing: tax")
+
+    def test_fields_with_regex_metacharacters(self):
+        md = "### Amount (USD) [net]\n\n1.5*2"
+        fields = ["amount (usd) [net]", "1.5*2", "a.b"]
+        score, _, reasoning = compute_completeness(md, fields)
+        assert score == 2 / 3
+        assert reasoning.endswith("missing: a.b")
+
 
 class TestConsistency:
     def test_identical_extractions(self):
@@ -147,6 +173,15 @@ class TestConsistency:
         assert available is True
         assert score == 1.0
 
+    def test_identical_skips_tokenization(self):
+        text = "same text"
+        with patch(
+            "doc2md.confidence.signals.consistency._tokenize_hashed",
+            side_effect=AssertionError("tokenized"),
+        ):
+            assert compute_consistency(text, text) == (1.0, True, "Identical extractions")
+            assert compute_consistency("a b\n", "a b  ")[0] == 1.0
+
     def test_different_extractions(self):
         score, available, _ = compute_consistency("hello world", "goodbye moon")
         assert available is True
@@ -165,6 +200,15 @@ class TestConsistency:
         assert available is True
         assert score == 1.0
 
+    def test_partial_overlap_counts(self):
+        score, _, reasoning = compute_consistency("a b c d", "c d e")
+        assert score == 2 / 5
+        assert "(2/5 tokens)" in reasoning
+
+    def test_case_insensitive(self):
+        score, _, _ = compute_consistency("Hello WORLD", "hello world")
+        assert score == 1.0
+
 
 class TestImageQuality:
     def test_valid_image(self, sample_image_bytes):
@@ -181,3 +225,97 @@ class TestImageQuality:
         score, available, _ = compute_image_quality(b"not an image")
         # Should handle gracefully
         assert isinstance(score, float)
+
+    def test_grayscale_matches_rgb_equivalent(self):
+        import io
+
+        from PIL import Image
+
+        def encode(img):
+            buf = io.BytesIO()
+            img.save(buf, format="PNG")
+            return buf.getvalue()
+
+        gray = Image.linear_gradient("L").resize((64, 48))
+        assert compute_image_quality(encode(gray)) == compute_image_quality(
+            encode(gray.convert("RGB"))
+        )
+
+    def test_blur_matches_reference_laplacian(self):
+        import numpy as np
+
+        from doc2md.confidence.signals.image_quality import _estimate_blur
+
+        rng = np.random.default_rng(0)
+        for spread in (2, 4, 8, 255):
+            pixels = rng.integers(0, spread, size=(40, 30)).astype(np.float64)
+            reference = (
+                pixels[:-2, 1:-1]
+                + pixels[2:, 1:-1]
+                + pixels[1:-1, :-2]
+                + pixels[1:-1, 2:]
+                - 4 * pixels[1:-1, 1:-1]
+            )
+            expected = _estimate_blur(pixels)
+            assert _estimate_blur(pixels.astype(np.float32)) == expected
+            variance = float(np.var(reference))
+            assert expected == (
+                1.0
+                if variance >= 500
+                else 0.7
+                if variance >= 100
+                else 0.4
+                if variance >= 20
+                else 0.2
+            )
+
+    def test_blur_variance_handles_constant_image(self):
+        import numpy as np
+
+        from doc2md.confidence.signals.image_quality import _estimate_blur
+
+        assert _estimate_blur(np.full((10, 10), 128, dtype=np.float32)) == 0.2
+
+    def test_histogram_std_matches_numpy(self):
+        import numpy as np
+        from PIL import Image
+
+        from doc2md.confidence.signals.image_quality import _histogram_std
+
+        rng = np.random.default_rng(1)
+        pixels = rng.integers(0, 256, size=(37, 53), dtype=np.uint8)
+        gray = Image.fromarray(pixels, mode="L")
+        assert _histogram_std(gray.histogram()) == pytest.approx(float(np.std(pixels)))
+        assert _histogram_std([0] * 256) == 0.0
+
+
+class TestValidationRules:
+    def test_content_after_header(self):
+        from doc2md.confidence.signals.validation import _rule_has_content_after_header
+
+        assert _rule_has_content_after_header("# Title\n\nBody\n")
+        assert not _rule_has_content_after_header("Intro\n\n## Section\n\n")
+        assert not _rule_has_content_after_header("# Only header")
+        assert _rule_has_content_after_header("")
+        assert _rule_has_content_after_header("Text\n#hashtag")
+
+    def test_has_header_any_line(self):
+        from doc2md.confidence.signals.validation import _rule_has_header
+
+        assert _rule_has_header("intro\n### Sub\n")
+        assert not _rule_has_header("intro #notheader")
+
+    def test_builtin_rules_scan_once(self):
+        rules = [
+            ValidationRule(rule="has_header"),
+            ValidationRule(rule="no_empty_output"),
+            ValidationRule(rule="has_content_after_header"),
+        ]
+        with patch(
+            "doc2md.confidence.signals.validation._scan_all",
+            wraps=validation._scan_all,
+        ) as scan:
+            score, _, reasoning = compute_validation_pass_rate("Body\n\n# Trailing", rules)
+        assert scan.call_count == 1
+        assert score == 2 / 3
+        assert reasoning == "2/3 rules passed; failed: has_content_after_header"
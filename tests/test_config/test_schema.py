@@ -0,0 +1,17 @@
+"""Tests for pipeline configuration models."""
+
+from doc2md.config.schema import PageSelector
+
+
+class TestPageSelector:
+    def test_none_selects_all_pages(self):
+        assert PageSelector().resolve(3) == [1, 2, 3]
+
+    def test_mixed_items_sorted_and_deduplicated(self):
+        selector = PageSelector(raw=[5, "2:3", -1, 2, "4:", 99, "-2:"])
+        assert selector.resolve(6) == [2, 3, 4, 5, 6]
+
+    def test_open_and_empty_ranges(self):
+        assert PageSelector(raw=[":2"]).resolve(5) == [1, 2]
+        assert PageSelector(raw=["4:2", "0:0", -9]).resolve(5) == []
+        assert PageSelector(raw=["1:"]).resolve(0) == []
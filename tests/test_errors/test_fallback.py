@@ -59,3 +59,17 @@ class TestFallbackChain:
         # Skips b, goes to c
         next_m = chain.next_model()
         assert next_m == "c"
+
+    def test_duplicate_model_skipped_and_exhausts(self):
+        chain = FallbackChain("a", ["b", "a", "c"])
+        assert chain.next_model() == "b"
+        assert chain.next_model() == "c"
+        assert chain.exhausted is False
+        with pytest.raises(TerminalError):
+            chain.next_model()
+        assert chain.exhausted is True
+
+    def test_mark_tried_unknown_model_ignored(self):
+        chain = FallbackChain("a")
+        chain.mark_tried("zzz")
+        assert chain.exhausted is False
@@ -1,11 +1,14 @@
 """Tests for retry logic."""
 
+import os
+
 import httpx
 import openai
+import pytest
 
 from doc2md.errors.exceptions import TerminalError, TransientError
-from doc2md.errors.retry import classify_openai_error, compute_wait
-from doc2md.types import RetryStrategy
+from doc2md.errors.retry import classify_openai_error, compute_wait, retry_with_fallback
+from doc2md.types import RetryConfig, RetryStrategy
 
 
 def _mock_response(status_code: int) -> httpx.Response:
@@ -77,6 +80,24 @@ class TestClassifyOpenAIError:
         assert isinstance(err, TerminalError)
         assert err.error_type == "bad_input"
 
+    def test_subclass_and_unknown_errors(self):
+        class CustomRateLimit(openai.RateLimitError):
+            pass
+
+        err = classify_openai_error(
+            CustomRateLimit(message="slow down", response=_mock_response(429), body=None)
+        )
+        assert err.error_type == "rate_limit"
+
+        timeout = classify_openai_error(openai.APITimeoutError(request=None))
+        assert timeout.error_type == "timeout"
+
+        unknown = classify_openai_error(
+            openai.ConflictError(message="conflict", response=_mock_response(409), body=None)
+        )
+        assert isinstance(unknown, TerminalError)
+        assert unknown.error_type == "unknown"
+
 
 class TestComputeWait:
     def test_exponential_backoff(self):
@@ -107,3 +128,52 @@ class TestComputeWait:
         # With jitter, result should be >= base wait
         w = compute_wait(0, RetryStrategy.EXPONENTIAL, initial_wait=1.0, jitter=True)
         assert w >= 1.0
+
+    def test_jitter_independent_of_global_seed(self):
+        import random
+
+        random.seed(1234)
+        first = [compute_wait(2, initial_wait=1.0) for _ in range(5)]
+        random.seed(1234)
+        second = [compute_wait(2, initial_wait=1.0) for _ in range(5)]
+        assert first != second
+        assert all(4.0 <= w <= 5.0 for w in first + second)
+
+
+class TestRetryWithFallback:
+    async def test_unclassified_error_reraised_without_self_cause(self):
+        async def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom") as info:
+            await retry_with_fallback(fail, RetryConfig())
+        assert info.value.__cause__ is None
+
+    async def test_openai_terminal_error_chained_to_original(self):
+        original = openai.BadRequestError(
+            message="bad input", response=_mock_response(400), body=None
+        )
+
+        async def fail():
+            raise original
+
+        with pytest.raises(TerminalError) as info:
+            await retry_with_fallback(fail, RetryConfig())
+        assert info.value.error_type == "bad_input"
+        assert info.value.__cause__ is original
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork")
+    def test_jitter_differs_across_forked_children(self):
+        values = set()
+        for _ in range(3):
+            read_fd, write_fd = os.pipe()
+            pid = os.fork()
+            if pid == 0:
+                os.close(read_fd)
+                os.write(write_fd, repr(compute_wait(2, initial_wait=1.0)).encode())
+                os._exit(0)
+            os.close(write_fd)
+            with os.fdopen(read_fd) as reader:
+                values.add(reader.read())
+            os.waitpid(pid, 0)
+        assert len(values) == 3
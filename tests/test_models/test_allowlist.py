@@ -61,3 +61,22 @@ class TestModelAllowlist:
     def test_missing_yaml_file(self, tmp_path):
         al = ModelAllowlist(models_path=tmp_path / "nope.yaml")
         assert al.model_names == []
+
+    def test_parsed_once_until_file_changes(self, tmp_path):
+        import os
+
+        from doc2md.models.allowlist import _parse_models
+
+        yaml_path = tmp_path / "models.yaml"
+        yaml_path.write_text("models:\n  first:\n    priority: 1\n")
+        _parse_models.cache_clear()
+        a = ModelAllowlist(models_path=yaml_path)
+        b = ModelAllowlist(models_path=yaml_path)
+        assert _parse_models.cache_info().misses == 1
+        assert a.get("first") is b.get("first")
+
+        yaml_path.write_text("models:\n  second:\n    priority: 2\n")
+        stat = yaml_path.stat()
+        os.utime(yaml_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        c = ModelAllowlist(models_path=yaml_path)
+        assert c.model_names == ["second"]
@@ -55,3 +55,14 @@ class TestResolveStepInput:
         }
         inp = resolve_step_input(InputMode.PREVIOUS_OUTPUT, [], ["a", "b"], results)
         assert inp.previous_output == "Second"
+
+    def test_missing_last_dep_gives_no_previous_output(self):
+        results = {"a": _make_result("a", "First")}
+        inp = resolve_step_input(InputMode.PREVIOUS_OUTPUT, [], ["a", "b"], results)
+        assert inp.previous_output is None
+        assert inp.previous_outputs == {}
+
+    def test_step_input_is_slotted(self):
+        inp = resolve_step_input(InputMode.IMAGE, [b"img"], None, {})
+        assert not hasattr(inp, "__dict__")
+        assert inp.previous_outputs == {}
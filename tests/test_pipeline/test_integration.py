@@ -57,6 +57,7 @@ pipeline:
 
         with patch.object(converter, "_get_vlm_client") as mock_get:
             mock_client = AsyncMock()
+            mock_client.supports_binary_images = False
             mock_client.send_request = AsyncMock(return_value=mock_response)
             mock_get.return_value = mock_client
 
@@ -80,6 +81,7 @@ pipeline:
 
         with patch.object(converter, "_get_vlm_client") as mock_get:
             mock_client = AsyncMock()
+            mock_client.supports_binary_images = False
             mock_client.send_request = AsyncMock(return_value=mock_response)
             mock_get.return_value = mock_client
 
@@ -87,3 +89,194 @@ pipeline:
 
         assert result.classified_as == "generic"
         assert "# Output" in result.markdown
+
+
+class TestSyncWrappers:
+    def test_convert_closes_on_conversion_loop(self, loop_recording_converter, tmp_path):
+        import doc2md.core
+
+        result = doc2md.core.convert(tmp_path / "page.png")
+        assert result.markdown == "# converted"
+        loops = loop_recording_converter.loops
+        assert len(loops) == 2
+        assert loops[0] is loops[1]
+
+    def test_convert_batch_closes_on_conversion_loop(self, loop_recording_converter, tmp_path):
+        import doc2md.core
+
+        results = doc2md.core.convert_batch([tmp_path / "a.png", tmp_path / "b.png"])
+        assert [r.markdown for r in results] == ["# converted", "# converted"]
+        loops = loop_recording_converter.loops
+        assert len(loops) == 3
+        assert len({id(loop) for loop in loops}) == 1
+
+
+class TestModelOverrideResolution:
+    def test_override_copy_reused_across_resolutions(self):
+        converter = Doc2Md(api_key="test-key", no_cache=True)
+        original = converter.agent_registry.get("generic")
+
+        _, first = converter._resolve_agent("generic", "gpt-4.1-nano")
+        _, second = converter._resolve_agent("generic", "gpt-4.1-nano")
+        assert first["generic"] is second["generic"]
+        assert first["generic"].model.preferred == "gpt-4.1-nano"
+        assert original.model.preferred != "gpt-4.1-nano"
+
+        _, other = converter._resolve_agent("generic", "gpt-4.1-mini")
+        assert other["generic"].model.preferred == "gpt-4.1-mini"
+
+    def test_override_copies_only_model_config(self):
+        converter = Doc2Md(api_key="test-key", no_cache=True)
+        original = converter.agent_registry.get("generic")
+
+        _, resolved = converter._resolve_agent("generic", "gpt-4.1-nano")
+        override = resolved["generic"]
+        assert override.model is not original.model
+        assert override.model.max_tokens == original.model.max_tokens
+        assert override.prompt is original.prompt
+        assert override.model_dump(exclude={"model"}) == original.model_dump(exclude={"model"})
+
+    def test_reregistered_agent_is_copied_again(self):
+        converter = Doc2Md(api_key="test-key", no_cache=True)
+        _, before = converter._resolve_agent("generic", "gpt-4.1-nano")
+
+        replacement = converter.agent_registry.get("generic").model_copy(
+            update={"description": "replaced"}
+        )
+        converter.agent_registry.register(replacement)
+        _, after = converter._resolve_agent("generic", "gpt-4.1-nano")
+        assert after["generic"] is not before["generic"]
+        assert after["generic"].description == "replaced"
+
+
+def _write_pdf(path, pages):
+    import pymupdf
+
+    doc = pymupdf.open()
+    for i in range(pages):
+        doc.new_page(width=120, height=80).insert_text((10, 40), f"page {i + 1}")
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+class TestLoadPages:
+    async def test_large_pdf_rendered_in_page_order(self, tmp_path):
+        from doc2md.utils.image import pdf_to_images
+
+        pdf = _write_pdf(tmp_path / "doc.pdf", 11)
+        converter = Doc2Md(api_key="test-key", no_cache=True)
+        try:
+            pages = await converter._load_pages(pdf)
+            assert converter._render_pool is not None
+        finally:
+            await converter.close()
+        assert pages == pdf_to_images(pdf)
+        assert converter._render_pool is None
+
+    async def test_small_pdf_stays_in_process(self, tmp_path):
+        pdf = _write_pdf(tmp_path / "doc.pdf", 2)
+        converter = Doc2Md(api_key="test-key", no_cache=True)
+        pages = await converter._load_pages(pdf)
+        assert len(pages) == 2
+        assert converter._render_pool is None
+        await converter.close()
+
+    async def test_loading_does_not_block_event_loop(self, tmp_path, monkeypatch):
+        import asyncio
+        import threading
+
+        import doc2md.core
+
+        release = threading.Event()
+        loop_thread = threading.get_ident()
+
+        def slow_load(path):
+            assert threading.get_ident() != loop_thread
+            assert release.wait(timeout=5)
+            return b"png"
+
+        monkeypatch.setattr(doc2md.core, "load_image", slow_load)
+        converter = Doc2Md(api_key="test-key", no_cache=True)
+        task = asyncio.create_task(converter._load_pages(tmp_path / "page.png"))
+        await asyncio.sleep(0.01)
+        assert not task.done()
+        release.set()
+        assert await task == [b"png"]
+        await converter.close()
+
+
+class TestBatchedClassification:
+    async def test_concurrent_conversions_share_one_classification_call(
+        self, tmp_path, sample_image_bytes
+    ):
+        import asyncio
+        import json
+
+        paths = []
+        for name in ("a.png", "b.png"):
+            path = tmp_path / name
+            path.write_bytes(sample_image_bytes)
+            paths.append(path)
+
+        converter = Doc2Md(api_key="test-key", no_cache=True, batch_classification=True)
+        labels = [{"pipeline_name": "generic", "confidence": 0.9}] * 2
+        mock_client = AsyncMock()
+        mock_client.supports_binary_images = False
+        mock_client.send_batch_request = AsyncMock(
+            return_value=VLMResponse(content=json.dumps(labels), model="gpt-4.1-nano")
+        )
+        mock_client.send_request = AsyncMock(
+            return_value=VLMResponse(
+                content="# Output",
+                model="gpt-4.1-mini",
+                token_usage=TokenUsage(prompt_tokens=5, completion_tokens=5, total_tokens=10),
+            )
+        )
+
+        with patch.object(converter, "_get_vlm_client", return_value=mock_client):
+            results = await asyncio.gather(*(converter.convert_async(p) for p in paths))
+        await converter.close()
+
+        assert mock_client.send_batch_request.await_count == 1
+        assert [r.classified_as for r in results] == ["generic", "generic"]
+        assert converter._classifier_batcher is None
+
+
+class TestCollectAgentNames:
+    def test_nested_parallel_router_and_merge(self):
+        from doc2md.config.schema import (
+            MergeConfig,
+            RouterConfig,
+            RouterRule,
+            StepConfig,
+            StepType,
+            VLMFallbackConfig,
+        )
+        from doc2md.core import _collect_agent_names
+
+        router = RouterConfig(
+            rules=[RouterRule(pages=[1], agent="cover")],
+            vlm_fallback=VLMFallbackConfig(
+                categories={"table": {"agent": "tables"}, "other": {"label": "x"}}
+            ),
+            default_agent="body",
+        )
+        inner = StepConfig(
+            name="inner",
+            type=StepType.PARALLEL,
+            steps=[
+                StepConfig(name="deep", agent="deep"),
+                StepConfig(name="route", type=StepType.PAGE_ROUTE, router=router),
+            ],
+            merge=MergeConfig(strategy="agent", agent="merger"),
+        )
+        steps = [StepConfig(name="first", agent="first"), inner]
+        assert _collect_agent_names(steps) == {
+            "first",
+            "deep",
+            "cover",
+            "tables",
+            "body",
+            "merger",
+        }
@@ -21,3 +21,10 @@ class TestBuildMessages:
         assert user_content[0]["text"] == "Describe"
         assert user_content[1]["type"] == "image_url"
         assert "abc123" in user_content[1]["image_url"]["url"]
+
+    def test_batch_message_attaches_images_in_order(self):
+        msgs = AsyncVLMClient._build_batch_messages("System", "Classify", ["aaa", "bbb"])
+        user_content = msgs[1]["content"]
+        assert user_content[0]["text"] == "Classify"
+        assert "aaa" in user_content[1]["image_url"]["url"]
+        assert "bbb" in user_content[2]["image_url"]["url"]
@@ -56,3 +56,14 @@ class TestParseResponse:
     def test_no_metadata_when_none_present(self):
         _, meta = parse_response("Just plain text.")
         assert meta == {}
+
+    def test_json_blackboard_block(self):
+        raw = '<blackboard>\n{"document_metadata": {"language": "fr"}}\n</blackboard>\nText'
+        md, meta = parse_response(raw)
+        assert meta["blackboard_writes"] == {"document_metadata": {"language": "fr"}}
+        assert md == "Text"
+
+    def test_yaml_flow_mapping_falls_back_to_yaml(self):
+        raw = "<blackboard>\n{page_observations: {3: {quality_score: 0.4}}}\n</blackboard>"
+        _, meta = parse_response(raw)
+        assert meta["blackboard_writes"]["page_observations"][3]["quality_score"] == 0.4